@@ -1 +1 @@
-"""Paper Pal Backend - AI Paper Reading Assistant."""
+"""Paper Pal Backend - AI Paper Reading Assistant."""
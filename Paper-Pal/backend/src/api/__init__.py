@@ -1,6 +1,31 @@
-"""API module for Paper Pal backend."""
-
-from .server import app, create_app
-from .routes import papers_router, chat_router, notifications_router, add_notification
-
-__all__ = ["app", "create_app", "papers_router", "chat_router", "notifications_router", "add_notification"]
+"""API module for Paper Pal backend.
+
+Exports are resolved lazily (PEP 562) so importing ``src.api`` does not
+pull in FastAPI and the Pydantic model graph until one of them is used.
+"""
+
+from importlib import import_module
+
+_EXPORTS = {
+    "app": ".server",
+    "create_app": ".server",
+    "papers_router": ".routes",
+    "chat_router": ".routes",
+    "notifications_router": ".routes",
+    "add_notification": ".routes",
+}
+
+__all__ = ["app", "create_app", "papers_router", "chat_router", "notifications_router", "add_notification"]
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,86 @@
+"""In-process cache for LLM chat completions.
+
+Quick commands and PDF chat build their prompts deterministically from the
+paper and its retrieved context, so the same question about the same paper
+produces an identical request. Caching the completion text by a hash of
+the request skips the provider round-trip on repeats.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+
+
+class LLMCache:
+    """Bounded LRU of completion texts with a per-entry TTL."""
+
+    def __init__(self, max_size: int = 1024, ttl: float = 3600.0):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached completions
+            ttl: Seconds a completion stays valid
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(model: str, messages: List[Dict[str, Any]], temperature: float, base_url: str) -> str:
+        """Build the exact-match key for a chat completion request.
+
+        Args:
+            model: Model name
+            messages: Chat messages sent to the provider
+            temperature: Sampling temperature
+            base_url: Provider endpoint, so the same model name served by
+                different providers does not share answers
+
+        Returns:
+            Hex SHA-256 digest of the canonical request
+        """
+        payload = orjson.dumps(
+            {"base_url": base_url, "model": model, "messages": messages, "temperature": temperature},
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached completion for a key, or None if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: str, content: str) -> None:
+        """Cache a completion, evicting the least recently used entry if full."""
+        self._entries[key] = (time.monotonic() + self.ttl, content)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached completions."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Global cache instance
+_llm_cache: Optional[LLMCache] = None
+
+
+def get_llm_cache() -> LLMCache:
+    """Get or create the shared LLM response cache."""
+    global _llm_cache
+    if _llm_cache is None:
+        _llm_cache = LLMCache()
+    return _llm_cache
@@ -1,187 +1,270 @@
-"""API request/response models for Paper Pal backend.
-
-Requirements: 6.1, 6.2, 7.2, 8.2
-"""
-
-from datetime import datetime
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
-
-
-# Paper models
-class PaperResponse(BaseModel):
-    """Paper data response model."""
-    id: str
-    title: str
-    abstract: str
-    authors: List[str]
-    categories: List[str]
-    published: datetime
-    source: str
-    url: str
-    relevance_score: Optional[float] = None
-    novelty_score: Optional[float] = None
-    total_score: Optional[float] = None
-    one_liner: Optional[str] = None
-    pros: Optional[List[str]] = None
-    cons: Optional[List[str]] = None
-
-
-class PaperListResponse(BaseModel):
-    """Response for paper list endpoint."""
-    papers: List[PaperResponse]
-    total: int
-
-
-class FetchPapersRequest(BaseModel):
-    """Request to fetch new papers."""
-    days: int = Field(default=1, ge=1, le=7)
-    max_results: int = Field(default=50, ge=1, le=200)
-
-
-class ScorePapersRequest(BaseModel):
-    """Request to score papers."""
-    paper_ids: Optional[List[str]] = None
-    interests: List[str] = Field(default_factory=list)
-    threshold: float = Field(default=7.0, ge=0, le=20)
-
-
-# Chat models
-class ChatMessageRequest(BaseModel):
-    """Request to send a chat message."""
-    paper_id: str
-    message: str
-    history: List[dict] = Field(default_factory=list)
-
-
-class ChatMessageResponse(BaseModel):
-    """Response from chat endpoint."""
-    role: str = "assistant"
-    content: str
-    timestamp: datetime
-
-
-class QuickCommandRequest(BaseModel):
-    """Request for quick command execution."""
-    paper_id: str
-    command: str  # "看公式" or "看代码链接"
-
-
-# Notification models
-class NotificationResponse(BaseModel):
-    """Notification data for bubble notifier."""
-    id: str
-    paper_id: str
-    title: str
-    source: str
-    score: float
-    timestamp: datetime
-
-
-class NotificationListResponse(BaseModel):
-    """Response for notifications endpoint."""
-    notifications: List[NotificationResponse]
-
-
-# Save paper models
-class SavePaperRequest(BaseModel):
-    """Request to save a paper for later."""
-    paper_id: str
-    user_id: str = "default"
-
-
-class SavePaperResponse(BaseModel):
-    """Response for save paper endpoint."""
-    success: bool
-    message: str
-
-
-class SavedPaperResponse(BaseModel):
-    """Single saved paper response."""
-    paper_id: str
-    saved_at: datetime
-    paper: Optional[PaperResponse] = None
-
-
-class SavedPapersListResponse(BaseModel):
-    """Response for saved papers list endpoint."""
-    saved_papers: List[SavedPaperResponse]
-    total: int
-
-
-class GetSavedPapersRequest(BaseModel):
-    """Request to get saved papers."""
-    user_id: str = "default"
-    limit: int = Field(default=50, ge=1, le=200)
-    offset: int = Field(default=0, ge=0)
-
-
-# PDF processing models
-class PDFProcessingRequest(BaseModel):
-    """Request to start PDF processing."""
-    paper_id: str
-    pdf_url: str
-
-
-class PDFProcessingResponse(BaseModel):
-    """Response for PDF processing request."""
-    success: bool
-    message: str
-    chunks_count: Optional[int] = None
-
-
-class PDFStatusResponse(BaseModel):
-    """Response for PDF processing status."""
-    paper_id: str
-    is_downloading: bool
-    is_processing: bool
-    is_complete: bool
-    progress: float  # 0.0 to 1.0
-    error_message: Optional[str] = None
-    total_chunks: int
-    processed_chunks: int
-    pdf_processed: bool
-    has_context: bool
-
-
-# Enhanced chat models for RAG
-class RAGChatMessageRequest(BaseModel):
-    """Request for RAG-based chat message."""
-    paper_id: str
-    message: str
-    history: List[Dict[str, Any]] = Field(default_factory=list)
-    use_pdf_context: bool = True
-    max_context_tokens: int = Field(default=3000, ge=1000, le=8000)
-
-
-class PDFSearchRequest(BaseModel):
-    """Request for PDF content search."""
-    paper_id: str
-    query: str
-    search_type: str = Field(default="semantic", pattern="^(semantic|keyword)$")
-    top_k: int = Field(default=5, ge=1, le=20)
-
-
-class PDFSearchResult(BaseModel):
-    """Single PDF search result."""
-    chunk_id: str
-    content: str
-    page_number: int
-    relevance_score: float
-
-
-class PDFSearchResponse(BaseModel):
-    """Response for PDF search endpoint."""
-    paper_id: str
-    query: str
-    search_type: str
-    results: List[PDFSearchResult]
-    total_results: int
-
-
-class PDFChatRequest(BaseModel):
-    """Request for PDF-based chat."""
-    paper_id: str
-    message: str
-    history: List[Dict[str, Any]] = Field(default_factory=list)
-    max_context_tokens: int = Field(default=3000, ge=1000, le=8000)
+"""API request/response models for Paper Pal backend.
+
+Models that only document msgspec-encoded endpoints (see models_fast.py)
+use defer_build=True, so their core schemas are built on first use
+(OpenAPI generation or VALIDATE_API_RESPONSE) instead of at import.
+
+Requirements: 6.1, 6.2, 7.2, 8.2
+"""
+
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Annotated, Any, List, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+
+def _from_epoch_ms(value: int) -> datetime:
+    """Convert Unix epoch milliseconds to an aware UTC datetime."""
+    return datetime.fromtimestamp(value / 1000, tz=timezone.utc)
+
+
+class _EpochMsSchema:
+    """Core schema marker: datetime that also validates from epoch ms ints.
+
+    Integers take a dedicated int branch straight to datetime; everything
+    else goes through pydantic-core's datetime validator. Serialization is
+    the regular ISO 8601 datetime output.
+    """
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        return core_schema.union_schema(
+            [
+                core_schema.no_info_after_validator_function(_from_epoch_ms, core_schema.int_schema(strict=True)),
+                core_schema.datetime_schema(microseconds_precision="truncate"),
+            ]
+        )
+
+
+# Datetime that also validates from epoch milliseconds. Output stays ISO 8601,
+# which is what the frontend types (src/api/types.ts) expect.
+EpochMs = Annotated[datetime, _EpochMsSchema]
+
+
+# Paper models
+class PaperResponse(BaseModel):
+    """Paper data response model."""
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
+
+    id: str
+    title: str
+    abstract: str
+    authors: List[str]
+    categories: List[str]
+    published: EpochMs
+    source: str
+    url: str
+    relevance_score: Optional[float] = None
+    novelty_score: Optional[float] = None
+    total_score: Optional[float] = None
+    one_liner: Optional[str] = None
+    pros: Optional[List[str]] = None
+    cons: Optional[List[str]] = None
+
+
+class PaperListResponse(BaseModel):
+    """Response for paper list endpoint."""
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
+
+    papers: List[PaperResponse]
+    total: int
+    next_cursor: Optional[str] = None
+
+
+class FetchPapersRequest(BaseModel):
+    """Request to fetch new papers."""
+    model_config = ConfigDict(extra="forbid")
+
+    days: int = Field(default=1, ge=1, le=7)
+    max_results: int = Field(default=50, ge=1, le=200)
+
+
+class ScorePapersRequest(BaseModel):
+    """Request to score papers."""
+    # Strict, unconstrained list[str]: pydantic-core validates it in one pass
+    # without lax-mode coercion checks on each id
+    paper_ids: Optional[List[str]] = Field(default=None, strict=True)
+    interests: List[str] = Field(default_factory=list)
+    threshold: float = Field(default=7.0, ge=0, le=20)
+
+
+# Chat models
+class ChatTurn(BaseModel):
+    """Single message in a chat history."""
+    model_config = ConfigDict(extra="ignore")
+
+    role: Literal["user", "assistant", "system"] = "user"
+    content: str = ""
+
+
+class ChatMessageRequest(BaseModel):
+    """Request to send a chat message."""
+    paper_id: str
+    message: str
+    history: List[ChatTurn] = Field(default_factory=list)
+
+
+class ChatMessageResponse(BaseModel):
+    """Response from chat endpoint."""
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
+
+    role: Literal["assistant", "user", "system"] = "assistant"
+    content: str
+    timestamp: EpochMs
+
+
+class QuickCommandRequest(BaseModel):
+    """Request for quick command execution."""
+    paper_id: str
+    command: Literal["看公式", "看代码链接"]
+
+
+# Notification models
+class NotificationResponse(BaseModel):
+    """Notification data for bubble notifier."""
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
+
+    id: str
+    paper_id: str
+    title: str
+    source: str
+    score: float
+    timestamp: EpochMs
+
+
+class NotificationListResponse(BaseModel):
+    """Response for notifications endpoint."""
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
+
+    notifications: List[NotificationResponse]
+
+
+# Save paper models
+class SavePaperRequest(BaseModel):
+    """Request to save a paper for later."""
+    paper_id: str
+    user_id: str = "default"
+
+
+class SavePaperResponse(BaseModel):
+    """Response for save paper endpoint."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    success: bool
+    message: str
+
+
+class SavedPaperResponse(BaseModel):
+    """Single saved paper response."""
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
+
+    paper_id: str
+    saved_at: EpochMs
+    paper: Optional[PaperResponse] = None
+
+
+class SavedPapersListResponse(BaseModel):
+    """Response for saved papers list endpoint."""
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
+
+    saved_papers: List[SavedPaperResponse]
+    total: int
+    next_cursor: Optional[str] = None
+
+
+class GetSavedPapersRequest(BaseModel):
+    """Request to get saved papers."""
+    model_config = ConfigDict(defer_build=True)
+
+    user_id: str = "default"
+    limit: int = Field(default=50, ge=1, le=200)
+    offset: int = Field(default=0, ge=0)
+
+
+# PDF processing models
+class PDFProcessingRequest(BaseModel):
+    """Request to start PDF processing."""
+    paper_id: str
+    pdf_url: str
+
+
+class PDFProcessingResponse(BaseModel):
+    """Response for PDF processing request."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    success: bool
+    message: str
+    chunks_count: Optional[int] = None
+
+
+class PDFStatusResponse(BaseModel):
+    """Response for PDF processing status."""
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    paper_id: str
+    is_downloading: bool
+    is_processing: bool
+    is_complete: bool
+    progress: float  # 0.0 to 1.0
+    error_message: Optional[str] = None
+    total_chunks: int
+    processed_chunks: int
+    pdf_processed: bool
+    has_context: bool
+
+
+# Enhanced chat models for RAG
+class RAGChatMessageRequest(BaseModel):
+    """Request for RAG-based chat message."""
+    model_config = ConfigDict(defer_build=True)
+
+    paper_id: str
+    message: str
+    history: List[ChatTurn] = Field(default_factory=list)
+    use_pdf_context: bool = True
+    max_context_tokens: int = Field(default=3000, ge=1000, le=8000)
+
+
+class SearchType(str, Enum):
+    """PDF search mode."""
+    SEMANTIC = "semantic"
+    KEYWORD = "keyword"
+
+
+class PDFSearchRequest(BaseModel):
+    """Request for PDF content search."""
+    paper_id: str
+    query: str
+    search_type: SearchType = SearchType.SEMANTIC
+    top_k: int = Field(default=5, ge=1, le=20)
+
+
+class PDFSearchResult(BaseModel):
+    """Single PDF search result."""
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
+
+    chunk_id: str
+    content: str
+    page_number: int
+    relevance_score: float
+
+
+class PDFSearchResponse(BaseModel):
+    """Response for PDF search endpoint."""
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
+
+    paper_id: str
+    query: str
+    search_type: SearchType
+    results: List[PDFSearchResult]
+    total_results: int
+
+
+class PDFChatRequest(BaseModel):
+    """Request for PDF-based chat."""
+    paper_id: str
+    message: str
+    history: List[ChatTurn] = Field(default_factory=list)
+    max_context_tokens: int = Field(default=3000, ge=1000, le=8000)
@@ -0,0 +1,181 @@
+"""msgspec structs for hot API paths.
+
+The response structs mirror the Pydantic response models in models.py
+field-for-field and are encoded directly with msgspec, skipping FastAPI's
+response validation. FetchSpec likewise mirrors FetchPapersRequest for the
+fetch endpoint, which decodes its body without Pydantic. The Pydantic models
+remain the documented OpenAPI schema.
+"""
+
+from datetime import datetime, timezone
+from typing import Annotated, List, Optional
+
+import msgspec
+
+
+# Paper structs
+class PaperResponse(msgspec.Struct, gc=False):
+    """Paper data response struct."""
+    id: str
+    title: str
+    abstract: str
+    authors: List[str]
+    categories: List[str]
+    published: datetime
+    source: str
+    url: str
+    relevance_score: Optional[float] = None
+    novelty_score: Optional[float] = None
+    total_score: Optional[float] = None
+    one_liner: Optional[str] = None
+    pros: Optional[List[str]] = None
+    cons: Optional[List[str]] = None
+
+
+class PaperListResponse(msgspec.Struct, gc=False):
+    """Response for paper list endpoint."""
+    papers: List[PaperResponse]
+    total: int
+    next_cursor: Optional[str] = None
+
+
+# Built once so list conversions reuse msgspec's cached type info
+PAPER_LIST_TYPE = List[PaperResponse]
+
+
+# Fallbacks for keys older storage rows may lack
+_ROW_DEFAULTS = {
+    "title": "",
+    "abstract": "",
+    "authors": [],
+    "categories": [],
+    "source": "arxiv",
+    "url": "",
+}
+
+
+def _normalise_row(row: dict, now: datetime) -> dict:
+    return {
+        **_ROW_DEFAULTS,
+        **row,
+        "id": row.get("arxiv_id") or row.get("id") or "",
+        "published": row.get("published") or now,
+    }
+
+
+def paper_from_row(row: dict) -> PaperResponse:
+    """Convert a single JSON storage row to a PaperResponse struct.
+
+    Args:
+        row: Paper dict as returned by JsonStorage
+
+    Returns:
+        PaperResponse struct
+    """
+    return msgspec.convert(
+        _normalise_row(row, datetime.now(timezone.utc)),
+        type=PaperResponse,
+        strict=False,
+    )
+
+
+def papers_from_rows(rows: List[dict]) -> List[PaperResponse]:
+    """Convert JSON storage rows to PaperResponse structs.
+
+    Storage keys papers by ``arxiv_id`` and may leave ``published`` empty, so
+    those two keys are normalised first; the whole list is then converted in
+    a single ``msgspec.convert`` call, which parses ISO timestamps and drops
+    storage-only keys (``created_at``, ``scored_at``...) without per-row
+    Python constructor calls.
+
+    Args:
+        rows: Paper dicts as returned by JsonStorage
+
+    Returns:
+        List of PaperResponse structs
+    """
+    now = datetime.now(timezone.utc)
+    return msgspec.convert(
+        [_normalise_row(row, now) for row in rows],
+        type=PAPER_LIST_TYPE,
+        strict=False,
+    )
+
+
+# Chat structs
+class ChatMessageResponse(msgspec.Struct, kw_only=True, gc=False):
+    """Response from chat endpoint."""
+    role: str = "assistant"
+    content: str
+    timestamp: datetime
+
+
+# Notification structs
+class NotificationResponse(msgspec.Struct, gc=False):
+    """Notification data for bubble notifier."""
+    id: str
+    paper_id: str
+    title: str
+    source: str
+    score: float
+    timestamp: datetime
+
+
+class NotificationListResponse(msgspec.Struct, gc=False):
+    """Response for notifications endpoint."""
+    notifications: List[NotificationResponse]
+
+
+# Saved paper structs
+class SavedPaperResponse(msgspec.Struct, gc=False):
+    """Single saved paper response."""
+    paper_id: str
+    saved_at: datetime
+    paper: Optional[PaperResponse] = None
+
+
+class SavedPapersListResponse(msgspec.Struct, gc=False):
+    """Response for saved papers list endpoint."""
+    saved_papers: List[SavedPaperResponse]
+    total: int
+    next_cursor: Optional[str] = None
+
+
+# PDF search structs
+class PDFSearchResult(msgspec.Struct, gc=False):
+    """Single PDF search result."""
+    chunk_id: str
+    content: str
+    page_number: int
+    relevance_score: float
+
+
+class PDFSearchResponse(msgspec.Struct, gc=False):
+    """Response for PDF search endpoint."""
+    paper_id: str
+    query: str
+    search_type: str
+    results: List[PDFSearchResult]
+    total_results: int
+
+
+# Request structs
+class FetchSpec(msgspec.Struct, forbid_unknown_fields=True):
+    """Fetch request decoded straight from the body (see FetchPapersRequest)."""
+    days: Annotated[int, msgspec.Meta(ge=1, le=7)] = 1
+    max_results: Annotated[int, msgspec.Meta(ge=1, le=200)] = 50
+
+
+_fetch_spec_decoder = msgspec.json.Decoder(FetchSpec)
+
+
+def decode_fetch_spec(body: bytes) -> FetchSpec:
+    """Decode and bound-check a fetch request body.
+
+    An empty body means all defaults.
+
+    Raises:
+        msgspec.ValidationError: If a field is out of bounds or unknown
+        msgspec.DecodeError: If the body is not valid JSON
+    """
+    return _fetch_spec_decoder.decode(body or b"{}")
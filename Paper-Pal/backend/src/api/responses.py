@@ -0,0 +1,65 @@
+"""Custom response classes for Paper Pal API."""
+
+from typing import Any, Optional, Type
+
+import msgspec
+import orjson
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+from ..config import load_config
+
+
+_msgspec_encoder = msgspec.json.Encoder()
+_msgpack_encoder = msgspec.msgpack.Encoder()
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# Naive datetimes are treated as UTC, matching how the API stores timestamps
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response encoded with orjson.
+
+    Default response class for the app. Defined here rather than using
+    fastapi.responses.ORJSONResponse, which newer FastAPI releases deprecate.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+class MsgspecResponse(Response):
+    """JSON response encoded with msgspec.
+
+    Used by endpoints that return msgspec structs (see models_fast.py)
+    with ``response_model=None``. When ``VALIDATE_API_RESPONSE`` is enabled,
+    the encoded body is checked against ``schema`` so the structs cannot
+    silently drift from the documented Pydantic models.
+    """
+
+    media_type = "application/json"
+
+    def __init__(self, content: Any, schema: Optional[Type[BaseModel]] = None, **kwargs):
+        self._schema = schema
+        super().__init__(content, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        body = _msgspec_encoder.encode(content)
+        if self._schema is not None and load_config().validate_api_response:
+            self._schema.model_validate_json(body)
+        return body
+
+
+class MsgpackResponse(Response):
+    """MessagePack response encoded with msgspec.
+
+    Served instead of MsgspecResponse to non-browser clients that send
+    ``Accept: application/msgpack``; large text payloads skip JSON escaping.
+    """
+
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return _msgpack_encoder.encode(content)
@@ -1,1166 +1,1601 @@
-"""API routes for Paper Pal backend.
-
-Requirements: 6.1, 7.2, 8.2
-"""
-
-from datetime import datetime, timezone
-from typing import List, Optional
-
-from fastapi import APIRouter, HTTPException, Depends, Query
-from fastapi.responses import JSONResponse
-
-from .models import (
-    PaperResponse,
-    PaperListResponse,
-    FetchPapersRequest,
-    ScorePapersRequest,
-    ChatMessageRequest,
-    ChatMessageResponse,
-    QuickCommandRequest,
-    NotificationResponse,
-    NotificationListResponse,
-    SavePaperRequest,
-    SavePaperResponse,
-    SavedPaperResponse,
-    SavedPapersListResponse,
-    GetSavedPapersRequest,
-    PDFProcessingRequest,
-    PDFProcessingResponse,
-    PDFStatusResponse,
-    PDFSearchRequest,
-    PDFSearchResult,
-    PDFSearchResponse,
-    PDFChatRequest,
-)
-from ..models import Paper, ScoredPaper
-
-# Try to import enhanced fetcher, fallback to regular fetcher
-try:
-    from ..fetcher import EnhancedArXivFetcher
-    _ENHANCED_FETCHER_AVAILABLE = True
-except ImportError:
-    _ENHANCED_FETCHER_AVAILABLE = False
-
-try:
-    from ..fetcher import ArXivFetcher, HuggingFaceFetcher
-    _REGULAR_FETCHER_AVAILABLE = True
-except ImportError:
-    _REGULAR_FETCHER_AVAILABLE = False
-from ..scorer import LLMScorer, scored_paper_to_db_dict, store_scored_papers
-from ..db import get_json_storage
-from ..config import load_config
-from ..rag import RAGService
-
-import logging
-
-logger = logging.getLogger(__name__)
-
-# Create routers
-papers_router = APIRouter(prefix="/api/papers", tags=["papers"])
-chat_router = APIRouter(prefix="/api/chat", tags=["chat"])
-notifications_router = APIRouter(prefix="/api/notifications", tags=["notifications"])
-pdf_router = APIRouter(prefix="/api/pdf", tags=["pdf"])
-
-# Global RAG service instance
-_rag_service: Optional[RAGService] = None
-
-def get_rag_service() -> RAGService:
-    """Get or create RAG service instance."""
-    global _rag_service
-    if _rag_service is None:
-        _rag_service = RAGService()
-    return _rag_service
-
-# In-memory notification queue (for simplicity)
-_notification_queue: List[NotificationResponse] = []
-
-# In-memory paper storage (temporary solution)
-_papers_cache: List[PaperResponse] = []
-
-
-def add_notification(paper_id: str, title: str, source: str, score: float):
-    """Add a notification to the queue (called by scheduler)."""
-    global _notification_queue
-    notification = NotificationResponse(
-        id=f"notif-{paper_id}-{datetime.now(timezone.utc).timestamp()}",
-        paper_id=paper_id,
-        title=title,
-        source=source,
-        score=score,
-        timestamp=datetime.now(timezone.utc),
-    )
-    _notification_queue.append(notification)
-
-
-def get_config():
-    """Dependency to get config."""
-    return load_config()
-
-
-def paper_to_response(paper: Paper, scored: Optional[ScoredPaper] = None) -> PaperResponse:
-    """Convert Paper model to API response."""
-    if scored:
-        return PaperResponse(
-            id=paper.id,
-            title=paper.title,
-            abstract=paper.abstract,
-            authors=paper.authors,
-            categories=paper.categories,
-            published=paper.published,
-            source=paper.source,
-            url=paper.url,
-            relevance_score=scored.relevance_score,
-            novelty_score=scored.novelty_score,
-            total_score=scored.total_score,
-            one_liner=scored.one_liner,
-            pros=scored.pros,
-            cons=scored.cons,
-        )
-    return PaperResponse(
-        id=paper.id,
-        title=paper.title,
-        abstract=paper.abstract,
-        authors=paper.authors,
-        categories=paper.categories,
-        published=paper.published,
-        source=paper.source,
-        url=paper.url,
-    )
-
-
-# Papers endpoints
-@papers_router.get("/", response_model=PaperListResponse)
-async def get_papers(
-    limit: int = 50,
-    offset: int = 0,
-    min_score: Optional[float] = None,
-    config=Depends(get_config),
-):
-    """Get scored papers from storage.
-    
-    Requirements: 7.2 - Dashboard displays today's selected papers
-    """
-    global _papers_cache
-    
-    try:
-        # Try JSON storage first
-        storage = get_json_storage()
-        papers_data = storage.get_papers(limit=limit, offset=offset, min_score=min_score)
-        
-        if papers_data:
-            papers = [
-                PaperResponse(
-                    id=p.get("arxiv_id", p.get("id", "")),
-                    title=p.get("title", ""),
-                    abstract=p.get("abstract", ""),
-                    authors=p.get("authors", []),
-                    categories=p.get("categories", []),
-                    published=datetime.fromisoformat(p["published"]) if p.get("published") else datetime.now(timezone.utc),
-                    source=p.get("source", "arxiv"),
-                    url=p.get("url", ""),
-                    relevance_score=p.get("relevance_score"),
-                    novelty_score=p.get("novelty_score"),
-                    total_score=p.get("total_score"),
-                    one_liner=p.get("one_liner"),
-                    pros=p.get("pros"),
-                    cons=p.get("cons"),
-                )
-                for p in papers_data
-            ]
-            return PaperListResponse(papers=papers, total=len(papers))
-        
-        # Fallback to memory cache
-        filtered_papers = _papers_cache
-        if min_score is not None:
-            filtered_papers = [p for p in _papers_cache if p.total_score and p.total_score >= min_score]
-        
-        # Apply pagination
-        start = offset
-        end = offset + limit
-        paginated_papers = filtered_papers[start:end]
-        
-        return PaperListResponse(papers=paginated_papers, total=len(filtered_papers))
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@papers_router.get("/saved", response_model=SavedPapersListResponse)
-async def get_saved_papers(
-    user_id: str = "default",
-    limit: int = 50,
-    offset: int = 0,
-    config=Depends(get_config)
-):
-    """Get saved papers for a user.
-    
-    Requirements: 7.3 - "稍后读" functionality - view saved papers
-    """
-    try:
-        storage = get_json_storage()
-        saved_papers_data = storage.get_saved_papers(user_id)
-        
-        logger.info(f"Found {len(saved_papers_data)} saved papers for user {user_id}")
-        
-        # Apply pagination
-        start = offset
-        end = offset + limit
-        paginated_saved = saved_papers_data[start:end]
-        
-        # Convert to response format
-        saved_papers = []
-        for saved_data in paginated_saved:
-            paper_id = saved_data.get('paper_id')
-            saved_at_str = saved_data.get('saved_at')
-            
-            logger.info(f"Processing saved paper with ID: {paper_id}")
-            
-            # Parse saved_at timestamp
-            try:
-                saved_at = datetime.fromisoformat(saved_at_str.replace('Z', '+00:00'))
-            except Exception as parse_error:
-                logger.warning(f"Failed to parse saved_at: {parse_error}")
-                saved_at = datetime.now(timezone.utc)
-            
-            # Try to get paper details from multiple sources
-            paper_response = None
-            
-            # First, check if paper data is already included in saved_data
-            if 'paper' in saved_data and saved_data['paper']:
-                logger.info(f"Found paper data in saved_data for {paper_id}")
-                paper_data = saved_data['paper']
-                
-                paper_response = PaperResponse(
-                    id=paper_data.get("arxiv_id", paper_data.get("id", "")),
-                    title=paper_data.get("title", ""),
-                    abstract=paper_data.get("abstract", ""),
-                    authors=paper_data.get("authors", []),
-                    categories=paper_data.get("categories", []),
-                    published=datetime.fromisoformat(paper_data["published"]) if paper_data.get("published") else datetime.now(timezone.utc),
-                    source=paper_data.get("source", "arxiv"),
-                    url=paper_data.get("url", ""),
-                    relevance_score=paper_data.get("relevance_score"),
-                    novelty_score=paper_data.get("novelty_score"),
-                    total_score=paper_data.get("total_score"),
-                    one_liner=paper_data.get("one_liner"),
-                    pros=paper_data.get("pros"),
-                    cons=paper_data.get("cons"),
-                )
-                    
-            else:
-                # Fallback: try to find paper in storage
-                logger.info(f"Looking up paper in storage for {paper_id}")
-                paper_data = storage.get_paper_by_id(paper_id)
-                if paper_data:
-                    logger.info(f"Found paper in storage for {paper_id}")
-                    paper_response = PaperResponse(
-                        id=paper_data.get("arxiv_id", paper_data.get("id", "")),
-                        title=paper_data.get("title", ""),
-                        abstract=paper_data.get("abstract", ""),
-                        authors=paper_data.get("authors", []),
-                        categories=paper_data.get("categories", []),
-                        published=datetime.fromisoformat(paper_data["published"]) if paper_data.get("published") else datetime.now(timezone.utc),
-                        source=paper_data.get("source", "arxiv"),
-                        url=paper_data.get("url", ""),
-                        relevance_score=paper_data.get("relevance_score"),
-                        novelty_score=paper_data.get("novelty_score"),
-                        total_score=paper_data.get("total_score"),
-                        one_liner=paper_data.get("one_liner"),
-                        pros=paper_data.get("pros"),
-                        cons=paper_data.get("cons"),
-                    )
-                else:
-                    # Last resort: try to find in memory cache
-                    logger.info(f"Looking up paper in memory cache for {paper_id}")
-                    for p in _papers_cache:
-                        if p.id == paper_id:
-                            logger.info(f"Found paper in memory cache for {paper_id}")
-                            paper_response = p
-                            break
-                    
-                    if not paper_response:
-                        logger.warning(f"Paper not found anywhere for {paper_id}")
-            
-            saved_papers.append(SavedPaperResponse(
-                paper_id=paper_id,
-                saved_at=saved_at,
-                paper=paper_response
-            ))
-        
-        return SavedPapersListResponse(
-            saved_papers=saved_papers,
-            total=len(saved_papers_data)
-        )
-        
-    except Exception as e:
-        logger.error(f"Error getting saved papers: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@papers_router.delete("/saved/remove")
-async def remove_saved_paper_query(
-    paper_id: str = Query(...),
-    user_id: str = Query(default="default"),
-    config=Depends(get_config)
-):
-    """Remove a saved paper for a user using query parameters.
-    
-    Requirements: 7.3 - "稍后读" functionality - remove saved papers
-    """
-    try:
-        logger.info(f"Removing saved paper {paper_id} for user {user_id}")
-        storage = get_json_storage()
-        success = storage.remove_saved_paper(user_id, paper_id)
-        
-        if success:
-            logger.info(f"Paper removed successfully")
-            return {"success": True, "message": "Paper removed from saved list"}
-        else:
-            logger.warning(f"Paper not found in saved list")
-            raise HTTPException(status_code=404, detail="Paper not found in saved list")
-            
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error removing saved paper {paper_id}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@papers_router.delete("/saved/{paper_id:path}")
-async def remove_saved_paper(
-    paper_id: str,
-    user_id: str = Query(default="default"),
-    config=Depends(get_config)
-):
-    """Remove a saved paper for a user.
-    
-    Requirements: 7.3 - "稍后读" functionality - remove saved papers
-    """
-    try:
-        logger.info(f"Removing saved paper {paper_id} for user {user_id}")
-        storage = get_json_storage()
-        success = storage.remove_saved_paper(user_id, paper_id)
-        
-        if success:
-            logger.info(f"Paper removed successfully")
-            return {"success": True, "message": "Paper removed from saved list"}
-        else:
-            logger.warning(f"Paper not found in saved list")
-            raise HTTPException(status_code=404, detail="Paper not found in saved list")
-            
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error removing saved paper {paper_id}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@papers_router.get("/{paper_id}", response_model=PaperResponse)
-async def get_paper(paper_id: str, config=Depends(get_config)):
-    """Get a single paper by ID."""
-    try:
-        storage = get_json_storage()
-        paper_data = storage.get_paper_by_id(paper_id)
-        
-        if not paper_data:
-            # Try memory cache
-            for p in _papers_cache:
-                if p.id == paper_id:
-                    return p
-            raise HTTPException(status_code=404, detail="Paper not found")
-        
-        return PaperResponse(
-            id=paper_data.get("arxiv_id", paper_data.get("id", "")),
-            title=paper_data.get("title", ""),
-            abstract=paper_data.get("abstract", ""),
-            authors=paper_data.get("authors", []),
-            categories=paper_data.get("categories", []),
-            published=datetime.fromisoformat(paper_data["published"]) if paper_data.get("published") else datetime.now(timezone.utc),
-            source=paper_data.get("source", "arxiv"),
-            url=paper_data.get("url", ""),
-            relevance_score=paper_data.get("relevance_score"),
-            novelty_score=paper_data.get("novelty_score"),
-            total_score=paper_data.get("total_score"),
-            one_liner=paper_data.get("one_liner"),
-            pros=paper_data.get("pros"),
-            cons=paper_data.get("cons"),
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@papers_router.post("/fetch")
-async def fetch_papers(request: FetchPapersRequest, config=Depends(get_config)):
-    """Fetch new papers from ArXiv and HuggingFace.
-    
-    Requirements: 4.1, 4.2 - Fetch papers from multiple sources
-    """
-    global _papers_cache
-    
-    try:
-        # Use enhanced fetcher if available, fallback to regular fetcher
-        if _ENHANCED_FETCHER_AVAILABLE:
-            fetcher = EnhancedArXivFetcher(
-                categories=config.arxiv_categories,
-                http_proxy=config.http_proxy,
-                https_proxy=config.https_proxy,
-                network_config=config.network
-            )
-        elif _REGULAR_FETCHER_AVAILABLE:
-            fetcher = ArXivFetcher(
-                config.arxiv_categories,
-                http_proxy=config.http_proxy,
-                https_proxy=config.https_proxy
-            )
-        else:
-            raise HTTPException(status_code=500, detail="No ArXiv fetcher available")
-        
-        papers = fetcher.fetch_recent(days=request.days, max_results=request.max_results)
-        
-        # Also try HuggingFace
-        try:
-            if _REGULAR_FETCHER_AVAILABLE:
-                hf_fetcher = HuggingFaceFetcher()
-                hf_papers = hf_fetcher.fetch_daily()
-                papers.extend(hf_papers)
-        except Exception:
-            pass  # HuggingFace fetch is optional
-        
-        # Convert to response format and store in cache
-        paper_responses = [paper_to_response(p) for p in papers]
-        _papers_cache.extend(paper_responses)
-        
-        # Remove duplicates based on ID
-        seen_ids = set()
-        unique_papers = []
-        for paper in _papers_cache:
-            if paper.id not in seen_ids:
-                seen_ids.add(paper.id)
-                unique_papers.append(paper)
-        _papers_cache = unique_papers
-        
-        return {
-            "success": True,
-            "count": len(papers),
-            "papers": paper_responses,
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@papers_router.post("/score")
-async def score_papers(request: ScorePapersRequest, config=Depends(get_config)):
-    """Score papers using LLM.
-    
-    Requirements: 5.1, 5.2, 6.1 - Score papers and trigger notifications
-    """
-    global _notification_queue
-    
-    scoring_api_key = config.get_scoring_api_key()
-    if not scoring_api_key:
-        raise HTTPException(status_code=400, detail="Scoring API key not configured")
-    
-    try:
-        # Fetch papers to score using enhanced fetcher if available
-        if _ENHANCED_FETCHER_AVAILABLE:
-            fetcher = EnhancedArXivFetcher(
-                categories=config.arxiv_categories,
-                http_proxy=config.http_proxy,
-                https_proxy=config.https_proxy,
-                network_config=config.network
-            )
-        elif _REGULAR_FETCHER_AVAILABLE:
-            fetcher = ArXivFetcher(
-                config.arxiv_categories,
-                http_proxy=config.http_proxy,
-                https_proxy=config.https_proxy
-            )
-        else:
-            raise HTTPException(status_code=500, detail="No ArXiv fetcher available")
-        
-        papers = fetcher.fetch_recent(days=1, max_results=50)
-        
-        # Score papers using configured provider
-        interests = request.interests or config.user_interests
-        scorer = LLMScorer(
-            api_key=scoring_api_key,
-            interests=interests,
-            threshold=request.threshold,
-            provider=config.get_scoring_provider(),
-            model=config.get_scoring_model()
-        )
-        
-        scored_papers = await scorer.score_batch(papers)
-        filtered_papers = scorer.filter_by_threshold(scored_papers)
-        
-        # Store to JSON storage
-        storage = get_json_storage()
-        for sp in filtered_papers:
-            paper_dict = scored_paper_to_db_dict(sp)
-            storage.upsert_paper(paper_dict)
-        
-        # Create notifications for high-score papers
-        for sp in filtered_papers:
-            notification = NotificationResponse(
-                id=f"notif-{sp.paper.id}",
-                paper_id=sp.paper.id,
-                title=sp.paper.title,
-                source=sp.paper.source,
-                score=sp.total_score,
-                timestamp=datetime.now(timezone.utc),
-            )
-            _notification_queue.append(notification)
-        
-        return {
-            "success": True,
-            "scored_count": len(scored_papers),
-            "filtered_count": len(filtered_papers),
-            "papers": [
-                {
-                    "id": sp.paper.id,
-                    "title": sp.paper.title,
-                    "total_score": sp.total_score,
-                    "one_liner": sp.one_liner,
-                }
-                for sp in filtered_papers
-            ],
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@papers_router.post("/save")
-async def save_paper(request: SavePaperRequest, config=Depends(get_config)):
-    """Save a paper for later reading.
-    
-    Requirements: 7.3 - "稍后读" functionality
-    """
-    try:
-        logger.info(f"Saving paper {request.paper_id} for user {request.user_id}")
-        storage = get_json_storage()
-        result = storage.save_paper_for_later(request.paper_id, request.user_id)
-        
-        # Check if paper was already saved
-        if result.get('already_saved', False):
-            logger.info(f"Paper {request.paper_id} was already saved")
-            return SavePaperResponse(success=False, message="Paper already saved")
-        else:
-            logger.info(f"Paper saved successfully: {result}")
-            return SavePaperResponse(success=True, message="Paper saved successfully")
-    except Exception as e:
-        logger.error(f"Error saving paper {request.paper_id}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-# Chat endpoints
-@chat_router.post("/message", response_model=ChatMessageResponse)
-async def send_chat_message(request: ChatMessageRequest, config=Depends(get_config)):
-    """Send a chat message about a paper with RAG support.
-    
-    Requirements: 8.1, 8.2, 8.5, 8.9 - RAG chat with PDF context and fallback
-    """
-    chat_api_key = config.get_chat_api_key()
-    if not chat_api_key:
-        raise HTTPException(status_code=400, detail="Chat API key not configured")
-    
-    try:
-        from openai import AsyncOpenAI
-        from ..scorer.llm_scorer import PROVIDER_CONFIGS
-        
-        rag_service = get_rag_service()
-        
-        # Get paper context from JSON storage
-        storage = get_json_storage()
-        paper_data = storage.get_paper_by_id(request.paper_id)
-        
-        if not paper_data:
-            # Try to find in memory cache
-            for p in _papers_cache:
-                if p.id == request.paper_id:
-                    paper_data = {
-                        "title": p.title,
-                        "abstract": p.abstract,
-                        "arxiv_id": p.id
-                    }
-                    break
-        
-        if not paper_data:
-            raise HTTPException(status_code=404, detail="Paper not found")
-        
-        # Get or initialize RAG context
-        rag_context = rag_service.get_context(request.paper_id)
-        if not rag_context:
-            # Initialize context with abstract-only mode
-            rag_context = await rag_service.initialize_context(
-                paper_id=request.paper_id,
-                paper_title=paper_data.get('title', ''),
-                paper_abstract=paper_data.get('abstract', ''),
-                pdf_url=""  # No PDF URL means abstract-only mode
-            )
-        
-        # Try to get enhanced context from PDF if available
-        context_text = paper_data.get('abstract', '')
-        context_source = "摘要"
-        is_pdf_based = False
-        
-        if rag_context.is_pdf_processed:
-            # Perform semantic search for relevant chunks
-            search_results = rag_service.search_semantic(
-                paper_id=request.paper_id,
-                query=request.message,
-                top_k=3
-            )
-            
-            if search_results:
-                # Use RAG context
-                context_text = rag_context.get_context_text(max_tokens=3000)
-                context_source = "PDF全文"
-                is_pdf_based = True
-        
-        # Get provider config
-        provider = config.llm_provider
-        provider_config = PROVIDER_CONFIGS.get(provider, PROVIDER_CONFIGS["openrouter"])
-        
-        # Initialize client based on provider
-        client_kwargs = {"api_key": chat_api_key}
-        if provider_config["base_url"]:
-            client_kwargs["base_url"] = provider_config["base_url"]
-        
-        client = AsyncOpenAI(**client_kwargs)
-        model = config.llm_model or provider_config["model"]
-        
-        # Build conversation with enhanced context
-        system_prompt = f"""你是一位专业的AI研究助手。用户正在阅读以下论文，请帮助他们理解论文内容。
-
-论文标题: {paper_data.get('title', '')}
-
-上下文来源: {context_source}
-{context_text}
-
-请用中文回答用户的问题，保持专业但易于理解。如果问题涉及论文中的具体细节，请尽量引用上下文中的相关内容。"""
-        
-        messages = [{"role": "system", "content": system_prompt}]
-        
-        # Add conversation history
-        for msg in request.history:
-            messages.append({
-                "role": msg.get("role", "user"),
-                "content": msg.get("content", ""),
-            })
-        
-        # Add current message
-        messages.append({"role": "user", "content": request.message})
-        
-        # Build request kwargs
-        request_kwargs = {
-            "model": model,
-            "messages": messages,
-            "temperature": 0.7,
-            "max_tokens": 1000,
-        }
-        
-        # Add extra headers for OpenRouter
-        if provider == "openrouter":
-            request_kwargs["extra_headers"] = provider_config.get("extra_headers", {})
-        
-        response = await client.chat.completions.create(**request_kwargs)
-        
-        # Add source indicator to the response
-        response_content = response.choices[0].message.content
-        
-        if is_pdf_based:
-            # PDF-based response
-            response_content += "\n\n📄 **本回复基于PDF全文内容**"
-        else:
-            # Abstract-based response
-            response_content += "\n\n📝 **本回复仅基于论文摘要，可能存在幻觉**"
-        
-        return ChatMessageResponse(
-            role="assistant",
-            content=response_content,
-            timestamp=datetime.now(timezone.utc),
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@chat_router.post("/quick-command", response_model=ChatMessageResponse)
-async def execute_quick_command(request: QuickCommandRequest, config=Depends(get_config)):
-    """Execute a quick command for a paper with PDF content search.
-    
-    Requirements: 8.3, 8.6 - Enhanced quick commands with PDF content
-    """
-    chat_api_key = config.get_chat_api_key()
-    if not chat_api_key:
-        raise HTTPException(status_code=400, detail="Chat API key not configured")
-    
-    try:
-        from openai import AsyncOpenAI
-        from ..scorer.llm_scorer import PROVIDER_CONFIGS
-        
-        rag_service = get_rag_service()
-        
-        # Get paper context from JSON storage
-        storage = get_json_storage()
-        paper_data = storage.get_paper_by_id(request.paper_id)
-        
-        if not paper_data:
-            # Try to find in memory cache
-            for p in _papers_cache:
-                if p.id == request.paper_id:
-                    paper_data = {
-                        "title": p.title,
-                        "abstract": p.abstract,
-                        "url": p.url,
-                        "arxiv_id": p.id
-                    }
-                    break
-        
-        if not paper_data:
-            raise HTTPException(status_code=404, detail="Paper not found")
-        
-        # Get RAG context
-        rag_context = rag_service.get_context(request.paper_id)
-        
-        # Prepare command-specific search and context
-        context_text = paper_data.get('abstract', '')
-        context_source = "摘要"
-        is_pdf_based = False
-        
-        if rag_context and rag_context.is_pdf_processed:
-            # Perform targeted search based on command
-            if request.command == "看公式":
-                # Search for mathematical content
-                search_results = rag_service.search_keyword(
-                    paper_id=request.paper_id,
-                    keywords=["equation", "formula", "mathematical", "算法", "公式", "方程", "数学", "计算"],
-                    top_k=3
-                )
-            elif request.command == "看代码链接":
-                # Search for code-related content
-                search_results = rag_service.search_keyword(
-                    paper_id=request.paper_id,
-                    keywords=["code", "github", "implementation", "代码", "实现", "开源", "repository"],
-                    top_k=3
-                )
-            else:
-                search_results = []
-            
-            if search_results:
-                # Build enhanced context from search results
-                context_parts = [f"论文标题: {paper_data.get('title', '')}"]
-                context_parts.append(f"论文摘要: {paper_data.get('abstract', '')}")
-                context_parts.append("\n相关PDF内容:")
-                
-                for result in search_results:
-                    chunk = result.chunk
-                    context_parts.append(f"\n[第{chunk.page_number}页] {chunk.content}")
-                
-                context_text = "\n".join(context_parts)
-                context_source = "PDF全文搜索"
-                is_pdf_based = True
-        
-        # Get provider config
-        provider = config.llm_provider
-        provider_config = PROVIDER_CONFIGS.get(provider, PROVIDER_CONFIGS["openrouter"])
-        
-        # Initialize client based on provider
-        client_kwargs = {"api_key": chat_api_key}
-        if provider_config["base_url"]:
-            client_kwargs["base_url"] = provider_config["base_url"]
-        
-        client = AsyncOpenAI(**client_kwargs)
-        model = config.llm_model or provider_config["model"]
-        
-        # Build command-specific prompt
-        if request.command == "看公式":
-            prompt = f"""请从以下论文内容中提取并解释主要的数学公式或方法论。
-
-上下文来源: {context_source}
-{context_text}
-
-请用中文解释论文中涉及的关键公式和数学概念。如果内容中有具体的公式，请详细解释其含义和作用。"""
-        elif request.command == "看代码链接":
-            prompt = f"""请帮助用户找到这篇论文相关的代码资源。
-
-论文标题: {paper_data.get('title', '')}
-论文URL: {paper_data.get('url', '')}
-
-上下文来源: {context_source}
-{context_text}
-
-请提供：
-1. 如何在论文页面找到代码链接
-2. 常见的代码托管平台（如GitHub）上搜索该论文代码的建议
-3. 相关的开源实现或复现项目的搜索建议
-4. 如果PDF内容中提到了具体的代码仓库或实现，请特别指出"""
-        else:
-            raise HTTPException(status_code=400, detail=f"Unknown command: {request.command}")
-        
-        # Build request kwargs
-        request_kwargs = {
-            "model": model,
-            "messages": [
-                {"role": "system", "content": "你是一位专业的AI研究助手，帮助用户理解和探索学术论文。"},
-                {"role": "user", "content": prompt},
-            ],
-            "temperature": 0.7,
-            "max_tokens": 1000,
-        }
-        
-        # Add extra headers for OpenRouter
-        if provider == "openrouter":
-            request_kwargs["extra_headers"] = provider_config.get("extra_headers", {})
-        
-        response = await client.chat.completions.create(**request_kwargs)
-        
-        # Add source indicator to the response
-        response_content = response.choices[0].message.content
-        
-        if is_pdf_based:
-            # PDF-based response
-            response_content += "\n\n📄 **本回复基于PDF全文内容**"
-        else:
-            # Abstract-based response
-            response_content += "\n\n📝 **本回复仅基于论文摘要，可能存在幻觉**"
-        
-        return ChatMessageResponse(
-            role="assistant",
-            content=response_content,
-            timestamp=datetime.now(timezone.utc),
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-# Notifications endpoints
-@notifications_router.get("/", response_model=NotificationListResponse)
-async def get_notifications():
-    """Get pending notifications.
-    
-    Requirements: 6.1, 6.5 - Bubble notifications for high-score papers
-    """
-    global _notification_queue
-    return NotificationListResponse(notifications=_notification_queue)
-
-
-@notifications_router.delete("/{notification_id}")
-async def dismiss_notification(notification_id: str):
-    """Dismiss a notification.
-    
-    Requirements: 6.4 - Dismiss notifications
-    """
-    global _notification_queue
-    _notification_queue = [n for n in _notification_queue if n.id != notification_id]
-    return {"success": True}
-
-
-@notifications_router.delete("/")
-async def clear_notifications():
-    """Clear all notifications."""
-    global _notification_queue
-    _notification_queue = []
-    return {"success": True}
-
-
-# PDF processing endpoints
-@pdf_router.post("/process", response_model=PDFProcessingResponse)
-async def process_pdf(request: PDFProcessingRequest, config=Depends(get_config)):
-    """Start PDF processing for a paper with error handling and fallback.
-    
-    Requirements: 8.1, 8.2, 8.3, 8.9 - PDF download, processing, vectorization, and fallback
-    """
-    try:
-        rag_service = get_rag_service()
-        
-        # Get paper info from storage
-        storage = get_json_storage()
-        paper_data = storage.get_paper_by_id(request.paper_id)
-        
-        if not paper_data:
-            # Try to find in memory cache
-            for p in _papers_cache:
-                if p.id == request.paper_id:
-                    paper_data = {
-                        "title": p.title,
-                        "abstract": p.abstract,
-                        "arxiv_id": p.id
-                    }
-                    break
-        
-        if not paper_data:
-            raise HTTPException(status_code=404, detail="Paper not found")
-        
-        # Initialize RAG context (always succeeds with abstract)
-        await rag_service.initialize_context(
-            paper_id=request.paper_id,
-            paper_title=paper_data.get("title", ""),
-            paper_abstract=paper_data.get("abstract", ""),
-            pdf_url=request.pdf_url
-        )
-        
-        # Attempt PDF processing with error handling
-        try:
-            success = await rag_service.process_pdf_if_needed(request.paper_id)
-            
-            if success:
-                # Get final status
-                status = rag_service.get_processing_status(request.paper_id)
-                return PDFProcessingResponse(
-                    success=True,
-                    message="PDF processing completed successfully",
-                    chunks_count=status.get("total_chunks", 0)
-                )
-            else:
-                # PDF processing failed, but context is still available with abstract
-                return PDFProcessingResponse(
-                    success=False,
-                    message="PDF processing failed, but abstract-based chat is available"
-                )
-                
-        except Exception as pdf_error:
-            logger.warning(f"PDF processing failed for paper {request.paper_id}: {pdf_error}")
-            
-            # Return graceful failure - abstract-based chat is still available
-            return PDFProcessingResponse(
-                success=False,
-                message=f"PDF processing failed: {str(pdf_error)}. Abstract-based chat is still available."
-            )
-            
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"PDF processing request failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@pdf_router.post("/search", response_model=PDFSearchResponse)
-async def search_pdf_content(request: PDFSearchRequest, config=Depends(get_config)):
-    """Search within PDF content using text search with error handling.
-    
-    Requirements: 8.4, 8.9 - Vector search API with error handling
-    """
-    try:
-        rag_service = get_rag_service()
-        
-        # Check if paper exists and is processed
-        context = rag_service.get_context(request.paper_id)
-        if not context:
-            raise HTTPException(status_code=404, detail="Paper context not found")
-        
-        if not context.is_pdf_processed:
-            raise HTTPException(
-                status_code=400, 
-                detail="PDF not processed for this paper. Only abstract-based search is available."
-            )
-        
-        # Perform search based on type with error handling
-        try:
-            if request.search_type == "semantic":
-                # Use text-based search (BM25-like scoring)
-                results = rag_service.search_semantic(request.paper_id, request.query, request.top_k)
-            elif request.search_type == "keyword":
-                # Convert query to keywords
-                keywords = request.query.split()
-                results = rag_service.search_keyword(request.paper_id, keywords, request.top_k)
-            else:
-                raise HTTPException(status_code=400, detail="Invalid search type. Use 'semantic' or 'keyword'")
-            
-            # Convert results to API response format
-            search_results = []
-            for result in results:
-                search_results.append(PDFSearchResult(
-                    chunk_id=result.chunk.id,
-                    content=result.chunk.content,
-                    page_number=result.chunk.page_number,
-                    relevance_score=result.relevance_score
-                ))
-            
-            return PDFSearchResponse(
-                paper_id=request.paper_id,
-                query=request.query,
-                search_type=request.search_type,
-                results=search_results,
-                total_results=len(search_results)
-            )
-            
-        except Exception as search_error:
-            logger.error(f"PDF search failed for paper {request.paper_id}: {search_error}")
-            
-            # Return empty results with error indication
-            return PDFSearchResponse(
-                paper_id=request.paper_id,
-                query=request.query,
-                search_type=request.search_type,
-                results=[],
-                total_results=0
-            )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"PDF search request failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@pdf_router.post("/chat", response_model=ChatMessageResponse)
-async def chat_with_pdf(request: PDFChatRequest, config=Depends(get_config)):
-    """Chat with PDF content using RAG with fallback to abstract-based chat.
-    
-    Requirements: 8.5, 8.9 - PDF-based chat API with fallback behavior
-    """
-    chat_api_key = config.get_chat_api_key()
-    if not chat_api_key:
-        raise HTTPException(status_code=400, detail="Chat API key not configured")
-    
-    try:
-        from openai import AsyncOpenAI
-        from ..scorer.llm_scorer import PROVIDER_CONFIGS
-        
-        rag_service = get_rag_service()
-        
-        # Get RAG context
-        context = rag_service.get_context(request.paper_id)
-        if not context:
-            raise HTTPException(status_code=404, detail="Paper context not found")
-        
-        # Determine context source and search for relevant chunks
-        context_text = context.paper_abstract
-        context_source = "摘要"
-        is_pdf_based = False
-        
-        if context.is_pdf_processed:
-            try:
-                # Perform text search for relevant chunks
-                search_results = rag_service.search_semantic(request.paper_id, request.message, top_k=3)
-                
-                if search_results:
-                    # Update context with retrieved chunks
-                    context.retrieved_chunks = [result.chunk for result in search_results]
-                    context.last_query = request.message
-                    context.last_search_time = datetime.now()
-                    
-                    # Get formatted context text from PDF
-                    context_text = context.get_context_text(max_tokens=request.max_context_tokens)
-                    context_source = "PDF全文"
-                    is_pdf_based = True
-                    
-            except Exception as search_error:
-                logger.warning(f"PDF search failed for paper {request.paper_id}: {search_error}")
-                # Keep is_pdf_based = False for abstract-based response
-        
-        # Get provider config
-        provider = config.llm_provider
-        provider_config = PROVIDER_CONFIGS.get(provider, PROVIDER_CONFIGS["openrouter"])
-        
-        # Initialize client
-        client_kwargs = {"api_key": chat_api_key}
-        if provider_config["base_url"]:
-            client_kwargs["base_url"] = provider_config["base_url"]
-        
-        client = AsyncOpenAI(**client_kwargs)
-        model = config.llm_model or provider_config["model"]
-        
-        # Build system prompt with context
-        system_prompt = f"""你是一位专业的AI研究助手。用户正在阅读以下论文，请帮助他们理解论文内容。
-
-论文标题: {context.paper_title}
-
-上下文来源: {context_source}
-{context_text}
-
-请用中文回答用户的问题，保持专业但易于理解。如果问题涉及论文中的具体细节，请尽量引用上下文中的相关内容。"""
-        
-        # Build conversation
-        messages = [{"role": "system", "content": system_prompt}]
-        
-        # Add history
-        for msg in request.history:
-            messages.append({
-                "role": msg.get("role", "user"),
-                "content": msg.get("content", "")
-            })
-        
-        # Add current message
-        messages.append({"role": "user", "content": request.message})
-        
-        # Build request
-        request_kwargs = {
-            "model": model,
-            "messages": messages,
-            "temperature": 0.7,
-            "max_tokens": 1000,
-        }
-        
-        if provider == "openrouter":
-            request_kwargs["extra_headers"] = provider_config.get("extra_headers", {})
-        
-        # Get response
-        response = await client.chat.completions.create(**request_kwargs)
-        
-        # Add source indicator to the response
-        response_content = response.choices[0].message.content
-        
-        if is_pdf_based:
-            # PDF-based response
-            response_content += "\n\n📄 **本回复基于PDF全文内容**"
-        else:
-            # Abstract-based response
-            response_content += "\n\n📝 **本回复仅基于论文摘要，可能存在幻觉**"
-        
-        return ChatMessageResponse(
-            role="assistant",
-            content=response_content,
-            timestamp=datetime.now(timezone.utc),
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"PDF chat failed: {e}")
-        # Return a graceful error message
-        return ChatMessageResponse(
-            role="assistant",
-            content=f"抱歉，聊天服务暂时不可用：{str(e)}。请稍后重试。",
-            timestamp=datetime.now(timezone.utc),
-        )
-
-
-@pdf_router.get("/status", response_model=PDFStatusResponse)
-async def get_pdf_status(paper_id: str):
-    """Get PDF processing status for a paper.
-    
-    Requirements: 8.1 - PDF processing status display
-    """
-    try:
-        logger.info(f"Getting PDF status for paper_id: '{paper_id}'")
-        rag_service = get_rag_service()
-        
-        available_contexts = list(rag_service._contexts.keys())
-        logger.debug(f"Available contexts: {available_contexts}")
-        
-        status = rag_service.get_processing_status(paper_id)
-        logger.info(f"Retrieved status: {status}")
-        
-        return PDFStatusResponse(
-            paper_id=paper_id,
-            is_downloading=status.get("is_downloading", False),
-            is_processing=status.get("is_processing", False),
-            is_complete=status.get("is_complete", False),
-            progress=status.get("progress", 0.0),
-            error_message=status.get("error_message"),
-            total_chunks=status.get("total_chunks", 0),
-            processed_chunks=status.get("processed_chunks", 0),
-            pdf_processed=status.get("pdf_processed", False),
-            has_context=status.get("has_context", False)
-        )
-        
-    except Exception as e:
-        logger.error(f"Failed to get PDF status for paper_id '{paper_id}': {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+"""API routes for Paper Pal backend.
+
+Requirements: 6.1, 7.2, 8.2
+"""
+
+import asyncio
+import base64
+import functools
+import hashlib
+import importlib.util
+import os
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import httpx
+import msgspec
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from openai import AsyncOpenAI
+
+from . import models
+from .models import (
+    ScorePapersRequest,
+    ChatMessageRequest,
+    QuickCommandRequest,
+    SavePaperRequest,
+    SavePaperResponse,
+    GetSavedPapersRequest,
+    PDFProcessingRequest,
+    PDFProcessingResponse,
+    PDFStatusResponse,
+    PDFSearchRequest,
+    PDFChatRequest,
+    ChatTurn,
+    SearchType,
+)
+from .models_fast import (
+    ChatMessageResponse,
+    PaperResponse,
+    PaperListResponse,
+    NotificationResponse,
+    NotificationListResponse,
+    SavedPaperResponse,
+    SavedPapersListResponse,
+    PDFSearchResult,
+    PDFSearchResponse,
+    paper_from_row,
+    papers_from_rows,
+    decode_fetch_spec,
+)
+from .llm_cache import LLMCache, get_llm_cache
+from .responses import MSGPACK_MEDIA_TYPE, MsgpackResponse, MsgspecResponse
+from ..models import Paper, ScoredPaper
+
+# Try to import enhanced fetcher, fallback to regular fetcher
+try:
+    from ..fetcher import EnhancedArXivFetcher
+    _ENHANCED_FETCHER_AVAILABLE = True
+except ImportError:
+    _ENHANCED_FETCHER_AVAILABLE = False
+
+try:
+    from ..fetcher import ArXivFetcher, HuggingFaceFetcher
+    _REGULAR_FETCHER_AVAILABLE = True
+except ImportError:
+    _REGULAR_FETCHER_AVAILABLE = False
+from ..scorer import LLMScorer, store_scored_papers
+from ..scorer.llm_scorer import PROVIDER_CONFIGS
+from ..db import get_json_storage
+from ..config import load_config
+from ..rag import RAGService
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Create routers
+papers_router = APIRouter(prefix="/api/papers", tags=["papers"])
+chat_router = APIRouter(prefix="/api/chat", tags=["chat"])
+notifications_router = APIRouter(prefix="/api/notifications", tags=["notifications"])
+pdf_router = APIRouter(prefix="/api/pdf", tags=["pdf"])
+
+# Global RAG service instance
+_rag_service: Optional[RAGService] = None
+
+def get_rag_service() -> RAGService:
+    """Get or create RAG service instance."""
+    global _rag_service
+    if _rag_service is None:
+        _rag_service = RAGService()
+    return _rag_service
+
+# Shared fetcher instances, rebuilt only when their settings change
+_arxiv_fetcher = None
+_arxiv_fetcher_key: Optional[tuple] = None
+_hf_fetcher = None
+
+
+def get_arxiv_fetcher(config):
+    """Get the shared ArXiv fetcher for the current config.
+    
+    Prefers EnhancedArXivFetcher, falling back to ArXivFetcher. The instance
+    is reused across requests and only rebuilt when categories, proxies or
+    network settings change.
+    
+    Raises:
+        HTTPException: If no ArXiv fetcher is available
+    """
+    global _arxiv_fetcher, _arxiv_fetcher_key
+    
+    key = (tuple(config.arxiv_categories), config.http_proxy, config.https_proxy, config.network)
+    if _arxiv_fetcher is not None and _arxiv_fetcher_key == key:
+        return _arxiv_fetcher
+    
+    if _ENHANCED_FETCHER_AVAILABLE:
+        fetcher = EnhancedArXivFetcher(
+            categories=config.arxiv_categories,
+            http_proxy=config.http_proxy,
+            https_proxy=config.https_proxy,
+            network_config=config.network
+        )
+    elif _REGULAR_FETCHER_AVAILABLE:
+        fetcher = ArXivFetcher(
+            config.arxiv_categories,
+            http_proxy=config.http_proxy,
+            https_proxy=config.https_proxy
+        )
+    else:
+        raise HTTPException(status_code=500, detail="No ArXiv fetcher available")
+    
+    _arxiv_fetcher, _arxiv_fetcher_key = fetcher, key
+    return fetcher
+
+
+def get_hf_fetcher() -> "HuggingFaceFetcher":
+    """Get or create the shared HuggingFace fetcher."""
+    global _hf_fetcher
+    if _hf_fetcher is None:
+        _hf_fetcher = HuggingFaceFetcher()
+    return _hf_fetcher
+
+
+# Provider used when the configured one is unknown
+_DEFAULT_PROVIDER_CONFIG = PROVIDER_CONFIGS["openrouter"]
+
+# Shared chat clients, one per (base_url, api key digest), so requests reuse
+# the provider connection pool instead of opening a new one each time
+_openai_clients: Dict[Tuple[str, str], AsyncOpenAI] = {}
+
+# Connection pool for chat clients; HTTP/2 (one multiplexed connection per
+# provider) is used when the optional h2 package is installed
+_LLM_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=128)
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def get_openai_client(provider_config: Dict[str, Any], api_key: str) -> AsyncOpenAI:
+    """Get or create the shared AsyncOpenAI client for a provider and key.
+    
+    Args:
+        provider_config: Entry from PROVIDER_CONFIGS
+        api_key: API key for the provider
+        
+    Returns:
+        AsyncOpenAI client
+    """
+    base_url = provider_config["base_url"] or ""
+    key = (base_url, hashlib.sha256(api_key.encode()).hexdigest())
+    client = _openai_clients.get(key)
+    if client is None:
+        client_kwargs = {
+            "api_key": api_key,
+            "http_client": httpx.AsyncClient(
+                http2=_HTTP2_AVAILABLE,
+                limits=_LLM_HTTP_LIMITS,
+                follow_redirects=True,
+            ),
+        }
+        if base_url:
+            client_kwargs["base_url"] = base_url
+        client = AsyncOpenAI(**client_kwargs)
+        _openai_clients[key] = client
+    return client
+
+
+async def close_openai_clients() -> None:
+    """Close the shared chat clients (called on app shutdown)."""
+    clients = list(_openai_clients.values())
+    _openai_clients.clear()
+    _chat_target.cache_clear()
+    for client in clients:
+        await client.close()
+
+
+
+@functools.lru_cache(maxsize=16)
+def _chat_target(provider: str, llm_model: Optional[str], api_key: str) -> Tuple[AsyncOpenAI, str, Dict[str, Any]]:
+    """Resolve the client, model and extra request kwargs for chat calls.
+    
+    Args:
+        provider: Configured LLM provider name
+        llm_model: Configured model override, if any
+        api_key: Chat API key
+        
+    Returns:
+        Tuple of (client, model name, extra chat.completions.create kwargs)
+    """
+    provider_config = PROVIDER_CONFIGS.get(provider, _DEFAULT_PROVIDER_CONFIG)
+    client = get_openai_client(provider_config, api_key)
+    model = llm_model or provider_config["model"]
+    # OpenRouter wants attribution headers on every request
+    extra_kwargs = {"extra_headers": provider_config.get("extra_headers", {})} if provider == "openrouter" else {}
+    return client, model, extra_kwargs
+
+# In-memory notification queue (for simplicity), keyed by notification ID so
+# dismissal is O(1), and bounded so a long-running scheduler cannot grow it
+# forever; the oldest notifications drop off first
+_NOTIFICATION_QUEUE_SIZE = 500
+_notification_queue: "OrderedDict[str, NotificationResponse]" = OrderedDict()
+
+# In-memory paper storage (temporary solution), indexed by paper ID and
+# capped at _PAPERS_CACHE_SIZE entries, oldest evicted first
+_PAPERS_CACHE_SIZE = 10_000
+_papers_cache: List[PaperResponse] = []
+_papers_index: Dict[str, PaperResponse] = {}
+
+# Short-lived cache of storage lookups by paper ID: (expires_at, paper_data)
+_STORED_PAPER_TTL = 30.0
+_STORED_PAPER_CACHE_SIZE = 4096
+_stored_paper_cache: Dict[str, Tuple[float, dict]] = {}
+
+# LRU cache of PDF search results, keyed by
+# (paper_id, normalized query, search_type, top_k)
+_PDF_SEARCH_CACHE_SIZE = 2048
+_pdf_search_cache: "OrderedDict[Tuple[str, str, str, int], List[PDFSearchResult]]" = OrderedDict()
+
+
+# Short-lived cache of RAG searches made by the chat endpoints, keyed by
+# (paper_id, query or keyword tuple, top_k) -> (expires_at, results)
+_RAG_SEARCH_TTL = 60.0
+_RAG_SEARCH_CACHE_SIZE = 1024
+_rag_search_cache: "OrderedDict[tuple, Tuple[float, list]]" = OrderedDict()
+
+# Formatted PDF context text for chat, keyed by (paper_id, query, max_tokens)
+# -> (expires_at, context_text); same TTL and bound as the search cache
+_pdf_context_cache: "OrderedDict[tuple, Tuple[float, str]]" = OrderedDict()
+
+# Finished /pdf/chat answers keyed by (paper_id, normalised message and
+# history, max_context_tokens, provider, model) -> (expires_at, content), so
+# a repeated question is answered before any search or prompt building
+_PDF_CHAT_ANSWER_CACHE_SIZE = 1024
+_pdf_chat_answer_cache: "OrderedDict[tuple, Tuple[float, str]]" = OrderedDict()
+
+
+def _normalize_query(query: str) -> str:
+    """Lower-case a query and collapse whitespace, for cache keys only.
+    
+    The text store matches case-insensitively, so queries differing only in
+    case or spacing return the same results. The original text is still
+    what gets searched and sent to the LLM.
+    """
+    return " ".join(query.lower().split())
+
+
+def _invalidate_pdf_search_cache(paper_id: str) -> None:
+    """Drop cached search results for a paper whose chunks may have changed."""
+    for cache in (_pdf_search_cache, _rag_search_cache, _pdf_context_cache, _pdf_chat_answer_cache):
+        for key in [k for k in cache if k[0] == paper_id]:
+            del cache[key]
+
+
+# Limits concurrent text-store searches so a burst of searches cannot tie up
+# every worker thread; created lazily inside the running event loop
+_search_semaphore: Optional[asyncio.Semaphore] = None
+
+
+async def _run_search(search, *args):
+    """Run a synchronous RAG search in a worker thread."""
+    global _search_semaphore
+    if _search_semaphore is None:
+        _search_semaphore = asyncio.Semaphore(os.cpu_count() or 4)
+    async with _search_semaphore:
+        return await asyncio.to_thread(search, *args)
+
+
+async def _cached_rag_search(paper_id: str, query, top_k: int) -> list:
+    """Run a RAG search in a worker thread, caching the results briefly.
+    
+    Repeated chat turns and quick commands on the same paper reuse the
+    results instead of searching the text store again.
+    
+    Args:
+        paper_id: Paper ID to search within
+        query: Query string for semantic search, or a tuple of keywords
+            for keyword search
+        top_k: Number of results to return
+        
+    Returns:
+        List of SearchResult objects
+    """
+    key = (paper_id, query if isinstance(query, tuple) else _normalize_query(query), top_k)
+    now = time.monotonic()
+    cached = _rag_search_cache.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    
+    rag_service = get_rag_service()
+    if isinstance(query, tuple):
+        results = await _run_search(rag_service.search_keyword, paper_id, list(query), top_k)
+    else:
+        results = await _run_search(rag_service.search_semantic, paper_id, query, top_k)
+    
+    _rag_search_cache[key] = (now + _RAG_SEARCH_TTL, results)
+    _rag_search_cache.move_to_end(key)
+    if len(_rag_search_cache) > _RAG_SEARCH_CACHE_SIZE:
+        _rag_search_cache.popitem(last=False)
+    return results
+
+
+async def _pdf_context_text(context, query: str, max_tokens: int) -> Optional[str]:
+    """Search a processed PDF and format the hits as chat context.
+    
+    Repeated questions about the same paper reuse the formatted text
+    instead of searching and formatting again.
+    
+    Args:
+        context: RAGContext of the paper
+        query: User message to search for
+        max_tokens: Rough token budget for the context text
+        
+    Returns:
+        Context text, or None if the search found nothing
+    """
+    key = (context.paper_id, _normalize_query(query), max_tokens)
+    now = time.monotonic()
+    cached = _pdf_context_cache.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    
+    search_results = await _cached_rag_search(context.paper_id, query, top_k=3)
+    if not search_results:
+        return None
+    
+    # Update context with retrieved chunks
+    context.retrieved_chunks = [result.chunk for result in search_results]
+    context.last_query = query
+    context.last_search_time = datetime.now()
+    context_text = context.get_context_text(max_tokens=max_tokens)
+    
+    _pdf_context_cache[key] = (now + _RAG_SEARCH_TTL, context_text)
+    _pdf_context_cache.move_to_end(key)
+    if len(_pdf_context_cache) > _RAG_SEARCH_CACHE_SIZE:
+        _pdf_context_cache.popitem(last=False)
+    return context_text
+
+
+def add_notification(paper_id: str, title: str, source: str, score: float):
+    """Add a notification to the queue (called by scheduler)."""
+    now = datetime.now(timezone.utc)
+    notification = NotificationResponse(
+        id=f"notif-{paper_id}-{now.timestamp()}",
+        paper_id=paper_id,
+        title=title,
+        source=source,
+        score=score,
+        timestamp=now,
+    )
+    _push_notification(notification)
+
+
+def _push_notification(notification: NotificationResponse) -> None:
+    """Queue a notification as the newest, replacing one with the same ID."""
+    _notification_queue.pop(notification.id, None)
+    _notification_queue[notification.id] = notification
+    if len(_notification_queue) > _NOTIFICATION_QUEUE_SIZE:
+        _notification_queue.popitem(last=False)
+
+
+async def _get_stored_paper(paper_id: str) -> Optional[dict]:
+    """Look up a paper in JSON storage, caching hits for a few seconds.
+    
+    Chat and quick-command calls on the same paper arrive in bursts; this
+    avoids re-reading and scanning the papers file for each of them.
+    Misses are not cached so newly stored papers show up immediately.
+    The file read itself runs in a worker thread.
+    """
+    now = time.monotonic()
+    cached = _stored_paper_cache.get(paper_id)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    
+    paper_data = await asyncio.to_thread(get_json_storage().get_paper_by_id, paper_id)
+    if paper_data is not None:
+        if len(_stored_paper_cache) >= _STORED_PAPER_CACHE_SIZE:
+            del _stored_paper_cache[next(iter(_stored_paper_cache))]
+        _stored_paper_cache[paper_id] = (now + _STORED_PAPER_TTL, paper_data)
+    return paper_data
+
+
+def _encode_cursor(*key: Any) -> str:
+    """Encode a keyset pagination key as an opaque URL-safe cursor."""
+    return base64.urlsafe_b64encode(msgspec.json.encode(key)).decode("ascii")
+
+
+def _decode_cursor(cursor: str, key_type: Type[tuple]) -> tuple:
+    """Decode a cursor produced by _encode_cursor, or raise HTTP 400."""
+    try:
+        return msgspec.json.decode(base64.urlsafe_b64decode(cursor), type=key_type)
+    except (ValueError, msgspec.DecodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def get_config():
+    """Dependency to get config."""
+    return load_config()
+
+
+def wants_msgpack(accept: Optional[str] = Header(default=None, include_in_schema=False)) -> bool:
+    """Dependency: whether the client asked for a MessagePack response."""
+    return accept is not None and MSGPACK_MEDIA_TYPE in accept
+
+
+def paper_to_response(paper: Paper, scored: Optional[ScoredPaper] = None) -> PaperResponse:
+    """Convert Paper model to API response."""
+    if scored:
+        return PaperResponse(
+            id=paper.id,
+            title=paper.title,
+            abstract=paper.abstract,
+            authors=paper.authors,
+            categories=paper.categories,
+            published=paper.published,
+            source=paper.source,
+            url=paper.url,
+            relevance_score=scored.relevance_score,
+            novelty_score=scored.novelty_score,
+            total_score=scored.total_score,
+            one_liner=scored.one_liner,
+            pros=scored.pros,
+            cons=scored.cons,
+        )
+    return PaperResponse(
+        id=paper.id,
+        title=paper.title,
+        abstract=paper.abstract,
+        authors=paper.authors,
+        categories=paper.categories,
+        published=paper.published,
+        source=paper.source,
+        url=paper.url,
+    )
+
+
+# Papers endpoints
+@papers_router.get("/", response_model=None, responses={200: {"model": models.PaperListResponse}})
+async def get_papers(
+    limit: int = 50,
+    offset: int = 0,
+    min_score: Optional[float] = None,
+    cursor: Optional[str] = None,
+    config=Depends(get_config),
+):
+    """Get scored papers from storage.
+    
+    Pass ``next_cursor`` from a previous page as ``cursor`` to continue from
+    where it ended; ``offset`` is then ignored.
+    
+    Requirements: 7.2 - Dashboard displays today's selected papers
+    """
+    after = _decode_cursor(cursor, Tuple[float, str]) if cursor else None
+    
+    try:
+        # Try JSON storage first
+        storage = get_json_storage()
+        # One row past the page tells whether a next page exists
+        papers_data = await asyncio.to_thread(
+            storage.get_papers, limit=limit + 1, offset=offset, min_score=min_score, after=after
+        )
+        has_more = len(papers_data) > limit
+        papers_data = papers_data[:limit]
+        
+        if papers_data:
+            next_cursor = None
+            if has_more:
+                last = papers_data[-1]
+                next_cursor = _encode_cursor(last.get("total_score") or 0, last.get("arxiv_id") or "")
+            papers = papers_from_rows(papers_data)
+            return MsgspecResponse(
+                PaperListResponse(papers=papers, total=len(papers), next_cursor=next_cursor),
+                schema=models.PaperListResponse,
+            )
+        
+        # Past the last page, or nothing matches: the memory cache is only
+        # a stand-in for an empty storage and knows nothing of cursors
+        if after is not None or (await asyncio.to_thread(storage.get_stats))["total_papers"]:
+            return MsgspecResponse(PaperListResponse(papers=[], total=0), schema=models.PaperListResponse)
+        
+        # Fallback to memory cache
+        filtered_papers = _papers_cache
+        if min_score is not None:
+            filtered_papers = [p for p in _papers_cache if p.total_score and p.total_score >= min_score]
+        
+        # Apply pagination
+        start = offset
+        end = offset + limit
+        paginated_papers = filtered_papers[start:end]
+        
+        return MsgspecResponse(PaperListResponse(papers=paginated_papers, total=len(filtered_papers)), schema=models.PaperListResponse)
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@papers_router.get("/saved", response_model=None, responses={200: {"model": models.SavedPapersListResponse}})
+async def get_saved_papers(
+    user_id: str = "default",
+    limit: int = 50,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    config=Depends(get_config)
+):
+    """Get saved papers for a user.
+    
+    Supports the same ``cursor``/``next_cursor`` keyset pagination as
+    get_papers, keyed on (saved_at, paper_id).
+    
+    Requirements: 7.3 - "稍后读" functionality - view saved papers
+    """
+    after = _decode_cursor(cursor, Tuple[str, str]) if cursor else None
+    
+    try:
+        storage = get_json_storage()
+        total = await asyncio.to_thread(storage.count_saved_papers, user_id)
+        # One entry past the page tells whether a next page exists
+        paginated_saved = await asyncio.to_thread(
+            storage.get_saved_papers, user_id, limit=limit + 1, offset=offset, after=after
+        )
+        has_more = len(paginated_saved) > limit
+        paginated_saved = paginated_saved[:limit]
+        
+        logger.info("Found %d saved papers for user %s", total, user_id)
+        
+        # Convert to response format
+        saved_papers = []
+        for saved_data in paginated_saved:
+            paper_id = saved_data.get('paper_id')
+            saved_at_str = saved_data.get('saved_at')
+            
+            logger.debug("Processing saved paper with ID: %s", paper_id)
+            
+            # Parse saved_at timestamp
+            try:
+                # msgspec parses ISO 8601 (including a trailing 'Z') in C
+                saved_at = msgspec.convert(saved_at_str, datetime)
+            except msgspec.ValidationError as parse_error:
+                logger.warning("Failed to parse saved_at: %s", parse_error)
+                saved_at = datetime.now(timezone.utc)
+            
+            # Try to get paper details from multiple sources
+            paper_response = None
+            
+            # First, check if paper data is already included in saved_data
+            if 'paper' in saved_data and saved_data['paper']:
+                logger.debug("Found paper data in saved_data for %s", paper_id)
+                paper_data = saved_data['paper']
+                
+                paper_response = paper_from_row(paper_data)
+                    
+            else:
+                # Fallback: try to find paper in storage
+                logger.debug("Looking up paper in storage for %s", paper_id)
+                paper_data = await _get_stored_paper(paper_id)
+                if paper_data:
+                    logger.debug("Found paper in storage for %s", paper_id)
+                    paper_response = paper_from_row(paper_data)
+                else:
+                    # Last resort: try to find in memory cache
+                    logger.debug("Looking up paper in memory cache for %s", paper_id)
+                    paper_response = _papers_index.get(paper_id)
+                    if paper_response:
+                        logger.debug("Found paper in memory cache for %s", paper_id)
+                    else:
+                        logger.warning("Paper not found anywhere for %s", paper_id)
+            
+            saved_papers.append(SavedPaperResponse(
+                paper_id=paper_id,
+                saved_at=saved_at,
+                paper=paper_response
+            ))
+        
+        next_cursor = None
+        if has_more and paginated_saved:
+            last = paginated_saved[-1]
+            next_cursor = _encode_cursor(last.get("saved_at", ""), last.get("paper_id") or "")
+        
+        return MsgspecResponse(SavedPapersListResponse(
+            saved_papers=saved_papers,
+            total=total,
+            next_cursor=next_cursor
+        ), schema=models.SavedPapersListResponse)
+        
+    except Exception as e:
+        logger.error(f"Error getting saved papers: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+async def _remove_saved_paper(paper_id: str, user_id: str) -> dict:
+    """Remove a saved paper for a user (shared by both delete routes)."""
+    try:
+        logger.info("Removing saved paper %s for user %s", paper_id, user_id)
+        storage = get_json_storage()
+        success = await asyncio.to_thread(storage.remove_saved_paper, user_id, paper_id)
+        
+        if success:
+            logger.info("Paper removed successfully")
+            return {"success": True, "message": "Paper removed from saved list"}
+        else:
+            logger.warning("Paper not found in saved list")
+            raise HTTPException(status_code=404, detail="Paper not found in saved list")
+            
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error removing saved paper %s: %s", paper_id, e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@papers_router.delete("/saved/remove")
+async def remove_saved_paper_query(
+    paper_id: str = Query(...),
+    user_id: str = Query(default="default"),
+):
+    """Remove a saved paper for a user using query parameters.
+    
+    Requirements: 7.3 - "稍后读" functionality - remove saved papers
+    """
+    return await _remove_saved_paper(paper_id, user_id)
+
+
+@papers_router.delete("/saved/{paper_id:path}")
+async def remove_saved_paper(
+    paper_id: str,
+    user_id: str = Query(default="default"),
+):
+    """Remove a saved paper for a user.
+    
+    Requirements: 7.3 - "稍后读" functionality - remove saved papers
+    """
+    return await _remove_saved_paper(paper_id, user_id)
+
+
+@papers_router.get("/{paper_id}", response_model=None, responses={200: {"model": models.PaperResponse}})
+async def get_paper(paper_id: str, config=Depends(get_config)):
+    """Get a single paper by ID."""
+    try:
+        paper_data = await _get_stored_paper(paper_id)
+        
+        if not paper_data:
+            # Try memory cache
+            cached_paper = _papers_index.get(paper_id)
+            if cached_paper is not None:
+                return MsgspecResponse(cached_paper, schema=models.PaperResponse)
+            raise HTTPException(status_code=404, detail="Paper not found")
+        
+        return MsgspecResponse(paper_from_row(paper_data), schema=models.PaperResponse)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@papers_router.post(
+    "/fetch",
+    response_model=None,
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": models.FetchPapersRequest.model_json_schema()}},
+        }
+    },
+)
+async def fetch_papers(http_request: Request, config=Depends(get_config)):
+    """Fetch new papers from ArXiv and HuggingFace.
+    
+    The body is decoded with msgspec into FetchSpec rather than validated
+    through Pydantic; FetchPapersRequest documents it in the OpenAPI schema.
+    
+    Requirements: 4.1, 4.2 - Fetch papers from multiple sources
+    """
+    try:
+        request = decode_fetch_spec(await http_request.body())
+    except (msgspec.ValidationError, msgspec.DecodeError) as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    
+    try:
+        # Use enhanced fetcher if available, fallback to regular fetcher
+        fetcher = get_arxiv_fetcher(config)
+        
+        # Fetch ArXiv and HuggingFace concurrently in worker threads so the
+        # blocking HTTP calls neither serialize nor stall the event loop
+        arxiv_task = asyncio.to_thread(fetcher.fetch_recent, days=request.days, max_results=request.max_results)
+        if _REGULAR_FETCHER_AVAILABLE:
+            papers, hf_papers = await asyncio.gather(
+                arxiv_task,
+                asyncio.to_thread(get_hf_fetcher().fetch_daily),
+                return_exceptions=True,
+            )
+        else:
+            papers, hf_papers = await arxiv_task, []
+        if isinstance(papers, BaseException):
+            raise papers
+        
+        # HuggingFace fetch is optional
+        if not isinstance(hf_papers, BaseException):
+            papers.extend(hf_papers)
+        
+        # Convert to response format and store in cache, skipping IDs
+        # already cached (first occurrence wins)
+        paper_responses = [paper_to_response(p) for p in papers]
+        for paper in paper_responses:
+            if paper.id not in _papers_index:
+                _papers_index[paper.id] = paper
+                _papers_cache.append(paper)
+        
+        overflow = len(_papers_cache) - _PAPERS_CACHE_SIZE
+        if overflow > 0:
+            for paper in _papers_cache[:overflow]:
+                del _papers_index[paper.id]
+            del _papers_cache[:overflow]
+        
+        return MsgspecResponse({
+            "success": True,
+            "count": len(papers),
+            "papers": paper_responses,
+        })
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@papers_router.post("/score")
+async def score_papers(request: ScorePapersRequest, config=Depends(get_config)):
+    """Score papers using LLM.
+    
+    Requirements: 5.1, 5.2, 6.1 - Score papers and trigger notifications
+    """
+    scoring_api_key = config.get_scoring_api_key()
+    if not scoring_api_key:
+        raise HTTPException(status_code=400, detail="Scoring API key not configured")
+    
+    try:
+        # Fetch papers to score using enhanced fetcher if available
+        fetcher = get_arxiv_fetcher(config)
+        papers = await asyncio.to_thread(fetcher.fetch_recent, days=1, max_results=50)
+        
+        # Score papers using configured provider
+        interests = request.interests or config.user_interests
+        scorer = LLMScorer(
+            api_key=scoring_api_key,
+            interests=interests,
+            threshold=request.threshold,
+            provider=config.get_scoring_provider(),
+            model=config.get_scoring_model()
+        )
+        
+        scored_papers = await scorer.score_batch(papers)
+        filtered_papers = scorer.filter_by_threshold(scored_papers)
+        
+        # Store to JSON storage
+        storage = get_json_storage()
+        await asyncio.to_thread(store_scored_papers, storage, filtered_papers)
+        for sp in filtered_papers:
+            _stored_paper_cache.pop(sp.paper.id, None)
+        
+        # Create notifications for high-score papers
+        now = datetime.now(timezone.utc)
+        for sp in filtered_papers:
+            _push_notification(NotificationResponse(
+                id=f"notif-{sp.paper.id}",
+                paper_id=sp.paper.id,
+                title=sp.paper.title,
+                source=sp.paper.source,
+                score=sp.total_score,
+                timestamp=now,
+            ))
+        
+        return {
+            "success": True,
+            "scored_count": len(scored_papers),
+            "filtered_count": len(filtered_papers),
+            "papers": [
+                {
+                    "id": sp.paper.id,
+                    "title": sp.paper.title,
+                    "total_score": sp.total_score,
+                    "one_liner": sp.one_liner,
+                }
+                for sp in filtered_papers
+            ],
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@papers_router.post("/save")
+async def save_paper(request: SavePaperRequest, config=Depends(get_config)):
+    """Save a paper for later reading.
+    
+    Requirements: 7.3 - "稍后读" functionality
+    """
+    try:
+        logger.info("Saving paper %s for user %s", request.paper_id, request.user_id)
+        storage = get_json_storage()
+        result = await asyncio.to_thread(storage.save_paper_for_later, request.paper_id, request.user_id)
+        
+        # Check if paper was already saved
+        if result.get('already_saved', False):
+            logger.info("Paper %s was already saved", request.paper_id)
+            return SavePaperResponse(success=False, message="Paper already saved")
+        else:
+            logger.info("Paper saved successfully: %s", result)
+            return SavePaperResponse(success=True, message="Paper saved successfully")
+    except Exception as e:
+        logger.error("Error saving paper %s: %s", request.paper_id, e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# Chat endpoints
+
+# Fixed parts of the chat system prompt; the context text can be several KB,
+# so the prompt is assembled with a single join
+_CHAT_SYSTEM_PROMPT_HEAD = "你是一位专业的AI研究助手。用户正在阅读以下论文，请帮助他们理解论文内容。\n\n论文标题: "
+_CHAT_SYSTEM_PROMPT_TAIL = "\n\n请用中文回答用户的问题，保持专业但易于理解。如果问题涉及论文中的具体细节，请尽量引用上下文中的相关内容。"
+
+
+def _chat_system_prompt(title: str, context_source: str, context_text: str) -> str:
+    """Build the system prompt shared by the paper and PDF chat endpoints."""
+    return "".join((
+        _CHAT_SYSTEM_PROMPT_HEAD, title,
+        "\n\n上下文来源: ", context_source, "\n",
+        context_text,
+        _CHAT_SYSTEM_PROMPT_TAIL,
+    ))
+
+
+
+def _chat_messages(system_prompt: str, history: List[ChatTurn], message: str) -> List[Dict[str, str]]:
+    """Build the provider message list: system prompt, history, then the new message."""
+    return [
+        {"role": "system", "content": system_prompt},
+        *[{"role": turn.role, "content": turn.content} for turn in history],
+        {"role": "user", "content": message},
+    ]
+
+
+def _source_note(is_pdf_based: bool) -> str:
+    """Suffix telling the user whether an answer used the PDF or only the abstract."""
+    if is_pdf_based:
+        return "\n\n📄 **本回复基于PDF全文内容**"
+    return "\n\n📝 **本回复仅基于论文摘要，可能存在幻觉**"
+
+# Completions currently in flight, by LLMCache key (which includes the
+# provider endpoint); concurrent identical requests await the first one
+# instead of calling the provider again
+_pending_completions: Dict[str, "asyncio.Task[str]"] = {}
+
+
+def _completion_key(cache: LLMCache, client: AsyncOpenAI, request_kwargs: Dict[str, Any]) -> str:
+    """LLM cache key for a request, ignoring case and spacing in the question.
+    
+    Only the final user turn is normalized; the system prompt, retrieved
+    context and history are hashed as sent, since case and layout there
+    (code, LaTeX, identifiers) can change the answer.
+    """
+    messages = list(request_kwargs["messages"])
+    if messages and messages[-1]["role"] == "user":
+        messages[-1] = {"role": "user", "content": _normalize_query(messages[-1]["content"])}
+    return cache.make_key(request_kwargs["model"], messages, request_kwargs["temperature"], str(client.base_url))
+
+
+async def _cached_completion(client: AsyncOpenAI, request_kwargs: Dict[str, Any]) -> str:
+    """Create a chat completion, reusing the answer to an identical request.
+    
+    Identical requests made while the first is still in flight share its
+    provider call.
+    
+    Args:
+        client: Provider client
+        request_kwargs: Arguments for ``chat.completions.create``
+        
+    Returns:
+        Completion text
+    """
+    cache = get_llm_cache()
+    key = _completion_key(cache, client, request_kwargs)
+    content = cache.get(key)
+    if content is not None:
+        return content
+    
+    # The provider call runs in its own task that every identical request
+    # awaits through shield(), so a caller that is cancelled (client gone,
+    # timeout) leaves it running for the others
+    task = _pending_completions.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_create_completion(client, request_kwargs, cache, key))
+        _pending_completions[key] = task
+        task.add_done_callback(lambda done: _completion_done(key, done))
+    return await asyncio.shield(task)
+
+
+async def _create_completion(
+    client: AsyncOpenAI,
+    request_kwargs: Dict[str, Any],
+    cache: LLMCache,
+    key: str
+) -> str:
+    """Call the provider and cache the completion text.
+    
+    Raises:
+        ValueError: If the provider returned no text
+    """
+    response = await client.chat.completions.create(**request_kwargs)
+    content = response.choices[0].message.content
+    if not content:
+        raise ValueError("The model returned an empty response")
+    cache.set(key, content)
+    return content
+
+
+def _completion_done(key: str, task: "asyncio.Task[str]") -> None:
+    """Forget a finished in-flight completion."""
+    _pending_completions.pop(key, None)
+    # Mark the error retrieved so it is not logged when every caller left
+    if not task.cancelled():
+        task.exception()
+
+
+@chat_router.post("/message", response_model=None, responses={200: {"model": models.ChatMessageResponse}})
+async def send_chat_message(request: ChatMessageRequest, config=Depends(get_config)):
+    """Send a chat message about a paper with RAG support.
+    
+    Requirements: 8.1, 8.2, 8.5, 8.9 - RAG chat with PDF context and fallback
+    """
+    chat_api_key = config.get_chat_api_key()
+    if not chat_api_key:
+        raise HTTPException(status_code=400, detail="Chat API key not configured")
+    
+    try:
+        rag_service = get_rag_service()
+        
+        # Get paper context from JSON storage
+        paper_data = await _get_stored_paper(request.paper_id)
+        
+        if not paper_data:
+            # Try to find in memory cache
+            p = _papers_index.get(request.paper_id)
+            if p is not None:
+                paper_data = {
+                    "title": p.title,
+                    "abstract": p.abstract,
+                    "arxiv_id": p.id
+                }
+        
+        if not paper_data:
+            raise HTTPException(status_code=404, detail="Paper not found")
+        
+        # Get or initialize RAG context
+        rag_context = rag_service.get_context(request.paper_id)
+        if not rag_context:
+            # Initialize context with abstract-only mode
+            rag_context = await rag_service.initialize_context(
+                paper_id=request.paper_id,
+                paper_title=paper_data.get('title', ''),
+                paper_abstract=paper_data.get('abstract', ''),
+                pdf_url=""  # No PDF URL means abstract-only mode
+            )
+        
+        # Try to get enhanced context from PDF if available
+        context_text = paper_data.get('abstract', '')
+        context_source = "摘要"
+        is_pdf_based = False
+        
+        if rag_context.is_pdf_processed:
+            # Search for relevant chunks and use them as context
+            pdf_context_text = await _pdf_context_text(rag_context, request.message, max_tokens=3000)
+            
+            if pdf_context_text is not None:
+                context_text = pdf_context_text
+                context_source = "PDF全文"
+                is_pdf_based = True
+        
+        # Get provider config
+        client, model, provider_kwargs = _chat_target(config.llm_provider, config.llm_model, chat_api_key)
+        
+        # Build conversation with enhanced context
+        system_prompt = _chat_system_prompt(paper_data.get('title', ''), context_source, context_text)
+        
+        messages = _chat_messages(system_prompt, request.history, request.message)
+        
+        # Build request kwargs
+        request_kwargs = {
+            "model": model,
+            "messages": messages,
+            "temperature": 0.7,
+            "max_tokens": 1000,
+            **provider_kwargs,
+        }
+        
+        response_content = await _cached_completion(client, request_kwargs)
+        
+        # Add source indicator to the response
+        response_content += _source_note(is_pdf_based)
+        
+        return MsgspecResponse(ChatMessageResponse(
+            role="assistant",
+            content=response_content,
+            timestamp=datetime.now(timezone.utc),
+        ), schema=models.ChatMessageResponse)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# System message shared by every quick command request
+_QUICK_COMMAND_SYSTEM_MESSAGE = {"role": "system", "content": "你是一位专业的AI研究助手，帮助用户理解和探索学术论文。"}
+
+# Search keywords and prompt templates for each quick command; templates are
+# filled with str.format_map
+_QUICK_COMMAND_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "看公式": ("equation", "formula", "mathematical", "算法", "公式", "方程", "数学", "计算"),
+    "看代码链接": ("code", "github", "implementation", "代码", "实现", "开源", "repository"),
+}
+
+_QUICK_COMMAND_PROMPTS: Dict[str, str] = {
+    "看公式": """请从以下论文内容中提取并解释主要的数学公式或方法论。
+
+上下文来源: {context_source}
+{context_text}
+
+请用中文解释论文中涉及的关键公式和数学概念。如果内容中有具体的公式，请详细解释其含义和作用。""",
+    "看代码链接": """请帮助用户找到这篇论文相关的代码资源。
+
+论文标题: {title}
+论文URL: {url}
+
+上下文来源: {context_source}
+{context_text}
+
+请提供：
+1. 如何在论文页面找到代码链接
+2. 常见的代码托管平台（如GitHub）上搜索该论文代码的建议
+3. 相关的开源实现或复现项目的搜索建议
+4. 如果PDF内容中提到了具体的代码仓库或实现，请特别指出""",
+}
+
+
+@chat_router.post("/quick-command", response_model=None, responses={200: {"model": models.ChatMessageResponse}})
+async def execute_quick_command(request: QuickCommandRequest, config=Depends(get_config)):
+    """Execute a quick command for a paper with PDF content search.
+    
+    Requirements: 8.3, 8.6 - Enhanced quick commands with PDF content
+    """
+    chat_api_key = config.get_chat_api_key()
+    if not chat_api_key:
+        raise HTTPException(status_code=400, detail="Chat API key not configured")
+    
+    try:
+        rag_service = get_rag_service()
+        
+        # Get paper context from JSON storage
+        paper_data = await _get_stored_paper(request.paper_id)
+        
+        if not paper_data:
+            # Try to find in memory cache
+            p = _papers_index.get(request.paper_id)
+            if p is not None:
+                paper_data = {
+                    "title": p.title,
+                    "abstract": p.abstract,
+                    "url": p.url,
+                    "arxiv_id": p.id
+                }
+        
+        if not paper_data:
+            raise HTTPException(status_code=404, detail="Paper not found")
+        
+        # Get RAG context
+        rag_context = rag_service.get_context(request.paper_id)
+        
+        # Prepare command-specific search and context
+        context_text = paper_data.get('abstract', '')
+        context_source = "摘要"
+        is_pdf_based = False
+        
+        if rag_context and rag_context.is_pdf_processed:
+            # Perform targeted search based on command
+            keywords = _QUICK_COMMAND_KEYWORDS.get(request.command, ())
+            search_results = await _cached_rag_search(request.paper_id, keywords, top_k=3) if keywords else []
+            
+            if search_results:
+                # Build enhanced context from search results
+                context_text = "\n".join([
+                    f"论文标题: {paper_data.get('title', '')}",
+                    f"论文摘要: {paper_data.get('abstract', '')}",
+                    "\n相关PDF内容:",
+                    *(f"\n[第{r.chunk.page_number}页] {r.chunk.content}" for r in search_results),
+                ])
+                context_source = "PDF全文搜索"
+                is_pdf_based = True
+        
+        # Get provider config
+        client, model, provider_kwargs = _chat_target(config.llm_provider, config.llm_model, chat_api_key)
+        
+        # Build command-specific prompt
+        prompt_template = _QUICK_COMMAND_PROMPTS.get(request.command)
+        if prompt_template is None:
+            raise HTTPException(status_code=400, detail=f"Unknown command: {request.command}")
+        prompt = prompt_template.format_map({
+            "title": paper_data.get('title', ''),
+            "url": paper_data.get('url', ''),
+            "context_source": context_source,
+            "context_text": context_text,
+        })
+        
+        # Build request kwargs
+        request_kwargs = {
+            "model": model,
+            "messages": [
+                _QUICK_COMMAND_SYSTEM_MESSAGE,
+                {"role": "user", "content": prompt},
+            ],
+            "temperature": 0.7,
+            "max_tokens": 1000,
+            **provider_kwargs,
+        }
+        
+        response_content = await _cached_completion(client, request_kwargs)
+        
+        # Add source indicator to the response
+        response_content += _source_note(is_pdf_based)
+        
+        return MsgspecResponse(ChatMessageResponse(
+            role="assistant",
+            content=response_content,
+            timestamp=datetime.now(timezone.utc),
+        ), schema=models.ChatMessageResponse)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# Notifications endpoints
+@notifications_router.get("/", response_model=None, responses={200: {"model": models.NotificationListResponse}})
+async def get_notifications():
+    """Get pending notifications.
+    
+    Requirements: 6.1, 6.5 - Bubble notifications for high-score papers
+    """
+    return MsgspecResponse(NotificationListResponse(notifications=list(_notification_queue.values())), schema=models.NotificationListResponse)
+
+
+@notifications_router.delete("/{notification_id}")
+async def dismiss_notification(notification_id: str):
+    """Dismiss a notification.
+    
+    Requirements: 6.4 - Dismiss notifications
+    """
+    _notification_queue.pop(notification_id, None)
+    return {"success": True}
+
+
+@notifications_router.delete("/")
+async def clear_notifications():
+    """Clear all notifications."""
+    _notification_queue.clear()
+    return {"success": True}
+
+
+# PDF processing endpoints
+@pdf_router.post("/process", response_model=PDFProcessingResponse)
+async def process_pdf(request: PDFProcessingRequest, config=Depends(get_config)):
+    """Start PDF processing for a paper with error handling and fallback.
+    
+    Requirements: 8.1, 8.2, 8.3, 8.9 - PDF download, processing, vectorization, and fallback
+    """
+    try:
+        rag_service = get_rag_service()
+        
+        # Get paper info from storage
+        paper_data = await _get_stored_paper(request.paper_id)
+        
+        if not paper_data:
+            # Try to find in memory cache
+            p = _papers_index.get(request.paper_id)
+            if p is not None:
+                paper_data = {
+                    "title": p.title,
+                    "abstract": p.abstract,
+                    "arxiv_id": p.id
+                }
+        
+        if not paper_data:
+            raise HTTPException(status_code=404, detail="Paper not found")
+        
+        # Initialize RAG context (always succeeds with abstract)
+        await rag_service.initialize_context(
+            paper_id=request.paper_id,
+            paper_title=paper_data.get("title", ""),
+            paper_abstract=paper_data.get("abstract", ""),
+            pdf_url=request.pdf_url
+        )
+        _invalidate_pdf_search_cache(request.paper_id)
+        
+        # Attempt PDF processing with error handling
+        try:
+            success = await rag_service.process_pdf_if_needed(request.paper_id)
+            
+            if success:
+                # Get final status
+                status = rag_service.get_processing_status(request.paper_id)
+                return PDFProcessingResponse(
+                    success=True,
+                    message="PDF processing completed successfully",
+                    chunks_count=status.get("total_chunks", 0)
+                )
+            else:
+                # PDF processing failed, but context is still available with abstract
+                return PDFProcessingResponse(
+                    success=False,
+                    message="PDF processing failed, but abstract-based chat is available"
+                )
+                
+        except Exception as pdf_error:
+            logger.warning(f"PDF processing failed for paper {request.paper_id}: {pdf_error}")
+            
+            # Return graceful failure - abstract-based chat is still available
+            return PDFProcessingResponse(
+                success=False,
+                message=f"PDF processing failed: {str(pdf_error)}. Abstract-based chat is still available."
+            )
+            
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"PDF processing request failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _pdf_search_response(msgpack: bool, body: PDFSearchResponse):
+    """Encode a PDF search response as MessagePack or JSON."""
+    if msgpack:
+        return MsgpackResponse(body)
+    return MsgspecResponse(body, schema=models.PDFSearchResponse)
+
+
+@pdf_router.post(
+    "/search",
+    response_model=None,
+    responses={200: {"model": models.PDFSearchResponse, "content": {MSGPACK_MEDIA_TYPE: {}}}},
+)
+async def search_pdf_content(
+    request: PDFSearchRequest,
+    config=Depends(get_config),
+    msgpack: bool = Depends(wants_msgpack),
+):
+    """Search within PDF content using text search with error handling.
+    
+    Responds with MessagePack instead of JSON when the client sends
+    ``Accept: application/msgpack``.
+    
+    Requirements: 8.4, 8.9 - Vector search API with error handling
+    """
+    try:
+        rag_service = get_rag_service()
+        
+        # Check if paper exists and is processed
+        context = rag_service.get_context(request.paper_id)
+        if not context:
+            raise HTTPException(status_code=404, detail="Paper context not found")
+        
+        if not context.is_pdf_processed:
+            raise HTTPException(
+                status_code=400, 
+                detail="PDF not processed for this paper. Only abstract-based search is available."
+            )
+        
+        # Repeat queries on the same paper are served from the LRU cache
+        cache_key = (request.paper_id, _normalize_query(request.query), request.search_type, request.top_k)
+        search_results = _pdf_search_cache.get(cache_key)
+        if search_results is not None:
+            _pdf_search_cache.move_to_end(cache_key)
+            return _pdf_search_response(msgpack, PDFSearchResponse(
+                paper_id=request.paper_id,
+                query=request.query,
+                search_type=request.search_type,
+                results=search_results,
+                total_results=len(search_results)
+            ))
+        
+        # Perform search based on type with error handling
+        try:
+            if request.search_type is SearchType.SEMANTIC:
+                # Use text-based search (BM25-like scoring)
+                results = await _run_search(rag_service.search_semantic, request.paper_id, request.query, request.top_k)
+            elif request.search_type is SearchType.KEYWORD:
+                # Convert query to keywords
+                keywords = request.query.split()
+                results = await _run_search(rag_service.search_keyword, request.paper_id, keywords, request.top_k)
+            else:
+                raise HTTPException(status_code=400, detail="Invalid search type. Use 'semantic' or 'keyword'")
+            
+            # Convert results to API response format. Chunk content is already
+            # a str held by the text store, so it is passed through by reference
+            # and msgspec writes it out without an intermediate copy.
+            search_results = [
+                PDFSearchResult(
+                    chunk_id=result.chunk.id,
+                    content=result.chunk.content,
+                    page_number=result.chunk.page_number,
+                    relevance_score=result.relevance_score
+                )
+                for result in results
+            ]
+            _pdf_search_cache[cache_key] = search_results
+            if len(_pdf_search_cache) > _PDF_SEARCH_CACHE_SIZE:
+                _pdf_search_cache.popitem(last=False)
+            
+            return _pdf_search_response(msgpack, PDFSearchResponse(
+                paper_id=request.paper_id,
+                query=request.query,
+                search_type=request.search_type,
+                results=search_results,
+                total_results=len(search_results)
+            ))
+            
+        except Exception as search_error:
+            logger.error(f"PDF search failed for paper {request.paper_id}: {search_error}")
+            
+            # Return empty results with error indication
+            return _pdf_search_response(msgpack, PDFSearchResponse(
+                paper_id=request.paper_id,
+                query=request.query,
+                search_type=request.search_type,
+                results=[],
+                total_results=0
+            ))
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"PDF search request failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+async def _build_pdf_chat_request(request: PDFChatRequest, config) -> Tuple[AsyncOpenAI, Dict[str, Any], bool]:
+    """Retrieve PDF context and build the completion request for a PDF chat.
+    
+    Returns:
+        Tuple of (client, chat.completions.create kwargs, whether the
+        context came from the PDF rather than the abstract)
+    """
+    chat_api_key = config.get_chat_api_key()
+    if not chat_api_key:
+        raise HTTPException(status_code=400, detail="Chat API key not configured")
+    
+    rag_service = get_rag_service()
+    
+    # Get RAG context
+    context = rag_service.get_context(request.paper_id)
+    if not context:
+        raise HTTPException(status_code=404, detail="Paper context not found")
+    
+    # Determine context source and search for relevant chunks
+    context_text = context.paper_abstract
+    context_source = "摘要"
+    is_pdf_based = False
+    
+    if context.is_pdf_processed:
+        try:
+            # Search for relevant chunks and format them as context
+            pdf_context_text = await _pdf_context_text(context, request.message, request.max_context_tokens)
+            
+            if pdf_context_text is not None:
+                context_text = pdf_context_text
+                context_source = "PDF全文"
+                is_pdf_based = True
+                
+        except Exception as search_error:
+            logger.warning(f"PDF search failed for paper {request.paper_id}: {search_error}")
+            # Keep is_pdf_based = False for abstract-based response
+    
+    # Get provider config
+    client, model, provider_kwargs = _chat_target(config.llm_provider, config.llm_model, chat_api_key)
+    
+    # Build system prompt with context
+    system_prompt = _chat_system_prompt(context.paper_title, context_source, context_text)
+    
+    # Build conversation
+    messages = _chat_messages(system_prompt, request.history, request.message)
+    
+    # Build request
+    request_kwargs = {
+        "model": model,
+        "messages": messages,
+        "temperature": 0.7,
+        "max_tokens": 1000,
+        **provider_kwargs,
+    }
+    
+    return client, request_kwargs, is_pdf_based
+
+
+@pdf_router.post("/chat", response_model=None, responses={200: {"model": models.ChatMessageResponse}})
+async def chat_with_pdf(request: PDFChatRequest, config=Depends(get_config)):
+    """Chat with PDF content using RAG with fallback to abstract-based chat.
+    
+    Requirements: 8.5, 8.9 - PDF-based chat API with fallback behavior
+    """
+    # Answer repeated questions before any search, prompt or client work
+    answer_key = (
+        request.paper_id,
+        _normalize_query(request.message),
+        tuple((msg.role, msg.content) for msg in request.history),
+        request.max_context_tokens,
+        config.llm_provider,
+        config.llm_model,
+    )
+    cached = _pdf_chat_answer_cache.get(answer_key)
+    if cached is not None and cached[0] > time.monotonic() and get_rag_service().get_context(request.paper_id):
+        _pdf_chat_answer_cache.move_to_end(answer_key)
+        return MsgspecResponse(ChatMessageResponse(
+            role="assistant",
+            content=cached[1],
+            timestamp=datetime.now(timezone.utc),
+        ), schema=models.ChatMessageResponse)
+    
+    try:
+        client, request_kwargs, is_pdf_based = await _build_pdf_chat_request(request, config)
+        
+        # Get response
+        response_content = await _cached_completion(client, request_kwargs)
+        
+        # Add source indicator to the response
+        response_content += _source_note(is_pdf_based)
+        
+        _pdf_chat_answer_cache[answer_key] = (time.monotonic() + get_llm_cache().ttl, response_content)
+        _pdf_chat_answer_cache.move_to_end(answer_key)
+        if len(_pdf_chat_answer_cache) > _PDF_CHAT_ANSWER_CACHE_SIZE:
+            _pdf_chat_answer_cache.popitem(last=False)
+        
+        return MsgspecResponse(ChatMessageResponse(
+            role="assistant",
+            content=response_content,
+            timestamp=datetime.now(timezone.utc),
+        ), schema=models.ChatMessageResponse)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"PDF chat failed: {e}")
+        # Return a graceful error message
+        return MsgspecResponse(ChatMessageResponse(
+            role="assistant",
+            content=f"抱歉，聊天服务暂时不可用：{str(e)}。请稍后重试。",
+            timestamp=datetime.now(timezone.utc),
+        ), schema=models.ChatMessageResponse)
+
+
+def _sse_event(data: Dict[str, Any]) -> bytes:
+    """Encode one server-sent event."""
+    return b"data: " + orjson.dumps(data) + b"\n\n"
+
+
+@pdf_router.post("/chat/stream", response_class=StreamingResponse)
+async def chat_with_pdf_stream(request: PDFChatRequest, config=Depends(get_config)):
+    """Stream a PDF chat answer as server-sent events.
+    
+    Same request and context handling as /chat. Each event carries
+    ``{"delta": text}``; the source indicator is sent as the last delta,
+    followed by ``{"done": true}``. A failure mid-stream is reported as
+    ``{"error": message}``.
+    """
+    client, request_kwargs, is_pdf_based = await _build_pdf_chat_request(request, config)
+    
+    async def events():
+        cache = get_llm_cache()
+        key = _completion_key(cache, client, request_kwargs)
+        cached = cache.get(key)
+        try:
+            if cached is not None:
+                yield _sse_event({"delta": cached})
+            else:
+                parts = []
+                stream = await client.chat.completions.create(**request_kwargs, stream=True)
+                async for chunk in stream:
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if delta:
+                        parts.append(delta)
+                        yield _sse_event({"delta": delta})
+                if parts:
+                    cache.set(key, "".join(parts))
+            yield _sse_event({"delta": _source_note(is_pdf_based)})
+            yield _sse_event({"done": True})
+        except Exception as e:
+            logger.error(f"PDF chat stream failed: {e}")
+            yield _sse_event({"error": f"抱歉，聊天服务暂时不可用：{str(e)}。请稍后重试。"})
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@pdf_router.get("/status", response_model=PDFStatusResponse)
+async def get_pdf_status(paper_id: str):
+    """Get PDF processing status for a paper.
+    
+    Requirements: 8.1 - PDF processing status display
+    """
+    try:
+        logger.debug("Getting PDF status for paper_id: '%s'", paper_id)
+        rag_service = get_rag_service()
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Available contexts: %s", list(rag_service._contexts.keys()))
+        
+        status = rag_service.get_processing_status(paper_id)
+        logger.debug("Retrieved status: %s", status)
+        
+        return PDFStatusResponse(
+            paper_id=paper_id,
+            is_downloading=status.get("is_downloading", False),
+            is_processing=status.get("is_processing", False),
+            is_complete=status.get("is_complete", False),
+            progress=status.get("progress", 0.0),
+            error_message=status.get("error_message"),
+            total_chunks=status.get("total_chunks", 0),
+            processed_chunks=status.get("processed_chunks", 0),
+            pdf_processed=status.get("pdf_processed", False),
+            has_context=status.get("has_context", False)
+        )
+        
+    except Exception as e:
+        logger.error(f"Failed to get PDF status for paper_id '{paper_id}': {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# How often the status websocket checks for progress
+_PDF_STATUS_PUSH_INTERVAL = 0.5
+
+# Seconds the status websocket stays open while the paper has no context
+# and nothing is downloading or processing for it
+_PDF_STATUS_IDLE_TIMEOUT = 10.0
+
+
+@pdf_router.websocket("/ws/status/{paper_id:path}")
+async def pdf_status_websocket(websocket: WebSocket, paper_id: str):
+    """Push PDF processing status for a paper as it changes.
+    
+    Sends the same fields as GET /status, once on connect and then whenever
+    they change, and closes once processing has finished or failed, or
+    after _PDF_STATUS_IDLE_TIMEOUT seconds with no job for the paper. Lets
+    the UI follow a job without polling over HTTP.
+    """
+    await websocket.accept()
+    rag_service = get_rag_service()
+    last_status = None
+    idle_since = None
+    # Waited on between polls so a client that leaves ends the loop even
+    # when there is nothing to send
+    receiver = asyncio.ensure_future(websocket.receive())
+    try:
+        while True:
+            status = rag_service.get_processing_status(paper_id)
+            if status != last_status:
+                await websocket.send_text(orjson.dumps(status).decode())
+                last_status = status
+            if status["is_complete"] or status["error_message"]:
+                break
+            
+            if status["has_context"] or status["is_downloading"] or status["is_processing"]:
+                idle_since = None
+            elif idle_since is None:
+                idle_since = time.monotonic()
+            elif time.monotonic() - idle_since >= _PDF_STATUS_IDLE_TIMEOUT:
+                break
+            
+            done, _ = await asyncio.wait({receiver}, timeout=_PDF_STATUS_PUSH_INTERVAL)
+            if done:
+                if receiver.result()["type"] == "websocket.disconnect":
+                    return
+                # Anything the client sends is ignored
+                receiver = asyncio.ensure_future(websocket.receive())
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        receiver.cancel()
@@ -1,125 +1,215 @@
-"""FastAPI server for Paper Pal backend.
-
-Requirements: 6.1, 7.2, 8.2
-"""
-
-import logging
-from contextlib import asynccontextmanager
-from datetime import datetime, timezone
-from typing import List
-
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-
-from .routes import papers_router, chat_router, notifications_router, pdf_router, add_notification
-from ..scheduler import get_scheduler
-from ..models import ScoredPaper
-from ..config import load_config
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-logger = logging.getLogger(__name__)
-
-
-def on_high_score_papers(papers: List[ScoredPaper]):
-    """Callback when NEW high-score papers are found.
-    
-    Papers passed here are already filtered to be NEW (not in storage before).
-    """
-    if papers:
-        logger.info(f"Creating notifications for {len(papers)} NEW high-score papers")
-        for paper in papers:
-            add_notification(
-                paper_id=paper.paper.id,
-                title=paper.paper.title,
-                source=paper.paper.source,
-                score=paper.total_score
-            )
-    else:
-        logger.info("No new high-score papers to notify")
-
-
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Application lifespan manager."""
-    # Startup
-    config = load_config()
-    logger.info("Paper Pal API starting...")
-    logger.info(f"Auto fetch enabled: {config.auto_fetch_enabled}")
-    logger.info(f"Fetch interval: {config.fetch_interval_minutes} minutes")
-    logger.info(f"Score threshold: {config.score_threshold}")
-    
-    # Start scheduler
-    scheduler = get_scheduler()
-    scheduler.set_notification_callback(on_high_score_papers)
-    scheduler.start()
-    
-    yield
-    
-    # Shutdown
-    logger.info("Paper Pal API shutting down...")
-    scheduler.stop()
-
-
-def create_app() -> FastAPI:
-    """Create and configure the FastAPI application."""
-    app = FastAPI(
-        title="Paper Pal API",
-        description="Backend API for Paper Pal - AI Paper Reading Assistant",
-        version="1.0.0",
-        lifespan=lifespan,
-    )
-    
-    # Configure CORS for Electron app
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],  # Allow all origins for Electron
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
-    
-    # Include routers
-    app.include_router(papers_router)
-    app.include_router(chat_router)
-    app.include_router(notifications_router)
-    app.include_router(pdf_router)
-    
-    @app.get("/")
-    async def root():
-        """Root endpoint."""
-        config = load_config()
-        scheduler = get_scheduler()
-        return {
-            "message": "Paper Pal API",
-            "version": "1.0.0",
-            "scheduler": {
-                "running": scheduler.is_running,
-                "last_fetch": scheduler.last_fetch_time.isoformat() if scheduler.last_fetch_time else None,
-                "fetch_count": scheduler.fetch_count,
-                "interval_minutes": config.fetch_interval_minutes,
-            }
-        }
-    
-    @app.get("/health")
-    async def health():
-        """Health check endpoint."""
-        scheduler = get_scheduler()
-        return {
-            "status": "healthy",
-            "scheduler_running": scheduler.is_running
-        }
-    
-    return app
-
-
-# Create app instance
-app = create_app()
-
-
-if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001)
+"""FastAPI server for Paper Pal backend.
+
+Requirements: 6.1, 7.2, 8.2
+"""
+
+import logging
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import orjson
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response
+
+from .responses import ORJSONResponse
+from .routes import (
+    papers_router,
+    chat_router,
+    notifications_router,
+    pdf_router,
+    add_notification,
+    close_openai_clients,
+)
+from ..scheduler import get_scheduler
+from ..models import ScoredPaper
+from ..config import load_config
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Maximum request body size per path. Chat endpoints carry the conversation
+# history, so oversized bodies are refused from Content-Length before FastAPI
+# reads and validates them.
+MAX_BODY_BYTES: Dict[str, int] = {
+    "/api/chat/message": 256 * 1024,
+    "/api/chat/quick-command": 64 * 1024,
+    "/api/pdf/chat": 256 * 1024,
+    "/api/pdf/chat/stream": 256 * 1024,
+    "/api/pdf/search": 64 * 1024,
+}
+
+
+class BodySizeLimitMiddleware:
+    """ASGI middleware rejecting bodies over MAX_BODY_BYTES with 413."""
+
+    def __init__(self, app, limits: Dict[str, int]):
+        self.app = app
+        self.limits = limits
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            limit = self.limits.get(scope["path"].rstrip("/"))
+            if limit is not None:
+                for name, value in scope["headers"]:
+                    if name == b"content-length":
+                        if value.isdigit() and int(value) > limit:
+                            response = ORJSONResponse(
+                                {"detail": f"Request body too large (limit {limit} bytes)"},
+                                status_code=413,
+                            )
+                            await response(scope, receive, send)
+                            return
+                        break
+        await self.app(scope, receive, send)
+
+
+def on_high_score_papers(papers: List[ScoredPaper]):
+    """Callback when NEW high-score papers are found.
+    
+    Papers passed here are already filtered to be NEW (not in storage before).
+    """
+    if papers:
+        logger.info(f"Creating notifications for {len(papers)} NEW high-score papers")
+        for paper in papers:
+            add_notification(
+                paper_id=paper.paper.id,
+                title=paper.paper.title,
+                source=paper.paper.source,
+                score=paper.total_score
+            )
+    else:
+        logger.info("No new high-score papers to notify")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan manager."""
+    # Startup
+    config = load_config()
+    logger.info("Paper Pal API starting...")
+    logger.info(f"Auto fetch enabled: {config.auto_fetch_enabled}")
+    logger.info(f"Fetch interval: {config.fetch_interval_minutes} minutes")
+    logger.info(f"Score threshold: {config.score_threshold}")
+    
+    # Start scheduler
+    scheduler = get_scheduler()
+    scheduler.set_notification_callback(on_high_score_papers)
+    scheduler.start()
+    
+    yield
+    
+    # Shutdown
+    logger.info("Paper Pal API shutting down...")
+    scheduler.stop()
+    await close_openai_clients()
+
+
+def _install_cached_openapi(app: FastAPI) -> None:
+    """Serve /openapi.json from bytes encoded once, on first request.
+    
+    FastAPI caches the schema dict but re-encodes it on every hit. Encoding
+    lazily (rather than in create_app) keeps deferred model schemas from
+    being built at startup.
+    """
+    openapi_url = app.openapi_url
+    app.router.routes = [r for r in app.router.routes if getattr(r, "path", None) != openapi_url]
+    openapi_body: Optional[bytes] = None
+    
+    @app.get(openapi_url, include_in_schema=False)
+    async def openapi_json():
+        nonlocal openapi_body
+        if openapi_body is None:
+            openapi_body = orjson.dumps(app.openapi())
+        return Response(openapi_body, media_type="application/json")
+
+
+def create_app() -> FastAPI:
+    """Create and configure the FastAPI application."""
+    app = FastAPI(
+        title="Paper Pal API",
+        description="Backend API for Paper Pal - AI Paper Reading Assistant",
+        version="1.0.0",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
+    
+    # Added before CORS so rejected requests still get CORS headers
+    app.add_middleware(BodySizeLimitMiddleware, limits=MAX_BODY_BYTES)
+    
+    # Configure CORS for Electron app
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],  # Allow all origins for Electron
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    
+    # Compress larger bodies (PDF search results, chat answers, paper lists).
+    # Starlette leaves text/event-stream alone, so /pdf/chat/stream still
+    # flushes each event.
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+    
+    # Include routers
+    app.include_router(papers_router)
+    app.include_router(chat_router)
+    app.include_router(notifications_router)
+    app.include_router(pdf_router)
+    _install_cached_openapi(app)
+    
+    @app.get("/")
+    async def root():
+        """Root endpoint."""
+        config = load_config()
+        scheduler = get_scheduler()
+        return {
+            "message": "Paper Pal API",
+            "version": "1.0.0",
+            "scheduler": {
+                "running": scheduler.is_running,
+                "last_fetch": scheduler.last_fetch_time.isoformat() if scheduler.last_fetch_time else None,
+                "fetch_count": scheduler.fetch_count,
+                "interval_minutes": config.fetch_interval_minutes,
+            }
+        }
+    
+    @app.get("/health")
+    async def health():
+        """Health check endpoint."""
+        scheduler = get_scheduler()
+        return {
+            "status": "healthy",
+            "scheduler_running": scheduler.is_running
+        }
+    
+    return app
+
+
+# Create app instance
+app = create_app()
+
+
+if __name__ == "__main__":
+    import importlib.util
+    import uvicorn
+    
+    # Prefer the libuv event loop and httptools parser when installed
+    # (uvloop has no Windows build). A single worker is kept on purpose: the
+    # scheduler and notification queue live in this process. Per-request
+    # access logs are off; the UI polls several endpoints continuously and
+    # the routes log what matters themselves.
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8001,
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools" if importlib.util.find_spec("httptools") else "h11",
+        access_log=False,
+    )
@@ -1,288 +1,559 @@
-"""JSON file-based storage for Paper Pal.
-
-Simple file-based storage using JSON files instead of database.
-"""
-
-import json
-import os
-import threading
-from datetime import datetime, timezone
-from pathlib import Path
-from typing import List, Optional
-
-
-# Default data directory
-DATA_DIR = Path(__file__).parent.parent.parent / "data"
-
-# Simple thread lock for file operations
-_file_lock = threading.Lock()
-
-
-class JsonStorage:
-    """JSON file-based storage for papers and user data."""
-    
-    def __init__(self, data_dir: Optional[str] = None):
-        """Initialize JSON storage.
-        
-        Args:
-            data_dir: Directory to store JSON files (default: backend/data)
-        """
-        self._data_dir = Path(data_dir) if data_dir else DATA_DIR
-        self._data_dir.mkdir(parents=True, exist_ok=True)
-        
-        # File paths
-        self._papers_file = self._data_dir / "papers.json"
-        self._saved_papers_file = self._data_dir / "saved_papers.json"
-        self._config_file = self._data_dir / "config.json"
-        
-        # Initialize files if they don't exist
-        self._init_files()
-    
-    def _init_files(self):
-        """Initialize JSON files if they don't exist."""
-        if not self._papers_file.exists():
-            self._write_json(self._papers_file, [])
-        if not self._saved_papers_file.exists():
-            self._write_json(self._saved_papers_file, [])
-        if not self._config_file.exists():
-            self._write_json(self._config_file, {})
-    
-    def _read_json(self, file_path: Path) -> any:
-        """Read JSON file with thread locking."""
-        with _file_lock:
-            if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            return None
-    
-    def _write_json(self, file_path: Path, data: any):
-        """Write JSON file with thread locking."""
-        with _file_lock:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2, default=str)
-    
-    # Papers operations
-    def insert_paper(self, paper_data: dict) -> dict:
-        """Insert a paper into storage."""
-        papers = self._read_json(self._papers_file) or []
-        
-        # Add timestamp if not present
-        if 'created_at' not in paper_data:
-            paper_data['created_at'] = datetime.now(timezone.utc).isoformat()
-        
-        papers.append(paper_data)
-        self._write_json(self._papers_file, papers)
-        return paper_data
-    
-    def upsert_paper(self, paper_data: dict) -> dict:
-        """Insert or update a paper in storage.
-        
-        Uses arxiv_id as the unique key for upsert.
-        """
-        papers = self._read_json(self._papers_file) or []
-        arxiv_id = paper_data.get('arxiv_id')
-        
-        # Find existing paper
-        existing_idx = None
-        for i, p in enumerate(papers):
-            if p.get('arxiv_id') == arxiv_id:
-                existing_idx = i
-                break
-        
-        # Add/update timestamp
-        paper_data['updated_at'] = datetime.now(timezone.utc).isoformat()
-        if 'created_at' not in paper_data:
-            paper_data['created_at'] = paper_data['updated_at']
-        
-        if existing_idx is not None:
-            # Update existing
-            papers[existing_idx] = paper_data
-        else:
-            # Insert new
-            papers.append(paper_data)
-        
-        self._write_json(self._papers_file, papers)
-        return paper_data
-    
-    def get_papers(
-        self,
-        limit: int = 50,
-        offset: int = 0,
-        min_score: Optional[float] = None
-    ) -> List[dict]:
-        """Get papers from storage.
-        
-        Args:
-            limit: Maximum number of papers to return
-            offset: Number of papers to skip
-            min_score: Minimum total score filter
-            
-        Returns:
-            List of paper dictionaries
-        """
-        papers = self._read_json(self._papers_file) or []
-        
-        # Filter by min_score if specified
-        if min_score is not None:
-            papers = [p for p in papers if (p.get('total_score') or 0) >= min_score]
-        
-        # Sort by total_score descending
-        papers.sort(key=lambda x: x.get('total_score') or 0, reverse=True)
-        
-        # Apply pagination
-        return papers[offset:offset + limit]
-    
-    def get_paper_by_id(self, paper_id: str) -> Optional[dict]:
-        """Get a paper by its ID (arxiv_id).
-        
-        Args:
-            paper_id: The paper's arxiv_id
-            
-        Returns:
-            Paper dictionary or None if not found
-        """
-        papers = self._read_json(self._papers_file) or []
-        
-        for paper in papers:
-            if paper.get('arxiv_id') == paper_id or paper.get('id') == paper_id:
-                return paper
-        
-        return None
-    
-    def get_scored_papers(self, min_score: float = 0.0, limit: int = 50) -> List[dict]:
-        """Get scored papers above a minimum score threshold."""
-        return self.get_papers(limit=limit, min_score=min_score)
-    
-    def get_paper_by_arxiv_id(self, arxiv_id: str) -> Optional[dict]:
-        """Get a paper by its ArXiv ID."""
-        return self.get_paper_by_id(arxiv_id)
-    
-    # Saved papers operations
-    def save_paper(self, user_id: str, paper_id: str) -> dict:
-        """Save a paper for later reading."""
-        saved = self._read_json(self._saved_papers_file) or []
-        
-        # Check if already saved
-        for s in saved:
-            if s.get('user_id') == user_id and s.get('paper_id') == paper_id:
-                return {**s, 'already_saved': True}  # Mark as already saved
-        
-        entry = {
-            'user_id': user_id,
-            'paper_id': paper_id,
-            'saved_at': datetime.now(timezone.utc).isoformat(),
-            'already_saved': False
-        }
-        saved.append(entry)
-        self._write_json(self._saved_papers_file, saved)
-        return entry
-    
-    def save_paper_for_later(self, paper_id: str, user_id: str = "default") -> dict:
-        """Save a paper for later reading."""
-        return self.save_paper(user_id, paper_id)
-    
-    def get_saved_papers(self, user_id: str) -> List[dict]:
-        """Get saved papers for a user."""
-        saved = self._read_json(self._saved_papers_file) or []
-        papers = self._read_json(self._papers_file) or []
-        
-        # Filter by user_id and join with paper data
-        result = []
-        for s in saved:
-            if s.get('user_id') == user_id:
-                paper_id = s.get('paper_id')
-                
-                # Try to find paper by multiple ID fields
-                paper = None
-                for p in papers:
-                    if (p.get('arxiv_id') == paper_id or 
-                        p.get('id') == paper_id or
-                        p.get('paper_id') == paper_id):
-                        paper = p
-                        break
-                
-                if paper:
-                    result.append({**s, 'paper': paper})
-                else:
-                    # Include saved entry even if paper not found
-                    result.append(s)
-        
-        # Sort by saved_at timestamp in descending order (newest first)
-        result.sort(key=lambda x: x.get('saved_at', ''), reverse=True)
-        
-        return result
-    
-    def remove_saved_paper(self, user_id: str, paper_id: str) -> bool:
-        """Remove a saved paper for a user.
-        
-        Args:
-            user_id: The user ID
-            paper_id: The paper ID to remove
-            
-        Returns:
-            True if paper was removed, False if not found
-        """
-        saved = self._read_json(self._saved_papers_file) or []
-        
-        # Find and remove the saved paper
-        original_length = len(saved)
-        saved = [s for s in saved if not (s.get('user_id') == user_id and s.get('paper_id') == paper_id)]
-        
-        if len(saved) < original_length:
-            self._write_json(self._saved_papers_file, saved)
-            return True
-        
-        return False
-    
-    # Config operations
-    def get_user_config(self, user_id: str) -> Optional[dict]:
-        """Get user configuration."""
-        configs = self._read_json(self._config_file) or {}
-        return configs.get(user_id)
-    
-    def upsert_user_config(self, user_id: str, interests: list, threshold: float) -> dict:
-        """Update or insert user configuration."""
-        configs = self._read_json(self._config_file) or {}
-        configs[user_id] = {
-            'user_id': user_id,
-            'interests': interests,
-            'threshold': threshold,
-            'updated_at': datetime.now(timezone.utc).isoformat()
-        }
-        self._write_json(self._config_file, configs)
-        return configs[user_id]
-    
-    # Utility methods
-    def clear_all(self):
-        """Clear all data (for testing)."""
-        self._write_json(self._papers_file, [])
-        self._write_json(self._saved_papers_file, [])
-        self._write_json(self._config_file, {})
-    
-    def get_stats(self) -> dict:
-        """Get storage statistics."""
-        papers = self._read_json(self._papers_file) or []
-        saved = self._read_json(self._saved_papers_file) or []
-        
-        scored_papers = [p for p in papers if p.get('total_score') is not None]
-        
-        return {
-            'total_papers': len(papers),
-            'scored_papers': len(scored_papers),
-            'saved_papers': len(saved),
-            'data_dir': str(self._data_dir)
-        }
-
-
-# Singleton instance
-_storage: Optional[JsonStorage] = None
-
-
-def get_json_storage(data_dir: Optional[str] = None) -> JsonStorage:
-    """Get or create the JSON storage singleton."""
-    global _storage
-    
-    if _storage is None:
-        _storage = JsonStorage(data_dir)
-    
-    return _storage
+"""JSON file-based storage for Paper Pal.
+
+Simple file-based storage using JSON files instead of database. Files are
+parsed and written with orjson, which indents in the same pass as it
+encodes; the on-disk format is unchanged, indented UTF-8 JSON.
+
+Parsed file contents are kept in memory and reused while the file's mtime
+and size are unchanged. Writes update the in-memory copy and mark the file
+dirty; a burst of writes is coalesced into one write per file by flush(),
+which runs FLUSH_INTERVAL after the first pending write, after every
+FLUSH_AFTER_WRITES writes, and at interpreter exit.
+"""
+
+import atexit
+import bisect
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import orjson
+
+
+# Default data directory
+DATA_DIR = Path(__file__).parent.parent.parent / "data"
+
+# Seconds a write may stay in memory before it is flushed to disk
+FLUSH_INTERVAL = 1.0
+
+# Flush immediately once this many writes are pending
+FLUSH_AFTER_WRITES = 100
+
+logger = logging.getLogger(__name__)
+
+# Indented like json.dump(indent=2); unknown types (e.g. Path) are written
+# with default=str at the call site, as json.dump(default=str) did
+_JSON_OPTIONS = orjson.OPT_INDENT_2
+
+
+# (unix second, ISO string) of the last _now_iso() call
+_iso_cache: Tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO string, at one-second resolution.
+    
+    Formatting is cached per second. Used for created_at/updated_at
+    bookkeeping; saved_at orders the saved list, so it keeps full
+    precision.
+    """
+    global _iso_cache
+    second = int(time.time())
+    cached = _iso_cache
+    if cached[0] != second:
+        cached = (second, datetime.fromtimestamp(second, timezone.utc).isoformat())
+        _iso_cache = cached
+    return cached[1]
+
+
+def _atomic_write_bytes(file_path: Path, payload: bytes) -> None:
+    """Replace a file's contents so readers see either the old or new file.
+    
+    The payload is written and fsynced to a sibling temp file, which is then
+    renamed over the target; a crash mid-write leaves the old file intact.
+    """
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def _file_signature(file_path: Path) -> Tuple[int, int]:
+    """Modification time and size, used to detect changes made on disk."""
+    st = file_path.stat()
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _paper_key(paper: dict) -> Optional[str]:
+    """Unique key of a stored paper: its arxiv_id, or id for older rows."""
+    return paper.get('arxiv_id') or paper.get('id')
+
+
+def _paper_sort_key(paper: dict) -> Tuple[float, str]:
+    """Listing order for papers (descending): total score, then ID."""
+    return (paper.get('total_score') or 0, paper.get('arxiv_id') or '')
+
+
+def _saved_sort_key(entry: dict) -> Tuple[str, str]:
+    """Listing order for saved papers (descending): saved_at, then paper ID."""
+    return (entry.get('saved_at', ''), entry.get('paper_id') or '')
+
+
+class JsonStorage:
+    """JSON file-based storage for papers and user data."""
+    
+    def __init__(self, data_dir: Optional[str] = None):
+        """Initialize JSON storage.
+        
+        Args:
+            data_dir: Directory to store JSON files (default: backend/data)
+        """
+        self._data_dir = Path(data_dir) if data_dir else DATA_DIR
+        self._data_dir.mkdir(parents=True, exist_ok=True)
+        
+        # File paths
+        self._papers_file = self._data_dir / "papers.json"
+        self._saved_papers_file = self._data_dir / "saved_papers.json"
+        self._config_file = self._data_dir / "config.json"
+        
+        # Parsed file contents: path -> ((mtime_ns, size) at last read/flush, data);
+        # the signature is None while memory holds changes not yet on disk
+        self._cache: Dict[Path, Tuple[Optional[Tuple[int, int]], Any]] = {}
+        self._dirty: Set[Path] = set()
+        self._pending_writes = 0
+        self._flush_timer: Optional[threading.Timer] = None
+        # One lock per file, so work on one file never waits on another;
+        # reentrant so a read-modify-write can hold it across both calls
+        self._locks: Dict[Path, threading.RLock] = {
+            path: threading.RLock()
+            for path in (self._papers_file, self._saved_papers_file, self._config_file)
+        }
+        # Guards the dirty set, write counter and flush timer
+        self._state_lock = threading.Lock()
+        # Serializes flushes so an older snapshot never overwrites a newer one
+        self._flush_lock = threading.Lock()
+        
+        # Paper key -> position, for the papers list object it was built from
+        self._papers_index: Optional[Tuple[list, Dict[str, int]]] = None
+        # Papers in ascending listing order with their sort keys, for the
+        # papers list object they were built from; dropped on every write
+        self._papers_by_score: Optional[Tuple[list, List[dict], List[Tuple[float, str]]]] = None
+        # Number of papers with a total_score, for the same papers list
+        self._scored_count: Optional[Tuple[list, int]] = None
+        
+        # Initialize files if they don't exist
+        self._init_files()
+        atexit.register(self.flush)
+    
+    def _init_files(self):
+        """Initialize JSON files if they don't exist."""
+        if not self._papers_file.exists():
+            self._write_json(self._papers_file, [])
+        if not self._saved_papers_file.exists():
+            self._write_json(self._saved_papers_file, [])
+        if not self._config_file.exists():
+            self._write_json(self._config_file, {})
+        self.flush()
+    
+    def _read_json(self, file_path: Path) -> Any:
+        """Read JSON file with thread locking.
+        
+        Returns the cached data while it holds unflushed changes or the
+        file's mtime and size are unchanged since it was last read or
+        flushed. The returned object is shared with the cache, so callers
+        must not mutate it unless they pass it back to _write_json.
+        """
+        with self._locks[file_path]:
+            cached = self._cache.get(file_path)
+            if cached is not None and cached[0] is None:
+                return cached[1]
+            try:
+                signature = _file_signature(file_path)
+            except FileNotFoundError:
+                self._cache.pop(file_path, None)
+                return None
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+            data = orjson.loads(file_path.read_bytes())
+            self._cache[file_path] = (signature, data)
+            return data
+    
+    def _write_json(self, file_path: Path, data: Any):
+        """Replace a file's data in memory and schedule it to be flushed.
+        
+        The flush always runs on the timer thread, never inline: callers
+        may hold a file lock here, and flush() takes every file's lock.
+        """
+        with self._locks[file_path]:
+            self._cache[file_path] = (None, data)
+            if file_path == self._papers_file:
+                self._papers_by_score = None
+                self._scored_count = None
+        with self._state_lock:
+            self._dirty.add(file_path)
+            self._pending_writes += 1
+            if self._pending_writes == FLUSH_AFTER_WRITES and self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._flush_timer is None:
+                delay = 0.0 if self._pending_writes >= FLUSH_AFTER_WRITES else FLUSH_INTERVAL
+                self._flush_timer = threading.Timer(delay, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def flush(self):
+        """Write every dirty file to disk.
+        
+        Each dirty file is serialized under its own lock, but written and
+        fsynced outside it, so reads and further writes are not held up by
+        disk I/O. Writes made meanwhile are picked up by the next flush.
+        """
+        with self._flush_lock:
+            with self._state_lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                self._pending_writes = 0
+                dirty = list(self._dirty)
+                self._dirty.clear()
+            
+            for file_path in dirty:
+                with self._locks[file_path]:
+                    data = self._cache[file_path][1]
+                    payload = orjson.dumps(data, default=str, option=_JSON_OPTIONS)
+                try:
+                    _atomic_write_bytes(file_path, payload)
+                    signature = _file_signature(file_path)
+                except OSError as e:
+                    logger.error(f"Failed to flush {file_path}: {e}")
+                    with self._state_lock:
+                        self._dirty.add(file_path)
+                    continue
+                with self._locks[file_path]:
+                    cached = self._cache.get(file_path)
+                    with self._state_lock:
+                        redirtied = file_path in self._dirty
+                    if not redirtied and cached is not None and cached[1] is data:
+                        self._cache[file_path] = (signature, data)
+    
+    def _get_papers_index(self, papers: list) -> Dict[str, int]:
+        """Return the key -> position index for the cached papers list.
+        
+        The index is rebuilt whenever the papers file is reloaded or
+        replaced (a new list object); mutations that keep the list update
+        it in place.
+        """
+        cached = self._papers_index
+        if cached is not None and cached[0] is papers:
+            return cached[1]
+        index: Dict[str, int] = {}
+        for i, paper in enumerate(papers):
+            index.setdefault(_paper_key(paper), i)
+        self._papers_index = (papers, index)
+        return index
+    
+    def _get_papers_by_score(self, papers: list) -> Tuple[List[dict], List[Tuple[float, str]]]:
+        """Return the papers sorted ascending by listing key, and their keys.
+        
+        Built once per version of the papers list and reused by every
+        get_papers call until the next write or reload.
+        """
+        cached = self._papers_by_score
+        if cached is not None and cached[0] is papers:
+            return cached[1], cached[2]
+        ordered = sorted(papers, key=_paper_sort_key)
+        keys = [_paper_sort_key(p) for p in ordered]
+        self._papers_by_score = (papers, ordered, keys)
+        return ordered, keys
+    
+    def _find_paper(self, papers: list, paper_id: str) -> Optional[dict]:
+        """Look up a paper in the cached papers list by its key."""
+        i = self._get_papers_index(papers).get(paper_id)
+        return papers[i] if i is not None else None
+    
+    # Papers operations
+    # Mutations hold the file's lock across the read and the write, so
+    # concurrent callers cannot overwrite each other's changes.
+    def insert_paper(self, paper_data: dict) -> dict:
+        """Insert a paper into storage."""
+        with self._locks[self._papers_file]:
+            papers = self._read_json(self._papers_file) or []
+            
+            # Add timestamp if not present
+            if 'created_at' not in paper_data:
+                paper_data['created_at'] = _now_iso()
+            
+            self._get_papers_index(papers).setdefault(_paper_key(paper_data), len(papers))
+            papers.append(paper_data)
+            self._write_json(self._papers_file, papers)
+            return paper_data
+    
+    def upsert_paper(self, paper_data: dict) -> dict:
+        """Insert or update a paper in storage.
+        
+        Uses arxiv_id as the unique key for upsert.
+        """
+        return self.upsert_papers([paper_data])[0]
+    
+    def upsert_papers(self, papers_data: List[dict]) -> List[dict]:
+        """Insert or update several papers with a single file write.
+        
+        Uses arxiv_id (or id, when arxiv_id is missing) as the unique key; a
+        later entry in papers_data wins over an earlier one with the same key.
+        
+        Args:
+            papers_data: Paper dictionaries to upsert
+            
+        Returns:
+            The upserted paper dictionaries, with timestamps added
+        """
+        if not papers_data:
+            return []
+        
+        with self._locks[self._papers_file]:
+            papers = self._read_json(self._papers_file) or []
+            index = self._get_papers_index(papers)
+            now = _now_iso()
+            
+            for paper_data in papers_data:
+                # Add/update timestamp
+                paper_data['updated_at'] = now
+                if 'created_at' not in paper_data:
+                    paper_data['created_at'] = now
+                
+                key = _paper_key(paper_data)
+                existing_idx = index.get(key)
+                if existing_idx is not None:
+                    # Update existing
+                    papers[existing_idx] = paper_data
+                else:
+                    # Insert new
+                    index[key] = len(papers)
+                    papers.append(paper_data)
+            
+            self._write_json(self._papers_file, papers)
+            return papers_data
+    
+    def get_papers(
+        self,
+        limit: int = 50,
+        offset: int = 0,
+        min_score: Optional[float] = None,
+        after: Optional[Tuple[float, str]] = None
+    ) -> List[dict]:
+        """Get papers from storage, ordered by (total_score, arxiv_id) descending.
+        
+        Args:
+            limit: Maximum number of papers to return
+            offset: Number of papers to skip (ignored when after is given)
+            min_score: Minimum total score filter
+            after: Keyset cursor; only papers sorting after this
+                (total_score, arxiv_id) key are returned
+            
+        Returns:
+            List of paper dictionaries
+        """
+        with self._locks[self._papers_file]:
+            papers = self._read_json(self._papers_file) or []
+            ordered, keys = self._get_papers_by_score(papers)
+        
+        # The listing is ordered[lo:hi] read backwards: min_score cuts off
+        # the low end, the cursor (or nothing) the high end
+        lo = 0 if min_score is None else bisect.bisect_left(keys, (min_score,))
+        hi = len(ordered) if after is None else bisect.bisect_left(keys, after)
+        if after is None:
+            hi -= offset
+        start = max(lo, hi - limit)
+        if start >= hi:
+            return []
+        return ordered[start:hi][::-1]
+    
+    def get_paper_by_id(self, paper_id: str) -> Optional[dict]:
+        """Get a paper by its ID (arxiv_id).
+        
+        Args:
+            paper_id: The paper's arxiv_id
+            
+        Returns:
+            Paper dictionary or None if not found
+        """
+        with self._locks[self._papers_file]:
+            papers = self._read_json(self._papers_file) or []
+            return self._find_paper(papers, paper_id)
+    
+    def get_scored_papers(self, min_score: float = 0.0, limit: int = 50) -> List[dict]:
+        """Get scored papers above a minimum score threshold."""
+        return self.get_papers(limit=limit, min_score=min_score)
+    
+    def get_paper_by_arxiv_id(self, arxiv_id: str) -> Optional[dict]:
+        """Get a paper by its ArXiv ID."""
+        return self.get_paper_by_id(arxiv_id)
+    
+    # Saved papers operations
+    def save_paper(self, user_id: str, paper_id: str) -> dict:
+        """Save a paper for later reading."""
+        with self._locks[self._saved_papers_file]:
+            saved = self._read_json(self._saved_papers_file) or []
+            
+            # Check if already saved
+            for s in saved:
+                if s.get('user_id') == user_id and s.get('paper_id') == paper_id:
+                    return {**s, 'already_saved': True}  # Mark as already saved
+            
+            entry = {
+                'user_id': user_id,
+                'paper_id': paper_id,
+                'saved_at': datetime.now(timezone.utc).isoformat(),
+                'already_saved': False
+            }
+            saved.append(entry)
+            self._write_json(self._saved_papers_file, saved)
+            return entry
+    
+    def save_paper_for_later(self, paper_id: str, user_id: str = "default") -> dict:
+        """Save a paper for later reading."""
+        return self.save_paper(user_id, paper_id)
+    
+    def get_saved_papers(
+        self,
+        user_id: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        after: Optional[Tuple[str, str]] = None
+    ) -> List[dict]:
+        """Get saved papers for a user, newest first.
+        
+        Pagination is applied before joining with paper data, so only the
+        requested page is looked up in the papers file.
+        
+        Args:
+            user_id: The user ID
+            limit: Maximum number of saved papers to return (default: all)
+            offset: Number of saved papers to skip (ignored when after is given)
+            after: Keyset cursor; only entries sorting after this
+                (saved_at, paper_id) key are returned
+            
+        Returns:
+            List of saved entries, with a 'paper' key when the paper is found
+        """
+        saved = self._read_json(self._saved_papers_file) or []
+        
+        # Filter by user_id and sort by saved_at (newest first)
+        entries = [s for s in saved if s.get('user_id') == user_id]
+        entries.sort(key=_saved_sort_key, reverse=True)
+        if after is not None:
+            entries = [s for s in entries if _saved_sort_key(s) < after]
+            offset = 0
+        entries = entries[offset:] if limit is None else entries[offset:offset + limit]
+        if not entries:
+            return []
+        
+        with self._locks[self._papers_file]:
+            papers = self._read_json(self._papers_file) or []
+            
+            # Join the page with paper data
+            result = []
+            for s in entries:
+                paper = self._find_paper(papers, s.get('paper_id'))
+                
+                if paper:
+                    result.append({**s, 'paper': paper})
+                else:
+                    # Include saved entry even if paper not found
+                    result.append(s)
+            
+            return result
+    
+    def count_saved_papers(self, user_id: str) -> int:
+        """Count saved papers for a user without joining paper data."""
+        saved = self._read_json(self._saved_papers_file) or []
+        return sum(1 for s in saved if s.get('user_id') == user_id)
+    
+    def remove_saved_paper(self, user_id: str, paper_id: str) -> bool:
+        """Remove a saved paper for a user.
+        
+        Args:
+            user_id: The user ID
+            paper_id: The paper ID to remove
+            
+        Returns:
+            True if paper was removed, False if not found
+        """
+        with self._locks[self._saved_papers_file]:
+            saved = self._read_json(self._saved_papers_file) or []
+            
+            # Find and remove the saved paper
+            original_length = len(saved)
+            saved = [s for s in saved if not (s.get('user_id') == user_id and s.get('paper_id') == paper_id)]
+            
+            if len(saved) < original_length:
+                self._write_json(self._saved_papers_file, saved)
+                return True
+            
+            return False
+    
+    # Config operations
+    def get_user_config(self, user_id: str) -> Optional[dict]:
+        """Get user configuration."""
+        configs = self._read_json(self._config_file) or {}
+        return configs.get(user_id)
+    
+    def upsert_user_config(self, user_id: str, interests: list, threshold: float) -> dict:
+        """Update or insert user configuration."""
+        with self._locks[self._config_file]:
+            configs = self._read_json(self._config_file) or {}
+            configs[user_id] = {
+                'user_id': user_id,
+                'interests': interests,
+                'threshold': threshold,
+                'updated_at': _now_iso()
+            }
+            self._write_json(self._config_file, configs)
+            return configs[user_id]
+    
+    # Utility methods
+    def clear_all(self):
+        """Clear all data (for testing)."""
+        self._write_json(self._papers_file, [])
+        self._write_json(self._saved_papers_file, [])
+        self._write_json(self._config_file, {})
+    
+    def get_stats(self) -> dict:
+        """Get storage statistics.
+        
+        The scored-paper count is computed once per version of the papers
+        list, so repeated calls between writes do no scanning.
+        """
+        with self._locks[self._papers_file]:
+            papers = self._read_json(self._papers_file) or []
+            cached = self._scored_count
+            if cached is not None and cached[0] is papers:
+                scored_count = cached[1]
+            else:
+                scored_count = sum(1 for p in papers if p.get('total_score') is not None)
+                self._scored_count = (papers, scored_count)
+        saved = self._read_json(self._saved_papers_file) or []
+        
+        return {
+            'total_papers': len(papers),
+            'scored_papers': scored_count,
+            'saved_papers': len(saved),
+            'data_dir': str(self._data_dir)
+        }
+
+
+# Singleton instance
+_storage: Optional[JsonStorage] = None
+
+
+def get_json_storage(data_dir: Optional[str] = None) -> JsonStorage:
+    """Get or create the JSON storage singleton."""
+    global _storage
+    
+    if _storage is None:
+        _storage = JsonStorage(data_dir)
+    
+    return _storage
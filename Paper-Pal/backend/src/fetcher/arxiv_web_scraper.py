@@ -1,221 +1,350 @@
-"""ArXiv web scraper as fallback when API fails."""
-
-import re
-import logging
-from datetime import datetime, timedelta, timezone
-from typing import List, Optional
-import requests
-from bs4 import BeautifulSoup
-
-logger = logging.getLogger(__name__)
-
-
-class WebScrapingError(Exception):
-    """Raised when web scraping fails."""
-    pass
-
-
-# Simple Paper class for testing
-class Paper:
-    def __init__(self, id, title, abstract, authors, categories, published, source, url):
-        self.id = id
-        self.title = title
-        self.abstract = abstract
-        self.authors = authors
-        self.categories = categories
-        self.published = published
-        self.source = source
-        self.url = url
-
-
-class ArXivWebScraper:
-    """Web scraper for ArXiv as fallback when API fails."""
-    
-    def __init__(self, timeout: float = 30.0):
-        """Initialize the web scraper.
-        
-        Args:
-            timeout: Request timeout in seconds
-        """
-        self.timeout = timeout
-        self.base_url = "https://arxiv.org"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
-    
-    def scrape_recent_papers(
-        self, 
-        categories: List[str], 
-        days: int = 1, 
-        max_results: int = 50
-    ) -> List[Paper]:
-        """Scrape recent papers from ArXiv website.
-        
-        Args:
-            categories: List of ArXiv categories (e.g., ['cs.AI', 'cs.LG'])
-            days: Number of days to look back
-            max_results: Maximum number of papers to return
-            
-        Returns:
-            List of Paper objects
-            
-        Raises:
-            WebScrapingError: When scraping fails
-        """
-        try:
-            papers = []
-            cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
-            
-            # For simplicity, we'll scrape the "recent" page for each category
-            for category in categories:
-                try:
-                    category_papers = self._scrape_category_recent(category, cutoff_date)
-                    papers.extend(category_papers)
-                    
-                    if len(papers) >= max_results:
-                        break
-                        
-                except Exception as e:
-                    logger.warning(f"Failed to scrape category {category}: {e}")
-                    continue
-            
-            # Remove duplicates and limit results
-            unique_papers = self._remove_duplicates(papers)
-            return unique_papers[:max_results]
-            
-        except Exception as e:
-            logger.error(f"Web scraping failed: {e}")
-            raise WebScrapingError(f"Failed to scrape ArXiv: {e}")
-    
-    def _scrape_category_recent(self, category: str, cutoff_date: datetime) -> List[Paper]:
-        """Scrape recent papers from a specific category.
-        
-        Args:
-            category: ArXiv category (e.g., 'cs.AI')
-            cutoff_date: Only include papers after this date
-            
-        Returns:
-            List of Paper objects from this category
-        """
-        # ArXiv recent submissions URL format
-        url = f"{self.base_url}/list/{category}/recent"
-        
-        logger.debug(f"Scraping {url}")
-        
-        try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            papers = []
-            
-            # Find paper entries (ArXiv uses specific HTML structure)
-            paper_entries = soup.find_all('dt')
-            
-            for dt in paper_entries:
-                try:
-                    # Get the corresponding dd element with paper details
-                    dd = dt.find_next_sibling('dd')
-                    if not dd:
-                        continue
-                    
-                    paper = self._parse_paper_entry(dt, dd, category)
-                    if paper and paper.published >= cutoff_date:
-                        papers.append(paper)
-                        
-                except Exception as e:
-                    logger.debug(f"Failed to parse paper entry: {e}")
-                    continue
-            
-            logger.info(f"Scraped {len(papers)} papers from {category}")
-            return papers
-            
-        except requests.RequestException as e:
-            logger.error(f"Failed to fetch {url}: {e}")
-            raise WebScrapingError(f"Failed to fetch category {category}: {e}")
-    
-    def _parse_paper_entry(self, dt_element, dd_element, category: str) -> Optional[Paper]:
-        """Parse a single paper entry from ArXiv HTML.
-        
-        Args:
-            dt_element: The dt element containing paper ID and links
-            dd_element: The dd element containing paper details
-            category: The category this paper belongs to
-            
-        Returns:
-            Paper object or None if parsing fails
-        """
-        try:
-            # Extract paper ID from the dt element
-            arxiv_id = None
-            links = dt_element.find_all('a')
-            for link in links:
-                href = link.get('href', '')
-                if '/abs/' in href:
-                    arxiv_id = href.split('/abs/')[-1]
-                    break
-            
-            if not arxiv_id:
-                return None
-            
-            # Extract title (usually in the first div with class 'list-title')
-            title_div = dd_element.find('div', class_='list-title')
-            if not title_div:
-                return None
-            
-            title = title_div.get_text().replace('Title:', '').strip()
-            
-            # Extract authors
-            authors_div = dd_element.find('div', class_='list-authors')
-            authors = []
-            if authors_div:
-                author_links = authors_div.find_all('a')
-                authors = [link.get_text().strip() for link in author_links]
-            
-            # Extract abstract/summary
-            abstract_div = dd_element.find('p', class_='mathjax')
-            abstract = ""
-            if abstract_div:
-                abstract = abstract_div.get_text().strip()
-            
-            # For web scraping, we'll use current time as published date
-            # This is a limitation of web scraping vs API
-            published = datetime.now(timezone.utc)
-            
-            # Create paper object
-            paper = Paper(
-                id=f"https://arxiv.org/abs/{arxiv_id}",
-                title=title,
-                abstract=abstract,
-                authors=authors,
-                categories=[category],
-                published=published,
-                source="arxiv_web",
-                url=f"https://arxiv.org/abs/{arxiv_id}"
-            )
-            
-            return paper
-            
-        except Exception as e:
-            logger.debug(f"Failed to parse paper entry: {e}")
-            return None
-    
-    def _remove_duplicates(self, papers: List[Paper]) -> List[Paper]:
-        """Remove duplicate papers based on ID.
-        
-        Args:
-            papers: List of papers that may contain duplicates
-            
-        Returns:
-            List of unique papers
-        """
-        seen_ids = set()
-        unique_papers = []
-        
-        for paper in papers:
-            if paper.id not in seen_ids:
-                seen_ids.add(paper.id)
-                unique_papers.append(paper)
-        
-        return unique_papers
\ No newline at end of file
+"""ArXiv web scraper as fallback when API fails."""
+
+import re
+import itertools
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    from lxml import etree
+    _LXML_AVAILABLE = True
+except ImportError:
+    etree = None
+    _LXML_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Category pages fetched at once; also the session's per-host pool size
+MAX_SCRAPE_WORKERS = 8
+
+# Without lxml, BeautifulSoup with the stdlib parser; listing entries are
+# <dt>/<dd> pairs and nothing else on the page is needed
+_HTML_PARSER = "html.parser"
+_ENTRY_STRAINER = SoupStrainer(["dt", "dd"])
+
+# Bytes read per step when streaming a listing page into the parser
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+if _LXML_AVAILABLE:
+    # With lxml, entries are read with XPath compiled once, which matches
+    # what the BeautifulSoup lookups in _soup_entry_fields find
+    def _class_xpath(tag: str, css_class: str) -> str:
+        return f"(.//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {css_class} ')])[1]"
+    
+    _XP_ABS_HREF = etree.XPath("(.//a[contains(@href, '/abs/')])[1]/@href")
+    # string() and text() hand back the text itself, joined in C, instead
+    # of elements whose text is then gathered in Python
+    _XP_TITLE = etree.XPath(f"string({_class_xpath('div', 'list-title')})")
+    _XP_AUTHORS = etree.XPath(_class_xpath("div", "list-authors") + "//a/text()")
+    _XP_ABSTRACT = etree.XPath(f"string({_class_xpath('p', 'mathjax')})")
+
+
+ListingEntry = Tuple[str, str, List[str], str]
+
+
+def _paired_entries(elements, name_attr: str):
+    """Yield each <dt> with the <dd> that follows it, in one pass.
+    
+    Takes the page's dt/dd elements in document order and pairs them in
+    a single walk instead of searching siblings from every dt.
+    
+    Args:
+        elements: dt/dd elements, BeautifulSoup tags or lxml elements
+        name_attr: Attribute holding the tag name ("name" or "tag")
+    """
+    dt = None
+    for element in elements:
+        if getattr(element, name_attr) == "dt":
+            dt = element
+        elif dt is not None:
+            yield dt, element
+            dt = None
+
+
+def _lxml_entry_fields(dt_element, dd_element) -> Optional[ListingEntry]:
+    """Read an entry's fields from lxml elements with the compiled XPaths."""
+    hrefs = _XP_ABS_HREF(dt_element)
+    arxiv_id = hrefs[0].rpartition('/abs/')[2] if hrefs else None
+    if not arxiv_id:
+        return None
+    
+    # Empty when there is no title div
+    title = _XP_TITLE(dd_element)
+    if not title:
+        return None
+    # Already stripped at the end, only the gap after the label remains
+    title = title.strip().removeprefix('Title:').lstrip()
+    
+    authors = [name.strip() for name in _XP_AUTHORS(dd_element)]
+    
+    abstract = _XP_ABSTRACT(dd_element).strip()
+    
+    return arxiv_id, title, authors, abstract
+
+
+def _soup_entry_fields(dt_element, dd_element) -> Optional[ListingEntry]:
+    """Read an entry's fields from BeautifulSoup tags."""
+    # Extract paper ID from the dt element
+    arxiv_id = None
+    for link in dt_element.find_all('a'):
+        _, sep, tail = link.get('href', '').rpartition('/abs/')
+        if sep:
+            arxiv_id = tail
+            break
+    
+    if not arxiv_id:
+        return None
+    
+    # Extract title (usually in the first div with class 'list-title')
+    title_div = dd_element.find('div', class_='list-title')
+    if not title_div:
+        return None
+    
+    title = title_div.get_text().strip().removeprefix('Title:').lstrip()
+    
+    # Extract authors
+    authors_div = dd_element.find('div', class_='list-authors')
+    authors = []
+    if authors_div:
+        authors = [link.get_text().strip() for link in authors_div.find_all('a')]
+    
+    # Extract abstract/summary
+    abstract_div = dd_element.find('p', class_='mathjax')
+    abstract = abstract_div.get_text().strip() if abstract_div else ""
+    
+    return arxiv_id, title, authors, abstract
+
+
+def iter_listing_entries(content: bytes) -> Iterator[ListingEntry]:
+    """Parse an ArXiv listing page into its paper entries.
+    
+    Uses lxml when it is installed and BeautifulSoup's stdlib parser
+    otherwise. Entries without an abstract link or a title, or that fail
+    to parse, are skipped.
+    
+    Args:
+        content: Listing page HTML
+        
+    Yields:
+        (arxiv_id, title, authors, abstract) for each entry, in page order
+    """
+    if _LXML_AVAILABLE:
+        entries = _paired_entries(etree.HTML(content).iter("dt", "dd"), "tag")
+        entry_fields = _lxml_entry_fields
+    else:
+        soup = BeautifulSoup(content, _HTML_PARSER, parse_only=_ENTRY_STRAINER)
+        entries = _paired_entries(soup.find_all(["dt", "dd"], recursive=False), "name")
+        entry_fields = _soup_entry_fields
+    
+    return _entries_fields(entries, entry_fields)
+
+
+def iter_listing_chunks(chunks: Iterable[bytes]) -> Iterator[ListingEntry]:
+    """Parse an ArXiv listing page incrementally, as its body arrives.
+    
+    Like iter_listing_entries, but each entry is yielded as soon as its
+    <dd> has been fed, so a caller that stops early leaves the rest of the
+    body unparsed (and unread, if chunks is a response stream). Without
+    lxml the whole body is read and parsed at once.
+    
+    Args:
+        chunks: Listing page HTML, in pieces
+        
+    Yields:
+        (arxiv_id, title, authors, abstract) for each entry, in page order
+    """
+    if not _LXML_AVAILABLE:
+        return iter_listing_entries(b"".join(chunks))
+    
+    return _entries_fields(_paired_entries(_pulled_entry_elements(chunks), "tag"), _lxml_entry_fields)
+
+
+def _pulled_entry_elements(chunks: Iterable[bytes]):
+    """Yield <dt>/<dd> elements as they are closed while feeding chunks.
+    
+    Once the pair ending with a <dd> has been consumed, it and everything
+    before it is dropped from the tree, so memory stays bounded by one
+    entry rather than the page.
+    """
+    parser = etree.HTMLPullParser(events=("end",), tag=("dt", "dd"))
+    for chunk in itertools.chain(chunks, [None]):
+        if chunk is None:
+            parser.close()
+        else:
+            parser.feed(chunk)
+        for _, element in parser.read_events():
+            yield element
+            if element.tag == "dd":
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+
+
+def _entries_fields(entries, entry_fields) -> Iterator[ListingEntry]:
+    """Read each dt/dd pair's fields, skipping entries that fail to parse."""
+    for dt, dd in entries:
+        try:
+            fields = entry_fields(dt, dd)
+        except Exception as e:
+            logger.debug(f"Failed to parse paper entry: {e}")
+            continue
+        if fields:
+            yield fields
+
+
+class WebScrapingError(Exception):
+    """Raised when web scraping fails."""
+    pass
+
+
+# dataclass(slots=True) needs Python 3.10; plain dataclasses on 3.9
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# Simple Paper class for testing; identity equality, as before
+@dataclass(eq=False, **_SLOTS)
+class Paper:
+    id: str
+    title: str
+    abstract: str
+    authors: List[str]
+    categories: List[str]
+    published: datetime
+    source: str
+    url: str
+
+
+class ArXivWebScraper:
+    """Web scraper for ArXiv as fallback when API fails."""
+    
+    def __init__(self, timeout: float = 30.0):
+        """Initialize the web scraper.
+        
+        Args:
+            timeout: Request timeout in seconds
+        """
+        self.timeout = timeout
+        self.base_url = "https://arxiv.org"
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        })
+        # Keep a connection per concurrent category fetch
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=MAX_SCRAPE_WORKERS))
+    
+    def scrape_recent_papers(
+        self, 
+        categories: List[str], 
+        days: int = 1, 
+        max_results: int = 50
+    ) -> List[Paper]:
+        """Scrape recent papers from ArXiv website.
+        
+        Args:
+            categories: List of ArXiv categories (e.g., ['cs.AI', 'cs.LG'])
+            days: Number of days to look back
+            max_results: Maximum number of papers to return
+            
+        Returns:
+            List of Paper objects
+            
+        Raises:
+            WebScrapingError: When scraping fails
+        """
+        try:
+            # Keyed by ID: the first occurrence of a paper wins and keeps its place
+            papers: Dict[str, Paper] = {}
+            # A repeated category would only fetch the same page again
+            categories = list(dict.fromkeys(categories))
+            cutoff_date = datetime.now(timezone.utc) - timedelta(days=days)
+            
+            # Scrape the "recent" page of every category concurrently; map()
+            # keeps the results in category order
+            if categories:
+                executor = ThreadPoolExecutor(max_workers=min(MAX_SCRAPE_WORKERS, len(categories)))
+                try:
+                    for category_papers in executor.map(
+                        lambda category: self._scrape_category_safe(category, cutoff_date),
+                        categories,
+                    ):
+                        for paper in category_papers:
+                            papers.setdefault(paper.id, paper)
+                        if len(papers) >= max_results:
+                            break
+                finally:
+                    # Stop at max_results without waiting on later categories
+                    executor.shutdown(wait=False, cancel_futures=True)
+            
+            return list(papers.values())[:max_results]
+            
+        except Exception as e:
+            logger.error(f"Web scraping failed: {e}")
+            raise WebScrapingError(f"Failed to scrape ArXiv: {e}")
+    
+    def _scrape_category_safe(self, category: str, cutoff_date: datetime) -> List[Paper]:
+        """Scrape a category, logging a failure and returning no papers."""
+        try:
+            return self._scrape_category_recent(category, cutoff_date)
+        except Exception as e:
+            logger.warning(f"Failed to scrape category {category}: {e}")
+            return []
+    
+    def _scrape_category_recent(self, category: str, cutoff_date: datetime) -> List[Paper]:
+        """Scrape recent papers from a specific category.
+        
+        Args:
+            category: ArXiv category (e.g., 'cs.AI')
+            cutoff_date: Only include papers after this date
+            
+        Returns:
+            List of Paper objects from this category
+        """
+        # ArXiv recent submissions URL format
+        url = f"{self.base_url}/list/{category}/recent"
+        
+        logger.debug(f"Scraping {url}")
+        
+        try:
+            # Entries are parsed as the body streams in, so parsing overlaps
+            # the download; the block ends, and the connection goes back
+            # to the pool, once the last chunk is read
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                entries = list(iter_listing_chunks(response.iter_content(chunk_size=_STREAM_CHUNK_SIZE)))
+            
+            papers = []
+            for fields in entries:
+                paper = self._make_paper(*fields, category)
+                if paper.published >= cutoff_date:
+                    papers.append(paper)
+            
+            logger.info(f"Scraped {len(papers)} papers from {category}")
+            return papers
+            
+        except requests.RequestException as e:
+            logger.error(f"Failed to fetch {url}: {e}")
+            raise WebScrapingError(f"Failed to fetch category {category}: {e}")
+    
+    @staticmethod
+    def _make_paper(arxiv_id: str, title: str, authors: List[str], abstract: str, category: str) -> Paper:
+        """Build a scraped Paper from its parsed fields."""
+        # For web scraping, we'll use current time as published date
+        # This is a limitation of web scraping vs API
+        url = f"https://arxiv.org/abs/{arxiv_id}"
+        return Paper(
+            url,  # id
+            title,
+            abstract,
+            authors,
+            [category],  # categories
+            datetime.now(timezone.utc),  # published
+            "arxiv_web",  # source
+            url
+        )
@@ -1,239 +1,291 @@
-"""Enhanced ArXiv fetcher with web scraping fallback."""
-
-import logging
-from typing import List, Optional
-
-from ..config import NetworkConfig
-from ..models.paper import Paper
-from .base_fetcher import FetchResult, FetchMethod
-from .arxiv_fetcher import ArXivFetcher
-from .arxiv_web_scraper import ArXivWebScraper
-from .retry_handler import RetryHandler
-from .exceptions import ArXivAPIError, WebScrapingError
-
-logger = logging.getLogger(__name__)
-
-
-class EnhancedArXivFetcher:
-    """Enhanced ArXiv fetcher with fallback mechanisms."""
-    
-    def __init__(
-        self, 
-        categories: Optional[List[str]] = None,
-        http_proxy: Optional[str] = None,
-        https_proxy: Optional[str] = None,
-        network_config: Optional[NetworkConfig] = None
-    ):
-        """Initialize enhanced fetcher.
-        
-        Args:
-            categories: List of ArXiv categories to fetch
-            http_proxy: HTTP proxy URL
-            https_proxy: HTTPS proxy URL
-            network_config: Network configuration for retry and fallback
-        """
-        self.categories = categories or ["cs.AI", "cs.CL", "cs.CV", "cs.LG"]
-        self.network_config = network_config or NetworkConfig()
-        
-        # Initialize components
-        self.api_fetcher = ArXivFetcher(
-            categories=self.categories,
-            http_proxy=http_proxy,
-            https_proxy=https_proxy
-        )
-        
-        self.web_scraper = ArXivWebScraper(timeout=self.network_config.request_timeout)
-        self.retry_handler = RetryHandler(self.network_config)
-    
-    async def fetch_papers(self, days: int = 1, max_results: int = 100) -> FetchResult:
-        """Fetch papers using API with web scraping fallback.
-        
-        Args:
-            days: Number of days to look back
-            max_results: Maximum number of papers to return
-            
-        Returns:
-            FetchResult containing papers and metadata
-        """
-        # First, try the ArXiv API
-        try:
-            logger.info("Attempting to fetch papers using ArXiv API...")
-            
-            papers = await self.retry_handler.execute_with_retry(
-                self._fetch_with_api,
-                days=days,
-                max_results=max_results
-            )
-            
-            # Check if we got meaningful results
-            if papers and len(papers) > 0:
-                logger.info(f"Successfully fetched {len(papers)} papers using ArXiv API")
-                return FetchResult(
-                    papers=papers,
-                    method=FetchMethod.ARXIV_API,
-                    success=True
-                )
-            else:
-                logger.warning("ArXiv API returned 0 papers, trying web scraping fallback...")
-                
-        except Exception as e:
-            logger.warning(f"ArXiv API failed: {e}, trying web scraping fallback...")
-        
-        # Fallback to web scraping if enabled
-        if self.network_config.enable_web_fallback:
-            try:
-                logger.info("Attempting to fetch papers using web scraping...")
-                
-                papers = await self.retry_handler.execute_with_retry(
-                    self._fetch_with_web_scraping,
-                    days=days,
-                    max_results=max_results
-                )
-                
-                if papers and len(papers) > 0:
-                    logger.info(f"Successfully fetched {len(papers)} papers using web scraping")
-                    return FetchResult(
-                        papers=papers,
-                        method=FetchMethod.WEB_SCRAPING,
-                        success=True
-                    )
-                else:
-                    logger.error("Web scraping also returned 0 papers")
-                    
-            except Exception as e:
-                logger.error(f"Web scraping also failed: {e}")
-                return FetchResult(
-                    papers=[],
-                    method=FetchMethod.WEB_SCRAPING,
-                    success=False,
-                    error_message=f"Both API and web scraping failed. Last error: {e}"
-                )
-        
-        # Both methods failed or web fallback is disabled
-        return FetchResult(
-            papers=[],
-            method=FetchMethod.ARXIV_API,
-            success=False,
-            error_message="ArXiv API failed and web fallback is disabled or also failed"
-        )
-    
-    async def _fetch_with_api(self, days: int, max_results: int) -> List[Paper]:
-        """Fetch papers using ArXiv API.
-        
-        Args:
-            days: Number of days to look back
-            max_results: Maximum number of papers
-            
-        Returns:
-            List of Paper objects
-            
-        Raises:
-            ArXivAPIError: When API fetch fails
-        """
-        try:
-            # Use sync method since ArXivFetcher is synchronous
-            papers = self.api_fetcher.fetch_recent(days=days, max_results=max_results)
-            return papers
-            
-        except Exception as e:
-            logger.error(f"ArXiv API fetch failed: {e}")
-            raise ArXivAPIError(f"ArXiv API fetch failed: {e}")
-    
-    async def _fetch_with_web_scraping(self, days: int, max_results: int) -> List[Paper]:
-        """Fetch papers using web scraping.
-        
-        Args:
-            days: Number of days to look back
-            max_results: Maximum number of papers
-            
-        Returns:
-            List of Paper objects
-            
-        Raises:
-            WebScrapingError: When web scraping fails
-        """
-        try:
-            # Web scraper is synchronous, so we call it directly
-            papers = self.web_scraper.scrape_recent_papers(
-                categories=self.categories,
-                days=days,
-                max_results=max_results
-            )
-            return papers
-            
-        except Exception as e:
-            logger.error(f"Web scraping failed: {e}")
-            raise WebScrapingError(f"Web scraping failed: {e}")
-    
-    def fetch_papers_sync(self, days: int = 1, max_results: int = 100) -> FetchResult:
-        """Synchronous version of fetch_papers for compatibility.
-        
-        Args:
-            days: Number of days to look back
-            max_results: Maximum number of papers to return
-            
-        Returns:
-            FetchResult containing papers and metadata
-        """
-        # First, try the ArXiv API
-        try:
-            logger.info("Attempting to fetch papers using ArXiv API (sync)...")
-            
-            papers = self.retry_handler.execute_sync_with_retry(
-                self.api_fetcher.fetch_recent,
-                days=days,
-                max_results=max_results
-            )
-            
-            # Check if we got meaningful results
-            if papers and len(papers) > 0:
-                logger.info(f"Successfully fetched {len(papers)} papers using ArXiv API (sync)")
-                return FetchResult(
-                    papers=papers,
-                    method=FetchMethod.ARXIV_API,
-                    success=True
-                )
-            else:
-                logger.warning("ArXiv API returned 0 papers, trying web scraping fallback (sync)...")
-                
-        except Exception as e:
-            logger.warning(f"ArXiv API failed (sync): {e}, trying web scraping fallback...")
-        
-        # Fallback to web scraping if enabled
-        if self.network_config.enable_web_fallback:
-            try:
-                logger.info("Attempting to fetch papers using web scraping (sync)...")
-                
-                papers = self.retry_handler.execute_sync_with_retry(
-                    self.web_scraper.scrape_recent_papers,
-                    categories=self.categories,
-                    days=days,
-                    max_results=max_results
-                )
-                
-                if papers and len(papers) > 0:
-                    logger.info(f"Successfully fetched {len(papers)} papers using web scraping (sync)")
-                    return FetchResult(
-                        papers=papers,
-                        method=FetchMethod.WEB_SCRAPING,
-                        success=True
-                    )
-                else:
-                    logger.error("Web scraping also returned 0 papers (sync)")
-                    
-            except Exception as e:
-                logger.error(f"Web scraping also failed (sync): {e}")
-                return FetchResult(
-                    papers=[],
-                    method=FetchMethod.WEB_SCRAPING,
-                    success=False,
-                    error_message=f"Both API and web scraping failed. Last error: {e}"
-                )
-        
-        # Both methods failed or web fallback is disabled
-        return FetchResult(
-            papers=[],
-            method=FetchMethod.ARXIV_API,
-            success=False,
-            error_message="ArXiv API failed and web fallback is disabled or also failed"
-        )
\ No newline at end of file
+"""Enhanced ArXiv fetcher with web scraping fallback."""
+
+import asyncio
+import dataclasses
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from ..config import NetworkConfig
+from ..models.paper import Paper
+from .base_fetcher import FetchResult, FetchMethod
+from .arxiv_fetcher import ArXivFetcher
+from .arxiv_web_scraper import ArXivWebScraper
+from .retry_handler import RetryHandler
+from .exceptions import ArXivAPIError, WebScrapingError
+
+logger = logging.getLogger(__name__)
+
+# Successful fetch_papers results are reused for this many seconds, then
+# served stale for up to FETCH_CACHE_STALE more while a refresh runs
+FETCH_CACHE_TTL = 900.0
+FETCH_CACHE_STALE = 900.0
+FETCH_CACHE_MAX_ENTRIES = 32
+
+# Event loop behind fetch_papers_sync, shared by every fetcher and kept
+# running in a daemon thread so background cache refreshes make progress
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_loop_lock = threading.Lock()
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    """Get or start the shared event loop for synchronous callers."""
+    global _sync_loop
+    with _sync_loop_lock:
+        if _sync_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="arxiv-fetch-loop", daemon=True).start()
+            _sync_loop = loop
+        return _sync_loop
+
+
+class EnhancedArXivFetcher:
+    """Enhanced ArXiv fetcher with fallback mechanisms."""
+    
+    def __init__(
+        self, 
+        categories: Optional[List[str]] = None,
+        http_proxy: Optional[str] = None,
+        https_proxy: Optional[str] = None,
+        network_config: Optional[NetworkConfig] = None
+    ):
+        """Initialize enhanced fetcher.
+        
+        Args:
+            categories: List of ArXiv categories to fetch
+            http_proxy: HTTP proxy URL
+            https_proxy: HTTPS proxy URL
+            network_config: Network configuration for retry and fallback
+        """
+        # Each category costs a listing page when scraping; drop repeats
+        self.categories = list(dict.fromkeys(categories or ["cs.AI", "cs.CL", "cs.CV", "cs.LG"]))
+        self.network_config = network_config or NetworkConfig()
+        
+        # Initialize components
+        self.api_fetcher = ArXivFetcher(
+            categories=self.categories,
+            http_proxy=http_proxy,
+            https_proxy=https_proxy
+        )
+        
+        self.web_scraper = ArXivWebScraper(timeout=self.network_config.request_timeout)
+        self.retry_handler = RetryHandler(
+            self.network_config.request_timeout,
+            failure_threshold=self.network_config.circuit_failure_threshold,
+            cooldown=self.network_config.circuit_cooldown
+        )
+        
+        # (days, max_results) -> (expiry, result), least recently used first
+        self._cache: "OrderedDict[Tuple[int, int], Tuple[float, FetchResult]]" = OrderedDict()
+        self._refreshes: Dict[Tuple[int, int], asyncio.Task] = {}
+    
+    async def fetch_papers(self, days: int = 1, max_results: int = 100) -> FetchResult:
+        """Fetch papers, reusing a recent successful result.
+        
+        A result younger than FETCH_CACHE_TTL is returned as is. One that
+        expired less than FETCH_CACHE_STALE ago is still returned, while a
+        refresh runs in the background. Cached results come back with
+        method FetchMethod.CACHE and their original fetch_time.
+        
+        Args:
+            days: Number of days to look back
+            max_results: Maximum number of papers to return
+            
+        Returns:
+            FetchResult containing papers and metadata
+        """
+        key = (days, max_results)
+        entry = self._cache.get(key)
+        if entry is not None:
+            expiry, result = entry
+            now = time.monotonic()
+            if now < expiry + FETCH_CACHE_STALE:
+                self._cache.move_to_end(key)
+                if now >= expiry and key not in self._refreshes:
+                    task = asyncio.ensure_future(self._fetch_and_cache(key))
+                    self._refreshes[key] = task
+                    task.add_done_callback(lambda _: self._refreshes.pop(key, None))
+                return dataclasses.replace(result, papers=list(result.papers), method=FetchMethod.CACHE)
+        
+        return await self._fetch_and_cache(key)
+    
+    async def _fetch_and_cache(self, key: Tuple[int, int]) -> FetchResult:
+        """Fetch papers for a cache key and cache the result if it succeeded."""
+        result = await self._fetch_papers_uncached(*key)
+        if result.success:
+            # Keep a copy so callers extending result.papers don't touch it
+            cached = dataclasses.replace(result, papers=list(result.papers))
+            self._cache[key] = (time.monotonic() + FETCH_CACHE_TTL, cached)
+            self._cache.move_to_end(key)
+            if len(self._cache) > FETCH_CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+        return result
+    
+    async def _fetch_papers_uncached(self, days: int, max_results: int) -> FetchResult:
+        """Fetch papers using API, hedged with web scraping.
+        
+        The ArXiv API is tried first. If it has not returned papers within
+        network_config.hedge_delay seconds, or fails or comes back empty
+        sooner, web scraping is started alongside it; whichever source
+        first returns papers wins and the other is cancelled.
+        
+        Args:
+            days: Number of days to look back
+            max_results: Maximum number of papers to return
+            
+        Returns:
+            FetchResult containing papers and metadata
+        """
+        logger.info("Attempting to fetch papers using ArXiv API...")
+        tasks = {asyncio.ensure_future(self._fetch_from(FetchMethod.ARXIV_API, days, max_results))}
+        # Without web fallback there is nothing to hedge with
+        hedged = not self.network_config.enable_web_fallback
+        last_error = None
+        
+        try:
+            while tasks:
+                done, tasks = await asyncio.wait(
+                    tasks,
+                    timeout=None if hedged else self.network_config.hedge_delay,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    method, papers, error = task.result()
+                    if papers:
+                        logger.info(f"Successfully fetched {len(papers)} papers using {method.value}")
+                        return FetchResult(papers=papers, method=method, success=True)
+                    last_error = error or f"{method.value} returned 0 papers"
+                
+                if not hedged:
+                    hedged = True
+                    logger.info("Attempting to fetch papers using web scraping...")
+                    tasks.add(asyncio.ensure_future(
+                        self._fetch_from(FetchMethod.WEB_SCRAPING, days, max_results)
+                    ))
+        finally:
+            for task in tasks:
+                task.cancel()
+        
+        if self.network_config.enable_web_fallback:
+            return FetchResult(
+                papers=[],
+                method=FetchMethod.WEB_SCRAPING,
+                success=False,
+                error_message=f"Both API and web scraping failed. Last error: {last_error}"
+            )
+        
+        # Web fallback is disabled
+        return FetchResult(
+            papers=[],
+            method=FetchMethod.ARXIV_API,
+            success=False,
+            error_message="ArXiv API failed and web fallback is disabled or also failed"
+        )
+    
+    async def _fetch_from(
+        self,
+        method: FetchMethod,
+        days: int,
+        max_results: int
+    ) -> Tuple[FetchMethod, List[Paper], Optional[str]]:
+        """Fetch papers from one source with retries, never raising.
+        
+        Returns:
+            The method, the papers (empty on failure) and the error message
+        """
+        fetch = self._fetch_with_api if method is FetchMethod.ARXIV_API else self._fetch_with_web_scraping
+        try:
+            papers = await self.retry_handler.execute_with_retry(fetch, days=days, max_results=max_results)
+        except Exception as e:
+            logger.warning(f"{method.value} failed: {e}")
+            return method, [], str(e)
+        if not papers:
+            logger.warning(f"{method.value} returned 0 papers")
+        return method, papers or [], None
+    
+    async def _fetch_with_api(self, days: int, max_results: int) -> List[Paper]:
+        """Fetch papers using ArXiv API.
+        
+        Args:
+            days: Number of days to look back
+            max_results: Maximum number of papers
+            
+        Returns:
+            List of Paper objects
+            
+        Raises:
+            ArXivAPIError: When API fetch fails
+        """
+        try:
+            # ArXivFetcher is synchronous; run it in a worker thread so the
+            # retry timeout applies and the scrape can run alongside it
+            papers = await asyncio.to_thread(self.api_fetcher.fetch_recent, days=days, max_results=max_results)
+            return papers
+            
+        except Exception as e:
+            logger.error(f"ArXiv API fetch failed: {e}")
+            raise ArXivAPIError(f"ArXiv API fetch failed: {e}")
+    
+    async def _fetch_with_web_scraping(self, days: int, max_results: int) -> List[Paper]:
+        """Fetch papers using web scraping.
+        
+        Args:
+            days: Number of days to look back
+            max_results: Maximum number of papers
+            
+        Returns:
+            List of Paper objects
+            
+        Raises:
+            WebScrapingError: When web scraping fails
+        """
+        try:
+            # Web scraper is synchronous, so it runs in a worker thread
+            papers = await asyncio.to_thread(
+                self.web_scraper.scrape_recent_papers,
+                categories=self.categories,
+                days=days,
+                max_results=max_results
+            )
+            return papers
+            
+        except Exception as e:
+            logger.error(f"Web scraping failed: {e}")
+            raise WebScrapingError(f"Web scraping failed: {e}")
+    
+    def fetch_papers_sync(self, days: int = 1, max_results: int = 100) -> FetchResult:
+        """Synchronous version of fetch_papers for compatibility.
+        
+        Runs fetch_papers on a shared event loop thread that is started on
+        first use and reused by later calls, so the hedging and the result
+        cache behave as in the async version.
+        
+        Args:
+            days: Number of days to look back
+            max_results: Maximum number of papers to return
+            
+        Returns:
+            FetchResult containing papers and metadata
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self.fetch_papers(days=days, max_results=max_results),
+            _get_sync_loop()
+        )
+        return future.result()
+    
+    def fetch_recent(self, days: int = 1, max_results: int = 100) -> List[Paper]:
+        """Fetch recent papers, with the same interface as ArXivFetcher.
+        
+        Args:
+            days: Number of days to look back
+            max_results: Maximum number of papers to return
+            
+        Returns:
+            List of Paper objects, empty if every source failed
+        """
+        result = self.fetch_papers_sync(days=days, max_results=max_results)
+        if not result.success:
+            logger.error(result.error_message)
+        return result.papers
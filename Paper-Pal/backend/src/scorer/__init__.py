@@ -1,15 +1,15 @@
-"""LLM scoring pipeline."""
-
-from .llm_scorer import (
-    LLMScorer,
-    SCORING_PROMPT_TEMPLATE,
-    scored_paper_to_db_dict,
-    store_scored_papers
-)
-
-__all__ = [
-    "LLMScorer",
-    "SCORING_PROMPT_TEMPLATE",
-    "scored_paper_to_db_dict",
-    "store_scored_papers"
-]
+"""LLM scoring pipeline."""
+
+from .llm_scorer import (
+    LLMScorer,
+    SCORING_PROMPT_TEMPLATE,
+    scored_paper_to_db_dict,
+    store_scored_papers
+)
+
+__all__ = [
+    "LLMScorer",
+    "SCORING_PROMPT_TEMPLATE",
+    "scored_paper_to_db_dict",
+    "store_scored_papers"
+]
@@ -1 +1 @@
-"""Tests for Paper Pal backend."""
+"""Tests for Paper Pal backend."""
@@ -1 +1 @@
-"""Property-based tests for Paper Pal backend."""
+"""Property-based tests for Paper Pal backend."""
@@ -1,257 +1,257 @@
-"""Property-based tests for LLM output structure validity.
-
-Feature: paper-pal, Property 6: LLM Output Structure Validity
-Validates: Requirements 5.1, 5.3, 5.4
-
-For any ScoredPaper returned by LLM_Scorer:
-- relevance_score SHALL be in range [0, 10]
-- novelty_score SHALL be in range [0, 10]
-- one_liner SHALL be a non-empty string
-- pros SHALL be a list of exactly 2 non-empty strings
-- cons SHALL be a list of exactly 1 non-empty string
-"""
-
-from datetime import datetime, timezone
-from hypothesis import given, settings, strategies as st, assume
-
-from src.models import Paper, ScoredPaper
-
-
-# Strategy for generating valid scores (0-10)
-valid_score_strategy = st.floats(min_value=0.0, max_value=10.0, allow_nan=False, allow_infinity=False)
-
-# Strategy for generating non-empty strings
-non_empty_string = st.text(min_size=1, max_size=200).filter(lambda s: s.strip())
-
-# Strategy for generating Paper objects
-paper_strategy = st.builds(
-    Paper,
-    id=st.text(min_size=5, max_size=20),
-    title=non_empty_string,
-    abstract=non_empty_string,
-    authors=st.lists(non_empty_string, min_size=1, max_size=5),
-    categories=st.lists(st.sampled_from(["cs.AI", "cs.CL", "cs.CV", "cs.LG"]), min_size=1, max_size=4),
-    published=st.datetimes(min_value=datetime(2020, 1, 1), max_value=datetime(2030, 12, 31)).map(
-        lambda dt: dt.replace(tzinfo=timezone.utc)
-    ),
-    source=st.sampled_from(["arxiv", "huggingface"]),
-    url=st.text(min_size=10, max_size=100)
-)
-
-# Strategy for generating valid ScoredPaper objects (as would be returned by LLM_Scorer)
-valid_scored_paper_strategy = st.builds(
-    ScoredPaper,
-    paper=paper_strategy,
-    relevance_score=valid_score_strategy,
-    novelty_score=valid_score_strategy,
-    total_score=st.floats(min_value=0.0, max_value=20.0, allow_nan=False, allow_infinity=False),
-    one_liner=non_empty_string,
-    pros=st.lists(non_empty_string, min_size=2, max_size=2),
-    cons=st.lists(non_empty_string, min_size=1, max_size=1)
-)
-
-
-# Feature: paper-pal, Property 6: LLM Output Structure Validity
-# Validates: Requirements 5.1
-@given(scored_paper=valid_scored_paper_strategy)
-@settings(max_examples=100)
-def test_relevance_score_in_valid_range(scored_paper: ScoredPaper):
-    """Property: relevance_score SHALL be in range [0, 10]."""
-    assert 0.0 <= scored_paper.relevance_score <= 10.0, (
-        f"relevance_score {scored_paper.relevance_score} is outside valid range [0, 10]"
-    )
-
-
-# Feature: paper-pal, Property 6: LLM Output Structure Validity
-# Validates: Requirements 5.1
-@given(scored_paper=valid_scored_paper_strategy)
-@settings(max_examples=100)
-def test_novelty_score_in_valid_range(scored_paper: ScoredPaper):
-    """Property: novelty_score SHALL be in range [0, 10]."""
-    assert 0.0 <= scored_paper.novelty_score <= 10.0, (
-        f"novelty_score {scored_paper.novelty_score} is outside valid range [0, 10]"
-    )
-
-
-# Feature: paper-pal, Property 6: LLM Output Structure Validity
-# Validates: Requirements 5.3
-@given(scored_paper=valid_scored_paper_strategy)
-@settings(max_examples=100)
-def test_one_liner_is_non_empty_string(scored_paper: ScoredPaper):
-    """Property: one_liner SHALL be a non-empty string."""
-    assert isinstance(scored_paper.one_liner, str), (
-        f"one_liner should be a string, got {type(scored_paper.one_liner)}"
-    )
-    assert len(scored_paper.one_liner.strip()) > 0, (
-        "one_liner should not be empty or whitespace-only"
-    )
-
-
-# Feature: paper-pal, Property 6: LLM Output Structure Validity
-# Validates: Requirements 5.4
-@given(scored_paper=valid_scored_paper_strategy)
-@settings(max_examples=100)
-def test_pros_has_exactly_two_non_empty_strings(scored_paper: ScoredPaper):
-    """Property: pros SHALL be a list of exactly 2 non-empty strings."""
-    assert isinstance(scored_paper.pros, list), (
-        f"pros should be a list, got {type(scored_paper.pros)}"
-    )
-    assert len(scored_paper.pros) == 2, (
-        f"pros should have exactly 2 items, got {len(scored_paper.pros)}"
-    )
-    for i, pro in enumerate(scored_paper.pros):
-        assert isinstance(pro, str), (
-            f"pros[{i}] should be a string, got {type(pro)}"
-        )
-        assert len(pro.strip()) > 0, (
-            f"pros[{i}] should not be empty or whitespace-only"
-        )
-
-
-# Feature: paper-pal, Property 6: LLM Output Structure Validity
-# Validates: Requirements 5.4
-@given(scored_paper=valid_scored_paper_strategy)
-@settings(max_examples=100)
-def test_cons_has_exactly_one_non_empty_string(scored_paper: ScoredPaper):
-    """Property: cons SHALL be a list of exactly 1 non-empty string."""
-    assert isinstance(scored_paper.cons, list), (
-        f"cons should be a list, got {type(scored_paper.cons)}"
-    )
-    assert len(scored_paper.cons) == 1, (
-        f"cons should have exactly 1 item, got {len(scored_paper.cons)}"
-    )
-    assert isinstance(scored_paper.cons[0], str), (
-        f"cons[0] should be a string, got {type(scored_paper.cons[0])}"
-    )
-    assert len(scored_paper.cons[0].strip()) > 0, (
-        "cons[0] should not be empty or whitespace-only"
-    )
-
-
-# Feature: paper-pal, Property 6: LLM Output Structure Validity
-# Validates: Requirements 5.1, 5.3, 5.4
-@given(scored_paper=valid_scored_paper_strategy)
-@settings(max_examples=100)
-def test_scored_paper_structure_validity_combined(scored_paper: ScoredPaper):
-    """Property: ScoredPaper SHALL have all required fields with valid structure."""
-    # Relevance score in range [0, 10]
-    assert 0.0 <= scored_paper.relevance_score <= 10.0
-    
-    # Novelty score in range [0, 10]
-    assert 0.0 <= scored_paper.novelty_score <= 10.0
-    
-    # One-liner is non-empty string
-    assert isinstance(scored_paper.one_liner, str)
-    assert scored_paper.one_liner.strip()
-    
-    # Pros is list of exactly 2 non-empty strings
-    assert isinstance(scored_paper.pros, list)
-    assert len(scored_paper.pros) == 2
-    assert all(isinstance(p, str) and p.strip() for p in scored_paper.pros)
-    
-    # Cons is list of exactly 1 non-empty string
-    assert isinstance(scored_paper.cons, list)
-    assert len(scored_paper.cons) == 1
-    assert isinstance(scored_paper.cons[0], str) and scored_paper.cons[0].strip()
-
-
-# Test for the validation function in LLMScorer
-# This tests that the _validate_and_normalize_response method correctly validates LLM output
-# Note: We implement the validation logic inline to avoid importing LLMScorer which has
-# problematic dependencies (pyiceberg/pydantic version conflicts)
-
-def _validate_and_normalize_response(data: dict) -> dict:
-    """Standalone validation function matching LLMScorer._validate_and_normalize_response.
-    
-    This is a copy of the validation logic for testing purposes to avoid
-    importing the full LLMScorer class which has dependency issues.
-    """
-    # Validate relevance score
-    relevance = data.get("relevance")
-    if relevance is None:
-        raise ValueError("Missing 'relevance' field")
-    relevance = float(relevance)
-    relevance = max(0.0, min(10.0, relevance))  # Clamp to [0, 10]
-    
-    # Validate novelty score
-    novelty = data.get("novelty")
-    if novelty is None:
-        raise ValueError("Missing 'novelty' field")
-    novelty = float(novelty)
-    novelty = max(0.0, min(10.0, novelty))  # Clamp to [0, 10]
-    
-    # Validate one_liner
-    one_liner = data.get("one_liner", "")
-    if not one_liner or not isinstance(one_liner, str):
-        raise ValueError("Missing or invalid 'one_liner' field")
-    one_liner = one_liner.strip()
-    if not one_liner:
-        raise ValueError("'one_liner' cannot be empty")
-    
-    # Validate pros (must be exactly 2)
-    pros = data.get("pros", [])
-    if not isinstance(pros, list):
-        raise ValueError("'pros' must be a list")
-    pros = [str(p).strip() for p in pros if str(p).strip()]
-    if len(pros) < 2:
-        raise ValueError("'pros' must contain at least 2 items")
-    pros = pros[:2]  # Take only first 2
-    
-    # Validate cons (must be exactly 1)
-    cons = data.get("cons", [])
-    if not isinstance(cons, list):
-        raise ValueError("'cons' must be a list")
-    cons = [str(c).strip() for c in cons if str(c).strip()]
-    if len(cons) < 1:
-        raise ValueError("'cons' must contain at least 1 item")
-    cons = cons[:1]  # Take only first 1
-    
-    return {
-        "relevance": relevance,
-        "novelty": novelty,
-        "one_liner": one_liner,
-        "pros": pros,
-        "cons": cons
-    }
-
-
-def test_validate_response_clamps_scores():
-    """Test that scores outside [0, 10] are clamped to valid range."""
-    # Test clamping high values
-    data_high = {
-        "relevance": 15.0,
-        "novelty": 12.0,
-        "one_liner": "Test",
-        "pros": ["Pro 1", "Pro 2"],
-        "cons": ["Con 1"]
-    }
-    result = _validate_and_normalize_response(data_high)
-    assert result["relevance"] == 10.0
-    assert result["novelty"] == 10.0
-    
-    # Test clamping low values
-    data_low = {
-        "relevance": -5.0,
-        "novelty": -2.0,
-        "one_liner": "Test",
-        "pros": ["Pro 1", "Pro 2"],
-        "cons": ["Con 1"]
-    }
-    result = _validate_and_normalize_response(data_low)
-    assert result["relevance"] == 0.0
-    assert result["novelty"] == 0.0
-
-
-def test_validate_response_truncates_extra_pros_cons():
-    """Test that extra pros/cons are truncated to required count."""
-    data = {
-        "relevance": 8.0,
-        "novelty": 7.0,
-        "one_liner": "Test",
-        "pros": ["Pro 1", "Pro 2", "Pro 3", "Pro 4"],  # Extra pros
-        "cons": ["Con 1", "Con 2", "Con 3"]  # Extra cons
-    }
-    result = _validate_and_normalize_response(data)
-    
-    assert len(result["pros"]) == 2
-    assert len(result["cons"]) == 1
+"""Property-based tests for LLM output structure validity.
+
+Feature: paper-pal, Property 6: LLM Output Structure Validity
+Validates: Requirements 5.1, 5.3, 5.4
+
+For any ScoredPaper returned by LLM_Scorer:
+- relevance_score SHALL be in range [0, 10]
+- novelty_score SHALL be in range [0, 10]
+- one_liner SHALL be a non-empty string
+- pros SHALL be a list of exactly 2 non-empty strings
+- cons SHALL be a list of exactly 1 non-empty string
+"""
+
+from datetime import datetime, timezone
+from hypothesis import given, settings, strategies as st, assume
+
+from src.models import Paper, ScoredPaper
+
+
+# Strategy for generating valid scores (0-10)
+valid_score_strategy = st.floats(min_value=0.0, max_value=10.0, allow_nan=False, allow_infinity=False)
+
+# Strategy for generating non-empty strings
+non_empty_string = st.text(min_size=1, max_size=200).filter(lambda s: s.strip())
+
+# Strategy for generating Paper objects
+paper_strategy = st.builds(
+    Paper,
+    id=st.text(min_size=5, max_size=20),
+    title=non_empty_string,
+    abstract=non_empty_string,
+    authors=st.lists(non_empty_string, min_size=1, max_size=5),
+    categories=st.lists(st.sampled_from(["cs.AI", "cs.CL", "cs.CV", "cs.LG"]), min_size=1, max_size=4),
+    published=st.datetimes(min_value=datetime(2020, 1, 1), max_value=datetime(2030, 12, 31)).map(
+        lambda dt: dt.replace(tzinfo=timezone.utc)
+    ),
+    source=st.sampled_from(["arxiv", "huggingface"]),
+    url=st.text(min_size=10, max_size=100)
+)
+
+# Strategy for generating valid ScoredPaper objects (as would be returned by LLM_Scorer)
+valid_scored_paper_strategy = st.builds(
+    ScoredPaper,
+    paper=paper_strategy,
+    relevance_score=valid_score_strategy,
+    novelty_score=valid_score_strategy,
+    total_score=st.floats(min_value=0.0, max_value=20.0, allow_nan=False, allow_infinity=False),
+    one_liner=non_empty_string,
+    pros=st.lists(non_empty_string, min_size=2, max_size=2),
+    cons=st.lists(non_empty_string, min_size=1, max_size=1)
+)
+
+
+# Feature: paper-pal, Property 6: LLM Output Structure Validity
+# Validates: Requirements 5.1
+@given(scored_paper=valid_scored_paper_strategy)
+@settings(max_examples=100)
+def test_relevance_score_in_valid_range(scored_paper: ScoredPaper):
+    """Property: relevance_score SHALL be in range [0, 10]."""
+    assert 0.0 <= scored_paper.relevance_score <= 10.0, (
+        f"relevance_score {scored_paper.relevance_score} is outside valid range [0, 10]"
+    )
+
+
+# Feature: paper-pal, Property 6: LLM Output Structure Validity
+# Validates: Requirements 5.1
+@given(scored_paper=valid_scored_paper_strategy)
+@settings(max_examples=100)
+def test_novelty_score_in_valid_range(scored_paper: ScoredPaper):
+    """Property: novelty_score SHALL be in range [0, 10]."""
+    assert 0.0 <= scored_paper.novelty_score <= 10.0, (
+        f"novelty_score {scored_paper.novelty_score} is outside valid range [0, 10]"
+    )
+
+
+# Feature: paper-pal, Property 6: LLM Output Structure Validity
+# Validates: Requirements 5.3
+@given(scored_paper=valid_scored_paper_strategy)
+@settings(max_examples=100)
+def test_one_liner_is_non_empty_string(scored_paper: ScoredPaper):
+    """Property: one_liner SHALL be a non-empty string."""
+    assert isinstance(scored_paper.one_liner, str), (
+        f"one_liner should be a string, got {type(scored_paper.one_liner)}"
+    )
+    assert len(scored_paper.one_liner.strip()) > 0, (
+        "one_liner should not be empty or whitespace-only"
+    )
+
+
+# Feature: paper-pal, Property 6: LLM Output Structure Validity
+# Validates: Requirements 5.4
+@given(scored_paper=valid_scored_paper_strategy)
+@settings(max_examples=100)
+def test_pros_has_exactly_two_non_empty_strings(scored_paper: ScoredPaper):
+    """Property: pros SHALL be a list of exactly 2 non-empty strings."""
+    assert isinstance(scored_paper.pros, list), (
+        f"pros should be a list, got {type(scored_paper.pros)}"
+    )
+    assert len(scored_paper.pros) == 2, (
+        f"pros should have exactly 2 items, got {len(scored_paper.pros)}"
+    )
+    for i, pro in enumerate(scored_paper.pros):
+        assert isinstance(pro, str), (
+            f"pros[{i}] should be a string, got {type(pro)}"
+        )
+        assert len(pro.strip()) > 0, (
+            f"pros[{i}] should not be empty or whitespace-only"
+        )
+
+
+# Feature: paper-pal, Property 6: LLM Output Structure Validity
+# Validates: Requirements 5.4
+@given(scored_paper=valid_scored_paper_strategy)
+@settings(max_examples=100)
+def test_cons_has_exactly_one_non_empty_string(scored_paper: ScoredPaper):
+    """Property: cons SHALL be a list of exactly 1 non-empty string."""
+    assert isinstance(scored_paper.cons, list), (
+        f"cons should be a list, got {type(scored_paper.cons)}"
+    )
+    assert len(scored_paper.cons) == 1, (
+        f"cons should have exactly 1 item, got {len(scored_paper.cons)}"
+    )
+    assert isinstance(scored_paper.cons[0], str), (
+        f"cons[0] should be a string, got {type(scored_paper.cons[0])}"
+    )
+    assert len(scored_paper.cons[0].strip()) > 0, (
+        "cons[0] should not be empty or whitespace-only"
+    )
+
+
+# Feature: paper-pal, Property 6: LLM Output Structure Validity
+# Validates: Requirements 5.1, 5.3, 5.4
+@given(scored_paper=valid_scored_paper_strategy)
+@settings(max_examples=100)
+def test_scored_paper_structure_validity_combined(scored_paper: ScoredPaper):
+    """Property: ScoredPaper SHALL have all required fields with valid structure."""
+    # Relevance score in range [0, 10]
+    assert 0.0 <= scored_paper.relevance_score <= 10.0
+    
+    # Novelty score in range [0, 10]
+    assert 0.0 <= scored_paper.novelty_score <= 10.0
+    
+    # One-liner is non-empty string
+    assert isinstance(scored_paper.one_liner, str)
+    assert scored_paper.one_liner.strip()
+    
+    # Pros is list of exactly 2 non-empty strings
+    assert isinstance(scored_paper.pros, list)
+    assert len(scored_paper.pros) == 2
+    assert all(isinstance(p, str) and p.strip() for p in scored_paper.pros)
+    
+    # Cons is list of exactly 1 non-empty string
+    assert isinstance(scored_paper.cons, list)
+    assert len(scored_paper.cons) == 1
+    assert isinstance(scored_paper.cons[0], str) and scored_paper.cons[0].strip()
+
+
+# Test for the validation function in LLMScorer
+# This tests that the _validate_and_normalize_response method correctly validates LLM output
+# Note: We implement the validation logic inline to avoid importing LLMScorer which has
+# problematic dependencies (pyiceberg/pydantic version conflicts)
+
+def _validate_and_normalize_response(data: dict) -> dict:
+    """Standalone validation function matching LLMScorer._validate_and_normalize_response.
+    
+    This is a copy of the validation logic for testing purposes to avoid
+    importing the full LLMScorer class which has dependency issues.
+    """
+    # Validate relevance score
+    relevance = data.get("relevance")
+    if relevance is None:
+        raise ValueError("Missing 'relevance' field")
+    relevance = float(relevance)
+    relevance = max(0.0, min(10.0, relevance))  # Clamp to [0, 10]
+    
+    # Validate novelty score
+    novelty = data.get("novelty")
+    if novelty is None:
+        raise ValueError("Missing 'novelty' field")
+    novelty = float(novelty)
+    novelty = max(0.0, min(10.0, novelty))  # Clamp to [0, 10]
+    
+    # Validate one_liner
+    one_liner = data.get("one_liner", "")
+    if not one_liner or not isinstance(one_liner, str):
+        raise ValueError("Missing or invalid 'one_liner' field")
+    one_liner = one_liner.strip()
+    if not one_liner:
+        raise ValueError("'one_liner' cannot be empty")
+    
+    # Validate pros (must be exactly 2)
+    pros = data.get("pros", [])
+    if not isinstance(pros, list):
+        raise ValueError("'pros' must be a list")
+    pros = [str(p).strip() for p in pros if str(p).strip()]
+    if len(pros) < 2:
+        raise ValueError("'pros' must contain at least 2 items")
+    pros = pros[:2]  # Take only first 2
+    
+    # Validate cons (must be exactly 1)
+    cons = data.get("cons", [])
+    if not isinstance(cons, list):
+        raise ValueError("'cons' must be a list")
+    cons = [str(c).strip() for c in cons if str(c).strip()]
+    if len(cons) < 1:
+        raise ValueError("'cons' must contain at least 1 item")
+    cons = cons[:1]  # Take only first 1
+    
+    return {
+        "relevance": relevance,
+        "novelty": novelty,
+        "one_liner": one_liner,
+        "pros": pros,
+        "cons": cons
+    }
+
+
+def test_validate_response_clamps_scores():
+    """Test that scores outside [0, 10] are clamped to valid range."""
+    # Test clamping high values
+    data_high = {
+        "relevance": 15.0,
+        "novelty": 12.0,
+        "one_liner": "Test",
+        "pros": ["Pro 1", "Pro 2"],
+        "cons": ["Con 1"]
+    }
+    result = _validate_and_normalize_response(data_high)
+    assert result["relevance"] == 10.0
+    assert result["novelty"] == 10.0
+    
+    # Test clamping low values
+    data_low = {
+        "relevance": -5.0,
+        "novelty": -2.0,
+        "one_liner": "Test",
+        "pros": ["Pro 1", "Pro 2"],
+        "cons": ["Con 1"]
+    }
+    result = _validate_and_normalize_response(data_low)
+    assert result["relevance"] == 0.0
+    assert result["novelty"] == 0.0
+
+
+def test_validate_response_truncates_extra_pros_cons():
+    """Test that extra pros/cons are truncated to required count."""
+    data = {
+        "relevance": 8.0,
+        "novelty": 7.0,
+        "one_liner": "Test",
+        "pros": ["Pro 1", "Pro 2", "Pro 3", "Pro 4"],  # Extra pros
+        "cons": ["Con 1", "Con 2", "Con 3"]  # Extra cons
+    }
+    result = _validate_and_normalize_response(data)
+    
+    assert len(result["pros"]) == 2
+    assert len(result["cons"]) == 1
@@ -1 +1 @@
-"""Unit tests for Paper Pal backend."""
+"""Unit tests for Paper Pal backend."""
@@ -0,0 +1,94 @@
+"""Unit tests for the fetchers' result caches."""
+
+import asyncio
+from datetime import datetime, timezone
+
+from src.fetcher import enhanced_arxiv_fetcher
+from src.fetcher.base_fetcher import FetchMethod, FetchResult
+from src.fetcher.enhanced_arxiv_fetcher import EnhancedArXivFetcher
+from src.fetcher.huggingface_fetcher import HuggingFaceFetcher
+from src.models.paper import Paper
+
+
+def make_paper(paper_id: str) -> Paper:
+    return Paper(
+        id=paper_id,
+        title="Title",
+        abstract="Abstract",
+        authors=["Author"],
+        categories=["cs.AI"],
+        published=datetime.now(timezone.utc),
+        source="arxiv",
+        url=f"https://arxiv.org/abs/{paper_id}",
+    )
+
+
+def test_fetch_papers_reuses_successful_result(monkeypatch):
+    """Test repeat fetches hit the cache and failures are not cached."""
+    fetcher = EnhancedArXivFetcher()
+    calls = []
+
+    async def fake_fetch(days, max_results):
+        calls.append((days, max_results))
+        if days == 7:
+            return FetchResult(papers=[], method=FetchMethod.ARXIV_API, success=False)
+        return FetchResult(papers=[make_paper("1")], method=FetchMethod.ARXIV_API, success=True)
+
+    monkeypatch.setattr(fetcher, "_fetch_papers_uncached", fake_fetch)
+
+    async def run():
+        first = await fetcher.fetch_papers(days=1, max_results=10)
+        first.papers.append(make_paper("2"))
+        second = await fetcher.fetch_papers(days=1, max_results=10)
+        await fetcher.fetch_papers(days=7, max_results=10)
+        await fetcher.fetch_papers(days=7, max_results=10)
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first.method == FetchMethod.ARXIV_API
+    assert second.method == FetchMethod.CACHE
+    assert [p.id for p in second.papers] == ["1"]
+    assert calls == [(1, 10), (7, 10), (7, 10)]
+
+
+def test_fetch_papers_serves_stale_while_refreshing(monkeypatch):
+    """Test an expired result is returned while one refresh runs."""
+    fetcher = EnhancedArXivFetcher()
+    calls = []
+
+    async def fake_fetch(days, max_results):
+        calls.append(days)
+        await asyncio.sleep(0)
+        return FetchResult(papers=[make_paper(str(len(calls)))], method=FetchMethod.ARXIV_API, success=True)
+
+    monkeypatch.setattr(fetcher, "_fetch_papers_uncached", fake_fetch)
+    monkeypatch.setattr(enhanced_arxiv_fetcher, "FETCH_CACHE_TTL", -1.0)
+
+    async def run():
+        await fetcher.fetch_papers()
+        stale = await fetcher.fetch_papers()
+        again = await fetcher.fetch_papers()
+        await asyncio.gather(*fetcher._refreshes.values())
+        return stale, again
+
+    stale, again = asyncio.run(run())
+
+    assert [p.id for p in stale.papers] == ["1"]
+    assert [p.id for p in again.papers] == ["1"]
+    assert len(calls) == 2
+    assert not fetcher._refreshes
+
+
+def test_fetch_daily_caches_non_empty_results(monkeypatch):
+    """Test daily papers are fetched once and an empty fetch is retried."""
+    fetcher = HuggingFaceFetcher()
+    responses = [[], [make_paper("1")]]
+    monkeypatch.setattr(fetcher, "_fetch_daily_uncached", lambda: responses.pop(0))
+
+    assert fetcher.fetch_daily() == []
+    papers = fetcher.fetch_daily()
+    papers.clear()
+
+    assert [p.id for p in fetcher.fetch_daily()] == ["1"]
+    assert responses == []
@@ -0,0 +1,155 @@
+"""Unit tests for JSON file storage."""
+
+import pytest
+from src.db.json_storage import JsonStorage
+
+
+@pytest.fixture
+def storage(tmp_path) -> JsonStorage:
+    """Create a storage instance in a temporary directory."""
+    return JsonStorage(str(tmp_path))
+
+
+def test_saved_papers_pagination(storage):
+    """Test saved papers are paginated newest first and counted per user."""
+    storage.upsert_paper({"arxiv_id": "p1", "title": "Paper 1"})
+    for paper_id in ["p1", "p2", "p3"]:
+        storage.save_paper("default", paper_id)
+    storage.save_paper("other", "p1")
+    
+    page = storage.get_saved_papers("default", limit=2, offset=0)
+    rest = storage.get_saved_papers("default", limit=2, offset=2)
+    
+    assert [s["paper_id"] for s in page] == ["p3", "p2"]
+    assert [s["paper_id"] for s in rest] == ["p1"]
+    assert rest[0]["paper"]["title"] == "Paper 1"
+    assert "paper" not in page[0]
+    assert storage.count_saved_papers("default") == 3
+    assert storage.count_saved_papers("other") == 1
+
+
+def test_papers_keyset_pagination(storage):
+    """Test paging with an after-cursor visits every paper exactly once."""
+    for i, score in enumerate([5.0, 9.0, 5.0, 7.0]):
+        storage.upsert_paper({"arxiv_id": f"p{i}", "total_score": score})
+    
+    seen = []
+    after = None
+    while True:
+        page = storage.get_papers(limit=3, after=after)
+        seen.extend(p["arxiv_id"] for p in page)
+        if len(page) < 3:
+            break
+        after = (page[-1]["total_score"], page[-1]["arxiv_id"])
+    
+    assert seen == ["p1", "p3", "p2", "p0"]
+
+
+def test_upsert_papers_single_write(storage, monkeypatch):
+    """Test bulk upsert updates and inserts with one file write."""
+    storage.upsert_paper({"arxiv_id": "p1", "title": "Old"})
+    writes = []
+    original_write = storage._write_json
+    monkeypatch.setattr(storage, "_write_json", lambda path, data: (writes.append(path), original_write(path, data)))
+    
+    storage.upsert_papers([{"arxiv_id": "p1", "title": "New"}, {"arxiv_id": "p2", "title": "Other"}])
+    
+    assert len(writes) == 1
+    assert storage.get_paper_by_id("p1")["title"] == "New"
+    assert storage.get_stats()["total_papers"] == 2
+
+
+def test_writes_are_cached_until_flush(storage):
+    """Test writes are served from memory and reach disk on flush."""
+    storage.upsert_paper({"arxiv_id": "p1", "title": "Cached"})
+    
+    assert storage.get_paper_by_id("p1")["title"] == "Cached"
+    assert b"Cached" not in storage._papers_file.read_bytes()
+    
+    storage.flush()
+    
+    assert b"Cached" in storage._papers_file.read_bytes()
+    assert not list(storage._data_dir.glob("*.tmp"))
+    assert JsonStorage(str(storage._data_dir)).get_paper_by_id("p1")["title"] == "Cached"
+
+
+def test_external_change_is_reloaded(storage):
+    """Test a file rewritten on disk is re-read instead of served stale."""
+    storage.upsert_paper({"arxiv_id": "p1", "title": "Old"})
+    storage.flush()
+    assert storage.get_paper_by_id("p1")["title"] == "Old"
+    
+    other = JsonStorage(str(storage._data_dir))
+    other.upsert_paper({"arxiv_id": "p1", "title": "Newer"})
+    other.flush()
+    
+    assert storage.get_paper_by_id("p1")["title"] == "Newer"
+
+
+def test_paper_index_tracks_inserts_and_reloads(storage):
+    """Test lookups by ID see inserted papers and files replaced on disk."""
+    storage.insert_paper({"id": "legacy", "title": "No arxiv_id"})
+    storage.upsert_paper({"arxiv_id": "p1", "title": "First"})
+    
+    assert storage.get_paper_by_id("legacy")["title"] == "No arxiv_id"
+    assert storage.get_paper_by_id("p1")["title"] == "First"
+    assert storage.get_paper_by_id("missing") is None
+    
+    storage.flush()
+    storage._papers_file.write_bytes(b'[{"arxiv_id": "p2", "title": "Replaced on disk"}]')
+    
+    assert storage.get_paper_by_id("p1") is None
+    assert storage.get_paper_by_id("p2")["title"] == "Replaced on disk"
+
+
+def test_burst_of_writes_is_flushed_once(storage, monkeypatch):
+    """Test many mutations before a flush produce one write per file."""
+    from src.db import json_storage
+    
+    written = []
+    original = json_storage._atomic_write_bytes
+    monkeypatch.setattr(json_storage, "_atomic_write_bytes", lambda path, payload: (written.append(path.name), original(path, payload)))
+    
+    for i in range(20):
+        storage.insert_paper({"arxiv_id": f"p{i}"})
+        storage.save_paper("default", f"p{i}")
+    storage.flush()
+    
+    assert sorted(written) == ["papers.json", "saved_papers.json"]
+    assert storage.get_stats()["total_papers"] == 20
+    assert JsonStorage(str(storage._data_dir)).count_saved_papers("default") == 20
+
+
+def test_concurrent_inserts_are_not_lost(storage):
+    """Test concurrent read-modify-write mutations keep every change."""
+    from concurrent.futures import ThreadPoolExecutor
+    
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda i: storage.insert_paper({"arxiv_id": f"p{i}"}), range(200)))
+        list(pool.map(lambda i: storage.save_paper("default", f"p{i}"), range(200)))
+    storage.flush()
+    
+    reloaded = JsonStorage(str(storage._data_dir))
+    assert reloaded.get_stats()["total_papers"] == 200
+    assert reloaded.count_saved_papers("default") == 200
+
+
+def test_get_papers_matches_full_sort(storage):
+    """Test score-index pagination matches filtering and sorting the list."""
+    scores = [3.0, None, 7.5, 7.5, 9.0, 1.0, 7.5, 5.0]
+    for i, score in enumerate(scores):
+        storage.upsert_paper({"arxiv_id": f"p{i}", "total_score": score})
+    storage.upsert_paper({"arxiv_id": "p5", "total_score": 8.0})
+    
+    everything = storage.get_papers(limit=100)
+    expected = sorted(everything, key=lambda p: (p.get("total_score") or 0, p["arxiv_id"]), reverse=True)
+    assert everything == expected
+    
+    for min_score in (None, 0.0, 5.0, 7.5, 10.0):
+        for offset in range(0, 9, 3):
+            page = storage.get_papers(limit=3, offset=offset, min_score=min_score)
+            matching = [p for p in expected if min_score is None or (p.get("total_score") or 0) >= min_score]
+            assert page == matching[offset:offset + 3]
+    
+    after = (7.5, "p3")
+    assert [p["arxiv_id"] for p in storage.get_papers(limit=2, min_score=5.0, after=after)] == ["p2", "p7"]
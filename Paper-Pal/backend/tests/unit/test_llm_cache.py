@@ -0,0 +1,57 @@
+"""Unit tests for the LLM response cache."""
+
+from src.api.llm_cache import LLMCache
+
+
+MESSAGES = [{"role": "user", "content": "看公式"}]
+URL = "https://api.example/v1"
+
+
+def test_key_ignores_dict_order():
+    """Test requests differing only in key order share a cache key."""
+    key = LLMCache.make_key("m", MESSAGES, 0.7, URL)
+    reordered = LLMCache.make_key("m", [{"content": "看公式", "role": "user"}], 0.7, URL)
+
+    assert key == reordered
+    assert key != LLMCache.make_key("m", MESSAGES, 0.0, URL)
+    assert key != LLMCache.make_key("other", MESSAGES, 0.7, URL)
+    assert key != LLMCache.make_key("m", MESSAGES, 0.7, "https://other.example/v1")
+
+
+def test_lru_eviction_and_ttl():
+    """Test the least recently used entry is evicted and expired entries miss."""
+    cache = LLMCache(max_size=2)
+    cache.set("a", "A")
+    cache.set("b", "B")
+    assert cache.get("a") == "A"
+    cache.set("c", "C")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert len(cache) == 2
+
+    expired = LLMCache(ttl=0)
+    expired.set("a", "A")
+    assert expired.get("a") is None
+
+
+def test_completion_key_normalizes_only_the_question():
+    """Test only the final user turn is case and spacing insensitive."""
+    from openai import AsyncOpenAI
+    from src.api.routes import _completion_key
+
+    cache = LLMCache()
+    CLIENT = AsyncOpenAI(api_key="k", base_url=URL)
+
+    def key(context, question):
+        return _completion_key(cache, CLIENT, {
+            "model": "m",
+            "temperature": 0.7,
+            "messages": [
+                {"role": "system", "content": context},
+                {"role": "user", "content": question},
+            ],
+        })
+
+    assert key("def f(x):\n    return X", "What does f do?") == key("def f(x):\n    return X", "  what DOES f  do?")
+    assert key("def f(x):\n    return X", "q") != key("def f(x): return x", "q")
@@ -0,0 +1,78 @@
+"""Unit tests for the retry handler's circuit breaker."""
+
+import functools
+
+import pytest
+
+from src.fetcher.retry_handler import MAX_CIRCUITS, ArXivAPIError, CircuitOpenError, RetryHandler
+
+
+def make_handler(**kwargs) -> RetryHandler:
+    handler = RetryHandler(timeout=5.0, **kwargs)
+    handler.base_delay = handler.max_delay = 0.0
+    return handler
+
+
+def test_circuit_opens_after_consecutive_failures():
+    """Test a failing function is refused without being called once open."""
+    handler = make_handler(failure_threshold=2, cooldown=60.0)
+    calls = []
+
+    def fail():
+        calls.append(1)
+        raise OSError("down")
+
+    with pytest.raises(ArXivAPIError):
+        handler.execute_sync_with_retry(fail)
+    assert len(calls) == 2
+
+    with pytest.raises(CircuitOpenError):
+        handler.execute_sync_with_retry(fail)
+    assert len(calls) == 2
+
+    # Other functions have their own circuit
+    assert handler.execute_sync_with_retry(lambda: "ok") == "ok"
+
+
+def test_lambdas_and_partials_get_their_own_circuit():
+    """Test two lambdas do not share a circuit and partials use their function."""
+    handler = make_handler(failure_threshold=1, cooldown=60.0)
+
+    def fail():
+        raise OSError("down")
+
+    failing = lambda: fail()  # noqa: E731
+    working = lambda: "ok"  # noqa: E731
+
+    with pytest.raises(ArXivAPIError):
+        handler.execute_sync_with_retry(failing)
+    with pytest.raises(CircuitOpenError):
+        handler.execute_sync_with_retry(failing)
+    assert handler.execute_sync_with_retry(working) == "ok"
+
+    def echo(value):
+        return value
+
+    for value in range(MAX_CIRCUITS * 2):
+        assert handler.execute_sync_with_retry(functools.partial(echo, value)) == value
+    assert handler._breaker_for(functools.partial(echo, -1)) is handler._breaker_for(echo)
+    assert len(handler._breakers) <= MAX_CIRCUITS
+
+
+def test_half_open_probe_closes_circuit():
+    """Test after the cooldown one probe runs and its success closes the circuit."""
+    handler = make_handler(failure_threshold=1, cooldown=0.0)
+    outcomes = [OSError("down"), "ok", "ok"]
+
+    def flaky():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    with pytest.raises(ArXivAPIError):
+        handler.execute_sync_with_retry(flaky)
+
+    assert handler.execute_sync_with_retry(flaky) == "ok"
+    assert handler._breaker_for(flaky).state == "closed"
+    assert handler.execute_sync_with_retry(flaky) == "ok"
@@ -0,0 +1,69 @@
+"""Unit tests for cursor pagination in the papers API."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api import routes
+from src.db import json_storage
+from src.db.json_storage import JsonStorage
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    """Use a fresh JSON storage as the storage singleton."""
+    store = JsonStorage(str(tmp_path))
+    monkeypatch.setattr(json_storage, "_storage", store)
+    return store
+
+
+@pytest.fixture
+def client(storage):
+    app = FastAPI()
+    app.include_router(routes.papers_router)
+    return TestClient(app)
+
+
+def add_paper(storage: JsonStorage, arxiv_id: str, score: float) -> None:
+    storage.upsert_paper({
+        "arxiv_id": arxiv_id,
+        "title": "Title",
+        "abstract": "Abstract",
+        "authors": [],
+        "categories": ["cs.AI"],
+        "published": "2024-01-01T00:00:00+00:00",
+        "source": "arxiv",
+        "url": "u",
+        "total_score": score,
+    })
+
+
+def test_papers_exactly_one_page_has_no_cursor(client, storage):
+    """Test a full last page does not hand out a cursor to an empty page."""
+    for i in range(6):
+        add_paper(storage, f"p{i}", float(i))
+
+    first = client.get("/api/papers/", params={"limit": 3}).json()
+    assert [p["id"] for p in first["papers"]] == ["p5", "p4", "p3"]
+    assert first["next_cursor"]
+
+    second = client.get("/api/papers/", params={"limit": 3, "cursor": first["next_cursor"]}).json()
+    assert [p["id"] for p in second["papers"]] == ["p2", "p1", "p0"]
+    assert second["next_cursor"] is None
+
+
+def test_saved_papers_exactly_limit_has_no_cursor(client, storage):
+    """Test exactly limit saved papers come back without a next_cursor."""
+    for i in range(3):
+        add_paper(storage, f"p{i}", float(i))
+        storage.save_paper("default", f"p{i}")
+
+    page = client.get("/api/papers/saved", params={"limit": 3}).json()
+    assert len(page["saved_papers"]) == 3
+    assert page["next_cursor"] is None
+
+    first = client.get("/api/papers/saved", params={"limit": 2}).json()
+    assert len(first["saved_papers"]) == 2
+    second = client.get("/api/papers/saved", params={"limit": 2, "cursor": first["next_cursor"]}).json()
+    assert len(second["saved_papers"]) == 1
+    assert second["next_cursor"] is None